@@ -6,18 +6,117 @@ Handles loading, validating, and processing configuration files.
 
 import os
 import json
-import re
 import sys
-from typing import Dict, Any, Optional
+import argparse
+import importlib.util
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
-# Try to import jsonschema, but provide fallback validation if not available
+# Check for fastjsonschema and jsonschema without importing them; they are only
+# imported on first validation. fastjsonschema, which compiles the schema to Python
+# code, is preferred. Provide fallback validation if neither is available.
+HAS_FASTJSONSCHEMA = importlib.util.find_spec("fastjsonschema") is not None
+HAS_JSONSCHEMA = importlib.util.find_spec("jsonschema") is not None
+if not HAS_JSONSCHEMA and not HAS_FASTJSONSCHEMA:
+    print("Warning: jsonschema package not found. Using basic validation.", file=sys.stderr)
+jsonschema = None
+fastjsonschema = None
+
+# Use orjson for parsing and serialization when available
 try:
-    import jsonschema
-    HAS_JSONSCHEMA = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_JSONSCHEMA = False
-    print("Warning: jsonschema package not found. Using basic validation.", file=sys.stderr)
+    HAS_ORJSON = False
+
+
+def _json_loads(data) -> Any:
+    """Parse a JSON document from str or bytes."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> str:
+    """Serialize an object to a JSON string, optionally indented by two spaces."""
+    if HAS_ORJSON:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option).decode('utf-8')
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys)
+
+
+def _split_env_template(template: str) -> Tuple[str, ...]:
+    """
+    Split a string into literal text and ${VAR_NAME} references in one scan.
+    
+    Variable names consist of ASCII letters, digits and underscores; anything
+    else between ${ and } is kept as literal text.
+    
+    Args:
+        template: The string to split
+        
+    Returns:
+        Tuple alternating literal text (even indexes) and variable names (odd
+        indexes). A single-element tuple means the string has no references.
+    """
+    segments = []
+    literal_start = 0
+    pos = template.find('${')
+    while pos >= 0:
+        end = template.find('}', pos + 2)
+        if end < 0:
+            break
+        name = template[pos + 2:end]
+        if name and name.isascii() and name.replace('_', 'a').isalnum():
+            segments.append(template[literal_start:pos])
+            segments.append(name)
+            literal_start = pos = end + 1
+        else:
+            pos += 1
+        pos = template.find('${', pos)
+    segments.append(template[literal_start:])
+    return tuple(segments)
+
+
+# Python types accepted for each JSON schema type by the basic validator
+_TYPE_CHECKS = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "number": (int, float),
+    "boolean": bool
+}
+
+# Human-readable type names for validation error messages
+_TYPE_NAMES = {
+    "object": "an object",
+    "array": "an array",
+    "string": "a string",
+    "number": "a number",
+    "boolean": "a boolean"
+}
+
+# Files larger than this are stream-parsed with ijson when MCP_STREAM_CONFIG is set
+STREAM_PARSE_THRESHOLD = 1 << 20  # bytes
+
+# Parsed JSON files keyed by path; entries are invalidated when the file is
+# replaced (inode) or its mtime or size changes
+_FILE_CACHE: Dict[str, Tuple[Tuple[int, int, int, int], Any]] = {}
+
+# Compiled schema plans keyed by schema path, reused while the parsed schema is unchanged
+_SCHEMA_PLAN_CACHE: Dict[str, Tuple[Dict[str, Any], "_SchemaNode"]] = {}
+
+# Root schema keywords that constrain each top-level section on its own, so a
+# merge can re-validate just the sections it changed
+_SECTIONED_SCHEMA_KEYWORDS = frozenset({
+    "$schema", "$id", "$comment", "title", "description", "type", "required",
+    "properties", "patternProperties", "additionalProperties", "definitions", "$defs"
+})
 
 
 class ConfigError(Exception):
@@ -25,6 +124,216 @@ class ConfigError(Exception):
     pass
 
 
+def _copy_json(value: Any) -> Any:
+    """
+    Copy a parsed JSON document so it can be changed without affecting the original.
+    
+    Args:
+        value: A JSON value built from dicts, lists and immutable scalars
+        
+    Returns:
+        A copy sharing only the immutable scalars with the original
+    """
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+def _load_json_file(path) -> Any:
+    """
+    Load and parse a JSON file, reusing the previous parse if the file is unchanged.
+    
+    The returned object is shared between callers and must not be mutated in
+    place; copy it with _copy_json before handing it out.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        The parsed JSON document
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file does not contain valid JSON
+    """
+    path = str(path)
+    stat = os.stat(path)
+    # The inode catches files swapped in by rename, e.g. Kubernetes ConfigMap updates,
+    # even when the replacement keeps the same mtime and size
+    file_key = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    
+    cached = _FILE_CACHE.get(path)
+    if cached is not None and cached[0] == file_key:
+        return cached[1]
+        
+    if os.environ.get('MCP_STREAM_CONFIG') and stat.st_size > STREAM_PARSE_THRESHOLD:
+        data = _stream_json_file(path)
+    else:
+        data = _json_loads(Path(path).read_bytes())
+    _FILE_CACHE[path] = (file_key, data)
+    return data
+
+
+def _stream_json_file(path: str) -> Any:
+    """
+    Parse a large JSON file incrementally with ijson, falling back to a full
+    parse if ijson is not installed.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        The parsed JSON document
+        
+    Raises:
+        json.JSONDecodeError: If the file does not contain valid JSON
+    """
+    try:
+        import ijson
+    except ImportError:
+        print("Warning: ijson package not found. Parsing configuration in full.", file=sys.stderr)
+        return _json_loads(Path(path).read_bytes())
+            
+    with open(path, 'rb') as f:
+        try:
+            return next(ijson.items(f, '', use_float=True))
+        except (ijson.JSONError, StopIteration) as e:
+            raise json.JSONDecodeError(f"Streaming parse failed: {str(e)}", path, 0)
+
+
+def _import_jsonschema():
+    """Import jsonschema on first use, keeping it off the startup path."""
+    global jsonschema
+    if jsonschema is None:
+        import jsonschema
+    return jsonschema
+
+
+def _import_fastjsonschema():
+    """Import fastjsonschema on first use, keeping it off the startup path."""
+    global fastjsonschema
+    if fastjsonschema is None:
+        import fastjsonschema
+    return fastjsonschema
+
+
+@lru_cache(maxsize=32)
+def _get_compiled_validator(schema_json: str, root_required: bool = True):
+    """
+    Compile a schema into a fastjsonschema validation function, shared across
+    handler instances.
+    
+    Args:
+        schema_json: Canonical JSON serialization of the schema (used as cache key)
+        root_required: Whether to enforce the schema's top-level required properties
+        
+    Returns:
+        A function that validates an instance and raises on the first error
+        
+    Raises:
+        fastjsonschema.JsonSchemaDefinitionException: If the schema itself is invalid
+    """
+    schema = _json_loads(schema_json)
+    if not root_required:
+        schema.pop("required", None)
+    # Defaults are not filled in, so validation never mutates the (shared) config.
+    # Formats are not checked, matching the jsonschema validator.
+    return _import_fastjsonschema().compile(schema, use_default=False, use_formats=False)
+
+
+@lru_cache(maxsize=32)
+def _get_validator(schema_json: str):
+    """
+    Build a jsonschema validator for a schema, shared across handler instances.
+    
+    Args:
+        schema_json: Canonical JSON serialization of the schema (used as cache key)
+        
+    Returns:
+        A validator instance for the schema
+        
+    Raises:
+        jsonschema.exceptions.SchemaError: If the schema itself is invalid
+    """
+    schema = _json_loads(schema_json)
+    validator_cls = _import_jsonschema().validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+class _SchemaNode:
+    """
+    Pre-digested view of an object schema used by the basic validator and
+    default application, so the schema dict is interpreted only once.
+    """
+    
+    __slots__ = (
+        "required", "properties", "property_names", "additional", "has_defaults",
+        "defaults", "default_children"
+    )
+    
+    def __init__(self, schema: Dict[str, Any]):
+        """
+        Compile a schema into a node tree.
+        
+        Args:
+            schema: The (sub)schema describing an object
+        """
+        required = schema.get("required")
+        self.required = tuple(required) if isinstance(required, list) else ()
+        
+        # Each entry: (name, expected type, default flag, default, nested node, items node)
+        properties = schema.get("properties")
+        self.properties = ()
+        self.property_names = frozenset()
+        if isinstance(properties, dict):
+            entries = []
+            for prop_name, prop_schema in properties.items():
+                nested = _SchemaNode(prop_schema) if "properties" in prop_schema else None
+                items_schema = prop_schema.get("items")
+                items = _SchemaNode(items_schema) if isinstance(items_schema, dict) else None
+                entries.append((
+                    prop_name,
+                    prop_schema.get("type"),
+                    "default" in prop_schema,
+                    prop_schema.get("default"),
+                    nested,
+                    items
+                ))
+            self.properties = tuple(entries)
+            self.property_names = frozenset(properties)
+            
+        additional = schema.get("additionalProperties")
+        self.additional = _SchemaNode(additional) if isinstance(additional, dict) else None
+        
+        # Defaults to fill in at this node and the declared children that have defaults of their own
+        self.defaults = tuple((entry[0], entry[3]) for entry in self.properties if entry[2])
+        self.default_children = tuple(
+            (entry[0], entry[4]) for entry in self.properties
+            if entry[4] is not None and entry[4].has_defaults
+        )
+        
+        # Whether applying defaults could change anything at or below this node
+        self.has_defaults = bool(
+            self.defaults or self.default_children
+            or (self.additional is not None and self.additional.has_defaults)
+        )
+        
+    def without_required(self) -> "_SchemaNode":
+        """
+        Get a copy of this node that does not enforce its own required properties.
+        
+        Returns:
+            A shallow copy of the node with an empty required list
+        """
+        node = _SchemaNode.__new__(_SchemaNode)
+        for slot in _SchemaNode.__slots__:
+            setattr(node, slot, getattr(self, slot))
+        node.required = ()
+        return node
+
 class ConfigHandler:
     """
     Handles loading and validating configuration for MCP Docker setup.
@@ -42,6 +351,29 @@ class ConfigHandler:
         self.schema_path = os.path.join(os.path.dirname(__file__), 'config.schema.json')
         self.config = None
         self.schema = None
+        self._validator = None
+        self._schema_key = None
+        self._schema_plan = None
+        self._env_plan = None
+        self._env_plan_names = ()
+        self._env_plan_key = None  # serialized configuration the plan was built from
+        self._validated_sections = None  # serialized top-level sections of the last valid configuration
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any], config_path: Optional[str] = None) -> "ConfigHandler":
+        """
+        Create a handler for an already parsed configuration, without reading a file.
+        
+        Args:
+            config: The configuration to handle
+            config_path: Path used by write_config. If None, resolved as in __init__
+            
+        Returns:
+            A handler with the configuration loaded
+        """
+        handler = cls(config_path)
+        handler.config = config
+        return handler
 
     def load_schema(self) -> Dict[str, Any]:
         """
@@ -54,20 +386,66 @@ class ConfigHandler:
             ConfigError: If the schema file cannot be loaded or is invalid
         """
         try:
-            if not os.path.exists(self.schema_path):
+            try:
+                schema = _load_json_file(self.schema_path)
+            except FileNotFoundError:
                 # Try to find the schema in the current directory
                 self.schema_path = 'config.schema.json'
-                
-            with open(self.schema_path, 'r') as f:
-                self.schema = json.load(f)
-                return self.schema
+                schema = _load_json_file(self.schema_path)
         except (json.JSONDecodeError, FileNotFoundError) as e:
             raise ConfigError(f"Failed to load schema: {str(e)}")
 
+        # The file cache returns the same dict for an unchanged schema, so its plan can be shared
+        cached = _SCHEMA_PLAN_CACHE.get(self.schema_path)
+        if cached is not None and cached[0] is schema:
+            self._schema_plan = cached[1]
+        else:
+            self._schema_plan = _SchemaNode(schema)
+            _SCHEMA_PLAN_CACHE[self.schema_path] = (schema, self._schema_plan)
+        self.schema = _copy_json(schema)
+        self._validator = None
+        self._schema_key = None
+        return self.schema
+
+    def _get_schema_validator(self):
+        """
+        Get the compiled jsonschema validator, building it on first use.
+        
+        Returns:
+            A validator instance for the loaded schema
+            
+        Raises:
+            ConfigError: If the schema itself is invalid
+        """
+        if self._validator is None:
+            # Compile the validator once so repeated validations skip check_schema.
+            # No format_checker is attached, so "format" keywords are not evaluated.
+            _import_jsonschema()
+            try:
+                self._validator = _get_validator(self._get_schema_key())
+            except jsonschema.exceptions.SchemaError as e:
+                raise ConfigError(f"Invalid schema: {str(e)}")
+                
+        return self._validator
+        
+    def _get_schema_key(self) -> str:
+        """
+        Get the canonical serialization of the loaded schema used to cache validators.
+        
+        Returns:
+            The schema as JSON with sorted keys
+        """
+        if self._schema_key is None:
+            self._schema_key = _json_dumps(self.schema, sort_keys=True)
+        return self._schema_key
+
     def load_config(self) -> Dict[str, Any]:
         """
         Load the configuration from the specified file.
         
+        Repeated loads of an unchanged file reuse the previously parsed result
+        and return a fresh copy of it.
+        
         Returns:
             The loaded configuration as a dictionary
             
@@ -77,18 +455,16 @@ class ConfigHandler:
         try:
             config_path = Path(self.config_path)
             
-            if not config_path.exists():
-                # Check if example config exists and copy it
+            try:
+                self.config = _copy_json(_load_json_file(config_path))
+            except FileNotFoundError:
+                # Fall back to the example config if one exists
                 example_path = Path(str(config_path).replace('.json', '.example.json'))
-                if example_path.exists():
-                    print(f"Configuration file {config_path} not found. Using example configuration.")
-                    with open(example_path, 'r') as f:
-                        self.config = json.load(f)
-                else:
+                try:
+                    self.config = _copy_json(_load_json_file(example_path))
+                except FileNotFoundError:
                     raise ConfigError(f"Configuration file {config_path} not found and no example configuration available.")
-            else:
-                with open(config_path, 'r') as f:
-                    self.config = json.load(f)
+                print(f"Configuration file {config_path} not found. Using example configuration.")
             
             return self.config
         except json.JSONDecodeError as e:
@@ -119,26 +495,84 @@ class ConfigHandler:
         if config is None:
             raise ConfigError("No configuration loaded to validate")
             
-        if self.schema is None:
+        self._check_schema(config)
+        
+        # Remember each valid section so merge_config can re-check only what changed
+        if isinstance(config, dict):
+            self._validated_sections = {key: _json_dumps(value) for key, value in config.items()}
+        return True
+    
+    def _check_schema(self, instance: Dict[str, Any], root_required: bool = True) -> None:
+        """
+        Check an instance against the schema using the best available validator.
+        
+        Args:
+            instance: The configuration (or some of its top-level sections) to check
+            root_required: Whether to enforce the schema's top-level required properties
+            
+        Raises:
+            ConfigError: If the instance is invalid
+        """
+        if self._schema_plan is None:
             self.load_schema()
         
-        if HAS_JSONSCHEMA:
+        if HAS_FASTJSONSCHEMA:
+            _import_fastjsonschema()
+            try:
+                validate = _get_compiled_validator(self._get_schema_key(), root_required)
+            except fastjsonschema.JsonSchemaDefinitionException as e:
+                raise ConfigError(f"Invalid schema: {str(e)}")
+            
             try:
-                jsonschema.validate(instance=config, schema=self.schema)
-                return True
-            except jsonschema.exceptions.ValidationError as e:
-                raise ConfigError(f"Configuration validation failed: {str(e)}")
+                validate(instance)
+                return
+            except fastjsonschema.JsonSchemaValueException as e:
+                # The compiled validator stops at the first error, so let
+                # jsonschema report every error when it is installed
+                if not HAS_JSONSCHEMA:
+                    raise ConfigError(f"Configuration validation failed: {e.message}")
+        
+        if HAS_JSONSCHEMA:
+            validator = self._get_schema_validator()
+            
+            # Only build error objects once we know the configuration is invalid
+            if validator.is_valid(instance):
+                return
+                
+            messages = []
+            for error in validator.iter_errors(instance):
+                if not root_required and error.validator == "required" and not error.absolute_path:
+                    continue
+                location = ".".join(str(part) for part in error.absolute_path) or "root"
+                messages.append(f"{location}: {error.message}")
+            if messages:
+                raise ConfigError(f"Configuration validation failed: {'; '.join(messages)}")
         else:
             # Basic validation when jsonschema is not available
-            return self._basic_validate(config, self.schema)
+            schema_plan = self._schema_plan if root_required else self._schema_plan.without_required()
+            self._basic_validate(instance, schema_plan)
+    
+    def _schema_is_sectioned(self) -> bool:
+        """
+        Check whether the schema constrains each top-level section independently.
+        
+        Returns:
+            True if the root schema only uses keywords that apply per section
+        """
+        if self._schema_plan is None:
+            self.load_schema()
+        return self.schema.keys() <= _SECTIONED_SCHEMA_KEYWORDS
     
-    def _basic_validate(self, instance: Dict[str, Any], schema: Dict[str, Any], path: str = "") -> bool:
+    def _basic_validate(self, instance: Dict[str, Any], schema: _SchemaNode, path: str = "") -> bool:
         """
         Basic validation implementation when jsonschema is not available.
         
+        The whole configuration is checked and every problem found is reported
+        together in a single ConfigError, one per line.
+        
         Args:
             instance: The configuration instance to validate
-            schema: The schema to validate against
+            schema: The compiled schema to validate against
             path: Current path in the configuration (for error messages)
             
         Returns:
@@ -147,64 +581,76 @@ class ConfigHandler:
         Raises:
             ConfigError: If the configuration is invalid
         """
-        # Check required properties
-        if "required" in schema and isinstance(schema["required"], list):
-            for prop in schema["required"]:
+        # Walk the instance with an explicit stack instead of recursing per node
+        stack = [(instance, schema, path)]
+        errors = []
+        
+        while stack:
+            instance, node, path = stack.pop()
+            children = []
+            
+            # Check required properties
+            for prop in node.required:
                 if prop not in instance:
-                    raise ConfigError(f"Missing required property '{prop}' at {path or 'root'}")
-        
-        # Check property types and validate nested objects
-        if "properties" in schema and isinstance(schema["properties"], dict):
-            for prop_name, prop_schema in schema["properties"].items():
-                if prop_name in instance:
-                    prop_path = f"{path}.{prop_name}" if path else prop_name
-                    prop_value = instance[prop_name]
-                    
-                    # Check type
-                    if "type" in prop_schema:
-                        expected_type = prop_schema["type"]
-                        if expected_type == "object" and not isinstance(prop_value, dict):
-                            raise ConfigError(f"Property '{prop_path}' must be an object")
-                        elif expected_type == "array" and not isinstance(prop_value, list):
-                            raise ConfigError(f"Property '{prop_path}' must be an array")
-                        elif expected_type == "string" and not isinstance(prop_value, str):
-                            raise ConfigError(f"Property '{prop_path}' must be a string")
-                        elif expected_type == "number" and not isinstance(prop_value, (int, float)):
-                            raise ConfigError(f"Property '{prop_path}' must be a number")
-                        elif expected_type == "boolean" and not isinstance(prop_value, bool):
-                            raise ConfigError(f"Property '{prop_path}' must be a boolean")
-                    
-                    # Validate nested objects
-                    if isinstance(prop_value, dict) and "properties" in prop_schema:
-                        self._basic_validate(prop_value, prop_schema, prop_path)
+                    errors.append(f"Missing required property '{prop}' at {path or 'root'}")
+            
+            # Check property types and queue nested objects
+            for prop_name, expected_type, _, _, nested, items in node.properties:
+                if prop_name not in instance:
+                    continue
                     
-                    # Validate array items
-                    if isinstance(prop_value, list) and "items" in prop_schema:
-                        for i, item in enumerate(prop_value):
-                            item_path = f"{prop_path}[{i}]"
-                            if isinstance(item, dict) and isinstance(prop_schema["items"], dict):
-                                self._basic_validate(item, prop_schema["items"], item_path)
-        
-        # Check additional properties
-        if "additionalProperties" in schema and isinstance(instance, dict):
-            if isinstance(schema["additionalProperties"], dict):
+                prop_path = f"{path}.{prop_name}" if path else prop_name
+                prop_value = instance[prop_name]
+                
+                # Check type (bool is an int subclass, but not a JSON number)
+                expected = _TYPE_CHECKS.get(expected_type)
+                if expected is not None and (
+                    not isinstance(prop_value, expected)
+                    or (expected_type == "number" and isinstance(prop_value, bool))
+                ):
+                    errors.append(f"Property '{prop_path}' must be {_TYPE_NAMES[expected_type]}")
+                    continue
+                
+                # Validate nested objects
+                if nested is not None and isinstance(prop_value, dict):
+                    children.append((prop_value, nested, prop_path))
+                
+                # Validate array items
+                if items is not None and isinstance(prop_value, list):
+                    for i, item in enumerate(prop_value):
+                        if isinstance(item, dict):
+                            children.append((item, items, f"{prop_path}[{i}]"))
+            
+            # Check additional properties
+            additional = node.additional
+            if additional is not None and isinstance(instance, dict):
                 for prop_name, prop_value in instance.items():
-                    if "properties" not in schema or prop_name not in schema["properties"]:
+                    if prop_name not in node.property_names and isinstance(prop_value, dict):
                         prop_path = f"{path}.{prop_name}" if path else prop_name
-                        if isinstance(prop_value, dict):
-                            self._basic_validate(prop_value, schema["additionalProperties"], prop_path)
+                        children.append((prop_value, additional, prop_path))
+            
+            # Reverse so nodes are visited in the same order as a recursive walk
+            stack.extend(reversed(children))
         
+        if errors:
+            raise ConfigError("\n".join(errors))
+            
         return True
 
     def substitute_env_vars(self, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Substitute environment variables in the configuration.
         
+        The locations of ${VAR} references are discovered once per configuration
+        content and reused, so repeated calls only touch the values that need
+        substituting.
+        
         Args:
             config: The configuration to process. If None, uses the previously loaded config.
             
         Returns:
-            The processed configuration with environment variables substituted
+            A copy of the configuration with environment variables substituted,
+            sharing nothing mutable with the input
             
         Raises:
             ConfigError: If required environment variables are missing
@@ -214,39 +660,90 @@ class ConfigHandler:
             
         if config is None:
             raise ConfigError("No configuration loaded for environment variable substitution")
-            
-        # Create a deep copy to avoid modifying the original
-        processed_config = json.loads(json.dumps(config))
-        
-        # Process environment variables in the configuration
-        env_var_pattern = re.compile(r'\${([A-Za-z0-9_]+)}')
+
+        self._ensure_env_plan(config)
+        processed_config = _copy_json(config)
+        if not self._env_plan:
+            return processed_config
+
+        # Process environment variables in the configuration against a single
+        # snapshot of the environment, so every reference sees consistent values.
+        # Only the referenced names are read rather than decoding the whole environment
+        environ_get = os.environ.get
+        env_snapshot = {name: environ_get(name) for name in self._env_plan_names}
         missing_vars = set()
         
-        def process_value(value):
-            if isinstance(value, str):
-                matches = env_var_pattern.findall(value)
-                result = value
-                for var_name in matches:
-                    env_value = os.environ.get(var_name)
-                    if env_value is None:
-                        missing_vars.add(var_name)
-                    else:
-                        result = result.replace(f"${{{var_name}}}", env_value)
-                return result
-            elif isinstance(value, dict):
-                return {k: process_value(v) for k, v in value.items()}
-            elif isinstance(value, list):
-                return [process_value(item) for item in value]
-            else:
-                return value
-        
-        processed_config = process_value(processed_config)
+        for path, segments in self._env_plan:
+            parent = processed_config
+            for key in path[:-1]:
+                parent = parent[key]
+            
+            # Fill in the variable names at the odd indexes of the split template
+            parts = list(segments)
+            for i in range(1, len(parts), 2):
+                var_name = parts[i]
+                env_value = env_snapshot.get(var_name)
+                if env_value is None:
+                    missing_vars.add(var_name)
+                    env_value = f"${{{var_name}}}"
+                parts[i] = env_value
+            parent[path[-1]] = "".join(parts)
         
         if missing_vars:
             raise ConfigError(f"Missing required environment variables: {', '.join(missing_vars)}")
             
         return processed_config
 
+    def _ensure_env_plan(self, config: Dict[str, Any]):
+        """
+        Build the substitution plan for a configuration unless it is already current.
+        
+        The plan is keyed on the serialized configuration rather than the object,
+        so changes made to the same dictionary in place are picked up.
+        
+        Args:
+            config: The configuration to plan substitutions for
+        """
+        serialized = _json_dumps(config)
+        if serialized != self._env_plan_key:
+            self._env_plan = self._build_env_plan(config, serialized)
+            self._env_plan_names = tuple({name for _, segments in self._env_plan for name in segments[1::2]})
+            self._env_plan_key = serialized
+
+    def _build_env_plan(self, config: Dict[str, Any], serialized: str) -> Tuple[Tuple[tuple, str], ...]:
+        """
+        Find every string value in the configuration that references an env var.
+        
+        Args:
+            config: The configuration to scan
+            serialized: The configuration as JSON, used to skip configurations without references
+            
+        Returns:
+            Tuple of (path, segments) pairs, where path is the sequence of dict keys
+            and list indexes leading to the string and segments is the string as
+            split by _split_env_template
+        """
+        # Skip the walk entirely when nothing references an env var
+        if '${' not in serialized:
+            return ()
+            
+        plan = []
+        stack = [((), config)]
+        
+        while stack:
+            path, value = stack.pop()
+            if isinstance(value, str):
+                if '${' in value:
+                    segments = _split_env_template(value)
+                    if len(segments) > 1:
+                        plan.append((path, segments))
+            elif isinstance(value, dict):
+                stack.extend((path + (key,), item) for key, item in reversed(value.items()))
+            elif isinstance(value, list):
+                stack.extend((path + (index,), item) for index, item in reversed(list(enumerate(value))))
+                
+        return tuple(plan)
+
     def get_config(self) -> Dict[str, Any]:
         """
         Get the fully processed configuration.
@@ -281,11 +778,20 @@ class ConfigHandler:
             
         # Deep merge the configurations
         merged_config = self._deep_merge(self.config, additional_config)
-        
-        # Validate the merged configuration
-        old_config = self.config
         self.config = merged_config
-        self.validate_config()
+        
+        # Re-check only the top-level sections whose content differs from the last
+        # validated configuration. Merging never removes keys, so the root's
+        # required properties still hold; anything else gets full validation.
+        validated = self._validated_sections
+        if validated is None or not self._schema_is_sectioned() or not validated.keys() <= merged_config.keys():
+            self.validate_config()
+        else:
+            sections = {key: _json_dumps(value) for key, value in merged_config.items()}
+            changed = {key: merged_config[key] for key, serialized in sections.items() if validated.get(key) != serialized}
+            if changed:
+                self._check_schema(changed, root_required=False)
+            self._validated_sections = sections
         
         return self.config
     
@@ -298,16 +804,27 @@ class ConfigHandler:
             override: Dictionary to override base values
             
         Returns:
-            Merged dictionary
+            Merged dictionary. Subtrees without overrides are shared with base.
         """
+        if not override:
+            return base
+            
         result = base.copy()
-        
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
-                
+        stack = [(result, override)]
+        
+        # Each queued destination is a fresh copy, so overrides can be applied in place
+        while stack:
+            dest, source = stack.pop()
+            for key, value in source.items():
+                base_value = dest.get(key)
+                if isinstance(base_value, dict) and isinstance(value, dict):
+                    if value:
+                        child = base_value.copy()
+                        dest[key] = child
+                        stack.append((child, value))
+                else:
+                    dest[key] = value
+                    
         return result
     
     def write_config(self, config_path: Optional[str] = None) -> None:
@@ -326,8 +843,8 @@ class ConfigHandler:
         path = config_path or self.config_path
         
         try:
-            with open(path, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(_json_dumps(self.config, indent=True))
         except PermissionError:
             raise ConfigError(f"Permission denied when writing configuration file: {path}")
         except Exception as e:
@@ -346,43 +863,56 @@ class ConfigHandler:
         if self.config is None:
             self.load_config()
             
-        if self.schema is None:
+        if self._schema_plan is None:
             self.load_schema()
             
         # Apply defaults from the schema
-        self.config = self._apply_schema_defaults(self.config, self.schema)
+        self.config = self._apply_schema_defaults(self.config, self._schema_plan)
         
         return self.config
     
-    def _apply_schema_defaults(self, config: Dict[str, Any], schema: Dict[str, Any]) -> Dict[str, Any]:
+    def _apply_schema_defaults(self, config: Dict[str, Any], schema: _SchemaNode) -> Dict[str, Any]:
         """
         Apply default values from the schema to the configuration.
         
         Args:
             config: Configuration to apply defaults to
-            schema: Schema with default values
+            schema: Compiled schema with default values
             
         Returns:
             Configuration with defaults applied
         """
+        if not schema.has_defaults:
+            return config
+            
         result = config.copy()
+        stack = [(result, schema)]
         
-        # Apply top-level defaults
-        if "properties" in schema:
-            for prop_name, prop_schema in schema["properties"].items():
-                if prop_name not in result and "default" in prop_schema:
-                    result[prop_name] = prop_schema["default"]
+        # Each queued node is a fresh copy, so defaults can be filled in place
+        while stack:
+            node, schema_node = stack.pop()
+            
+            # Apply defaults for declared properties
+            for prop_name, default in schema_node.defaults:
+                if prop_name not in node:
+                    node[prop_name] = _copy_json(default)
                     
-                # Apply defaults to nested objects
-                if prop_name in result and "properties" in prop_schema and isinstance(result[prop_name], dict):
-                    result[prop_name] = self._apply_schema_defaults(result[prop_name], prop_schema)
+            # Apply defaults to nested objects, leaving default-free subtrees shared
+            for prop_name, nested in schema_node.default_children:
+                value = node.get(prop_name)
+                if isinstance(value, dict):
+                    child = value.copy()
+                    node[prop_name] = child
+                    stack.append((child, nested))
                     
-        # Apply defaults to additional properties
-        if "additionalProperties" in schema and isinstance(schema["additionalProperties"], dict):
-            for prop_name, prop_value in result.items():
-                if "properties" not in schema or prop_name not in schema["properties"]:
-                    if isinstance(prop_value, dict):
-                        result[prop_name] = self._apply_schema_defaults(prop_value, schema["additionalProperties"])
+            # Apply defaults to additional properties
+            additional = schema_node.additional
+            if additional is not None and additional.has_defaults:
+                for prop_name, prop_value in node.items():
+                    if prop_name not in schema_node.property_names and isinstance(prop_value, dict):
+                        child = prop_value.copy()
+                        node[prop_name] = child
+                        stack.append((child, additional))
                         
         return result
 
@@ -410,54 +940,31 @@ def load_and_validate_config(config_path: Optional[str] = None) -> Dict[str, Any
         sys.exit(1)
 
 
-def print_usage():
-    """Print usage information."""
-    print("Usage: config_handler.py [OPTIONS] [CONFIG_PATH]")
-    print("\nOptions:")
-    print("  --validate       Validate the configuration")
-    print("  --apply-defaults Apply default values from the schema")
-    print("  --output PATH    Write the processed configuration to PATH")
-    print("  --merge PATH     Merge with additional configuration from PATH")
-    print("  --help           Show this help message and exit")
-    print("\nExamples:")
-    print("  config_handler.py config.json")
-    print("  config_handler.py --validate config.json")
-    print("  config_handler.py --apply-defaults --output config_with_defaults.json config.json")
-    print("  config_handler.py --merge override.json --output merged.json config.json")
-
-
-if __name__ == "__main__":
-    # Parse command line arguments
-    args = sys.argv[1:]
-    config_path = None
-    output_path = None
-    merge_path = None
-    validate_only = False
-    apply_defaults = False
+def main():
+    """Main entry point for the configuration handler CLI."""
+    parser = argparse.ArgumentParser(
+        description="Load, validate and process MCP Docker configuration files",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="\n".join([
+            "Examples:",
+            "  config_handler.py config.json",
+            "  config_handler.py --validate config.json",
+            "  config_handler.py --apply-defaults --output config_with_defaults.json config.json",
+            "  config_handler.py --merge override.json --output merged.json config.json"
+        ])
+    )
+    parser.add_argument("config_path", nargs="?", default=None, help="Path to configuration file")
+    parser.add_argument("--validate", action="store_true", help="Validate the configuration")
+    parser.add_argument("--apply-defaults", action="store_true", help="Apply default values from the schema")
+    parser.add_argument("--output", metavar="PATH", help="Write the processed configuration to PATH")
+    parser.add_argument("--merge", metavar="PATH", help="Merge with additional configuration from PATH")
+    args = parser.parse_args()
     
-    i = 0
-    while i < len(args):
-        arg = args[i]
-        if arg == "--help":
-            print_usage()
-            sys.exit(0)
-        elif arg == "--validate":
-            validate_only = True
-        elif arg == "--apply-defaults":
-            apply_defaults = True
-        elif arg == "--output" and i + 1 < len(args):
-            output_path = args[i + 1]
-            i += 1
-        elif arg == "--merge" and i + 1 < len(args):
-            merge_path = args[i + 1]
-            i += 1
-        elif not arg.startswith("--") and config_path is None:
-            config_path = arg
-        else:
-            print(f"Unknown option: {arg}", file=sys.stderr)
-            print_usage()
-            sys.exit(1)
-        i += 1
+    config_path = args.config_path
+    output_path = args.output
+    merge_path = args.merge
+    validate_only = args.validate
+    apply_defaults = args.apply_defaults
     
     try:
         # Create the configuration handler
@@ -476,8 +983,7 @@ if __name__ == "__main__":
         # Merge with additional configuration if requested
         if merge_path:
             try:
-                with open(merge_path, 'r') as f:
-                    additional_config = json.load(f)
+                additional_config = _json_loads(Path(merge_path).read_bytes())
                 handler.merge_config(additional_config)
             except json.JSONDecodeError as e:
                 print(f"Error parsing merge configuration: {str(e)}", file=sys.stderr)
@@ -496,7 +1002,7 @@ if __name__ == "__main__":
         
         # Print the configuration if not validate-only
         if not validate_only:
-            print(json.dumps(config, indent=2))
+            print(_json_dumps(config, indent=True))
         else:
             print("Configuration is valid")
             
@@ -505,4 +1011,8 @@ if __name__ == "__main__":
         sys.exit(1)
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
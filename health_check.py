@@ -22,23 +22,77 @@ import sys
 import json
 import time
 import signal
+import socket
 import logging
 import argparse
 import subprocess
 import http.server
 import socketserver
 import threading
+import struct
+import queue
+import selectors
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from typing import Dict, Any, List, Tuple, Optional
 from urllib.request import urlopen, Request
+from urllib.parse import urlsplit, quote
 from urllib.error import URLError, HTTPError
 from pathlib import Path
 
+# Use a pooled keep-alive HTTP client for server probes when urllib3 is available
+try:
+    import urllib3
+    HAS_URLLIB3 = True
+    PROBE_ERRORS = (URLError, HTTPError, urllib3.exceptions.HTTPError)
+except ImportError:
+    HAS_URLLIB3 = False
+    PROBE_ERRORS = (URLError, HTTPError)
+
+# Use orjson for parsing and serialization when available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Compact stdlib encoder used when orjson is unavailable
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def _json_loads(data) -> Any:
+    """Parse a JSON document from str or bytes."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_json_file(path: str) -> Any:
+    """
+    Read and parse a JSON file in a single read.
+    
+    The file is read into memory rather than mapped, so a writer truncating
+    it in place cannot fault the reader.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        The parsed JSON document
+    """
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return _COMPACT_ENCODER.encode(obj).encode('utf-8')
+
 # Configure structured logging
 LOG_FORMAT = os.environ.get("LOG_FORMAT", "json").lower()
 
 if LOG_FORMAT == "json":
-    import json
-    
     class JsonFormatter(logging.Formatter):
         """JSON formatter for structured logging."""
         
@@ -59,7 +113,7 @@ if LOG_FORMAT == "json":
             if record.exc_info:
                 log_record["exception"] = self.formatException(record.exc_info)
                 
-            return json.dumps(log_record)
+            return _json_dumps(log_record).decode('utf-8')
     
     formatter = JsonFormatter()
 else:
@@ -82,6 +136,213 @@ DEFAULT_CONFIG_PATH = os.environ.get("CONFIG_PATH", "/app/config.json")
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 8080
 DEFAULT_CHECK_INTERVAL = 30  # seconds
+RESOURCE_CACHE_TTL = 5  # seconds to reuse system resource measurements
+HTTP_WORKER_THREADS = 8  # threads serving health check HTTP requests
+HTTP_QUEUE_SIZE = 64  # connections waiting for a worker before new ones get a 503
+BUSY_LINGER_TIMEOUT = 0.1  # seconds to drain a rejected request before closing it
+REQUEST_READ_TIMEOUT = 5  # seconds a client may take to send its request before the worker drops it
+STREAM_CHUNK_SIZE = 64 * 1024  # bytes buffered per write when streaming JSON responses
+DISK_USAGE_PATH = "/app"  # filesystem reported as disk_percent on Linux
+
+# Header of a process status frame sent to forked workers: (body length, monotonic publish time)
+_STATUS_FRAME = struct.Struct("!Id")
+
+# Pre-encoded HTTP response pieces
+_STATUS_LINES = {
+    200: b"HTTP/1.1 200 OK\r\n",
+    503: b"HTTP/1.1 503 Service Unavailable\r\n"
+}
+_CONNECTION_CLOSE = b"Connection: close\r\n"  # one request per connection, so idle clients never hold a worker
+_JSON_CONTENT_TYPE = b"Content-Type: application/json\r\n"
+_TEXT_CONTENT_TYPE = b"Content-Type: text/plain\r\n"
+
+
+def _build_response(status: int, content_type: bytes, body: bytes) -> bytes:
+    """Build a complete HTTP response from its status, content type and body."""
+    return b"".join((
+        _STATUS_LINES[status],
+        _CONNECTION_CLOSE,
+        content_type,
+        b"Content-Length: %d\r\n\r\n" % len(body),
+        body
+    ))
+
+
+# Constant responses for the liveness and readiness probes
+_LIVENESS_RESPONSE = _build_response(200, _JSON_CONTENT_TYPE, b'{"status":"alive"}')
+_READY_RESPONSE = _build_response(200, _JSON_CONTENT_TYPE, b'{"status":"ready"}')
+_NOT_READY_RESPONSE = _build_response(503, _JSON_CONTENT_TYPE, b'{"status":"not ready"}')
+_BUSY_RESPONSE = _build_response(503, _JSON_CONTENT_TYPE, b'{"status":"busy"}')
+
+# Static Prometheus HELP/TYPE blocks, encoded once at import time
+_RESOURCE_METRICS = (
+    ("cpu_percent", b"# HELP mcpo_cpu_percent CPU usage percentage\n"
+                    b"# TYPE mcpo_cpu_percent gauge\n"
+                    b"mcpo_cpu_percent "),
+    ("memory_percent", b"# HELP mcpo_memory_percent Memory usage percentage\n"
+                       b"# TYPE mcpo_memory_percent gauge\n"
+                       b"mcpo_memory_percent "),
+    ("process_count", b"# HELP mcpo_process_count Number of processes\n"
+                      b"# TYPE mcpo_process_count gauge\n"
+                      b"mcpo_process_count "),
+)
+_UPTIME_METRIC = (b"# HELP mcpo_uptime_seconds Container uptime in seconds\n"
+                  b"# TYPE mcpo_uptime_seconds counter\n"
+                  b"mcpo_uptime_seconds ")
+_SERVER_METRIC_HEADERS = (b"# HELP mcpo_server_status MCP server status (1=healthy, 0=unhealthy)\n"
+                          b"# TYPE mcpo_server_status gauge\n")
+_PROCESS_METRIC_HEADERS = (b"# HELP mcpo_process_running Process running status (1=running, 0=stopped)\n"
+                           b"# TYPE mcpo_process_running gauge\n"
+                           b"# HELP mcpo_process_restart_count Process restart count\n"
+                           b"# TYPE mcpo_process_restart_count counter\n"
+                           b"# HELP mcpo_process_uptime_seconds Process uptime in seconds\n"
+                           b"# TYPE mcpo_process_uptime_seconds counter\n")
+
+
+class PooledTCPServer(socketserver.TCPServer):
+    """
+    TCP server that handles connections on a fixed pool of worker threads
+    fed from a bounded queue; connections arriving while the queue is full
+    are answered with a 503 instead of waiting without bound. Rejected
+    connections are drained and closed by a reaper thread so that shedding
+    load never blocks the accept loop.
+    """
+    
+    def __init__(self, server_address, handler_class, max_workers: int = HTTP_WORKER_THREADS,
+                 queue_size: int = HTTP_QUEUE_SIZE, reuse_port: bool = False):
+        """
+        Initialize the pooled TCP server.
+        
+        Args:
+            server_address: (host, port) tuple to bind to
+            handler_class: Request handler class
+            max_workers: Number of worker threads
+            queue_size: Number of connections that may wait for a worker
+            reuse_port: Set SO_REUSEPORT so several processes can share the port
+        """
+        self.reuse_port = reuse_port
+        self._requests = queue.Queue(maxsize=max(1, queue_size))
+        self._rejected = queue.SimpleQueue()  # (linger deadline, socket) of answered 503s
+        self._workers = [
+            threading.Thread(target=self._worker, name=f"health-http-{index}", daemon=True)
+            for index in range(max_workers)
+        ]
+        self._reaper = threading.Thread(target=self._reap_rejected, name="health-http-reaper", daemon=True)
+        super().__init__(server_address, handler_class)
+        for worker in self._workers:
+            worker.start()
+        self._reaper.start()
+        
+    def server_bind(self):
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+        
+    def process_request(self, request, client_address):
+        try:
+            self._requests.put_nowait((request, client_address))
+        except queue.Full:
+            # Shed load rather than queue connections without bound
+            self._reject_request(request)
+            
+    def _reject_request(self, request):
+        """
+        Answer a connection with a 503 and hand it to the reaper.
+        
+        Runs on the accept thread, so it never blocks: the response fits in
+        the socket send buffer and the reaper drains the client's request until
+        it closes its side (bounded by BUSY_LINGER_TIMEOUT), so that closing
+        does not reset the connection before the client has read the response.
+        
+        Args:
+            request: Client socket
+        """
+        try:
+            request.setblocking(False)
+            request.send(_BUSY_RESPONSE)
+            request.shutdown(socket.SHUT_WR)
+        except OSError:
+            self.close_request(request)
+            return
+        self._rejected.put((time.monotonic() + BUSY_LINGER_TIMEOUT, request))
+        
+    def _reap_rejected(self):
+        """
+        Drain rejected connections and close them once the client closes or the linger timeout passes.
+        """
+        selector = selectors.DefaultSelector()
+        deadlines = {}
+        
+        def close(sock):
+            selector.unregister(sock)
+            del deadlines[sock]
+            self.close_request(sock)
+            
+        while True:
+            # Block for the next rejected connection when none is lingering
+            items = [] if deadlines else [self._rejected.get()]
+            while True:
+                try:
+                    items.append(self._rejected.get_nowait())
+                except queue.Empty:
+                    break
+            for item in items:
+                if item is None:
+                    for sock in list(deadlines):
+                        close(sock)
+                    return
+                deadline, sock = item
+                selector.register(sock, selectors.EVENT_READ)
+                deadlines[sock] = deadline
+                
+            # Wait for client data or the earliest deadline, checking for new connections regularly
+            timeout = min(min(deadlines.values()) - time.monotonic(), BUSY_LINGER_TIMEOUT / 4)
+            for key, _ in selector.select(max(0, timeout)):
+                sock = key.fileobj
+                try:
+                    if sock.recv(65536):
+                        continue
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    pass
+                close(sock)
+                
+            now = time.monotonic()
+            for sock, deadline in list(deadlines.items()):
+                if deadline <= now:
+                    close(sock)
+                    
+    def _worker(self):
+        while True:
+            item = self._requests.get()
+            if item is None:
+                return
+            request, client_address = item
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+                
+    def server_close(self):
+        super().server_close()
+        
+        # Drop connections still waiting and stop the workers
+        while True:
+            try:
+                item = self._requests.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                self.shutdown_request(item[0])
+        for _ in self._workers:
+            try:
+                self._requests.put_nowait(None)
+            except queue.Full:
+                break
+        self._rejected.put(None)
 
 
 class HealthCheckServer:
@@ -91,7 +352,7 @@ class HealthCheckServer:
     """
     
     def __init__(self, config_path: str, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
-                 check_interval: int = DEFAULT_CHECK_INTERVAL):
+                 check_interval: int = DEFAULT_CHECK_INTERVAL, workers: int = 1):
         """
         Initialize the health check server.
         
@@ -100,11 +361,14 @@ class HealthCheckServer:
             host: Host to bind the server to
             port: Port to listen on
             check_interval: Interval between health checks in seconds
+            workers: Number of processes listening on the port
         """
         self.config_path = config_path
         self.host = host
         self.port = port
         self.check_interval = check_interval
+        self.workers = workers
+        self._worker_pids = []
         self.config = None
         self.mcp_servers_status = {}
         self.process_status = {}
@@ -114,10 +378,31 @@ class HealthCheckServer:
         self.process_monitor = None
         self.httpd = None
         self.start_time = time.time()
+        self._http = None
+        self._resource_cache = (0.0, None)  # (monotonic timestamp, resources)
+        self._metric_labels = {}  # (kind, name) -> encoded metric label prefixes
+        self._probe_urls = {}  # enabled server name -> proxy health URL
+        self._config_signature = None  # (st_mtime_ns, st_size) of the loaded config
+        self._health_cache = ((), None, None)  # (signature, status, encoded body)
+        self._last_cpu_times = (0, 0)  # (idle, total) jiffies from the last /proc/stat sample
+        self._refresh_thread = None
+        self._shutdown_event = threading.Event()
+        self._status_pipes = []  # write ends of the process status pipes to forked workers
+        self._published_status = None  # (monotonic publish time, encoded status) received by a worker
         
         # Load initial configuration
         self._load_config()
         
+        # Reuse keep-alive connections to the proxy across health probes
+        if HAS_URLLIB3:
+            server_count = len((self.config or {}).get("mcpServers", {}))
+            self._http = urllib3.PoolManager(
+                num_pools=4,
+                maxsize=min(32, max(10, server_count)),
+                retries=False,
+                timeout=urllib3.Timeout(connect=1.0, read=4.0)
+            )
+        
         # Initialize process monitor integration
         try:
             from process_monitor import ProcessMonitor
@@ -126,28 +411,66 @@ class HealthCheckServer:
         except ImportError:
             logger.warning("Process monitor module not found, process monitoring integration disabled")
             self.process_monitor = None
+            
+        # Forked workers drop the monitor but still report its published status
+        self.process_monitor_enabled = self.process_monitor is not None
         
     def _load_config(self) -> Dict[str, Any]:
         """
         Load the configuration from the specified file.
         
+        The file is only re-parsed when its modification time or size changes,
+        so this is cheap to call periodically.
+        
         Returns:
             The loaded configuration as a dictionary
         """
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = json.load(f)
-                logger.info(f"Configuration loaded from {self.config_path}")
+            st = os.stat(self.config_path)
+            signature = (st.st_mtime_ns, st.st_size)
+            if self.config is not None and signature == self._config_signature:
                 return self.config
+                
+            self.config = _read_json_file(self.config_path)
+            self._config_signature = signature
+            self._metric_labels = {}
+            self._probe_urls = self._build_probe_urls(self.config)
+            logger.info(f"Configuration loaded from {self.config_path}")
+            return self.config
         except (json.JSONDecodeError, FileNotFoundError) as e:
             logger.error(f"Failed to load configuration: {str(e)}")
             self.is_healthy = False
             return {}
             
+    @staticmethod
+    def _build_probe_urls(config: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Build the proxy health URL for every enabled MCP server.
+        
+        Args:
+            config: Loaded configuration
+            
+        Returns:
+            Dictionary mapping server names to their probe URLs
+        """
+        proxy_config = config.get("proxy", {})
+        proxy_port = proxy_config.get("port", 8000)
+        proxy_host = proxy_config.get("host", "0.0.0.0")
+        
+        return {
+            server_name: f"http://{proxy_host}:{proxy_port}/health?server={quote(server_name, safe='')}"
+            for server_name, server_config in config.get("mcpServers", {}).items()
+            if not server_config.get("disabled", False)
+        }
+        
     def check_mcp_servers(self) -> Dict[str, Dict[str, Any]]:
         """
         Check the health of all MCP servers.
         
+        Servers are probed concurrently. Any probe that has not finished within
+        half of the check interval is reported as unknown, so a single hung
+        server cannot stall the whole health check.
+        
         Returns:
             Dictionary with health status for each MCP server
         """
@@ -157,15 +480,27 @@ class HealthCheckServer:
             return {}
             
         mcp_servers = self.config.get("mcpServers", {})
-        results = {}
-        overall_healthy = True
+        probe_results = {}
         
-        # Get proxy configuration
-        proxy_config = self.config.get("proxy", {})
-        proxy_port = proxy_config.get("port", 8000)
-        proxy_host = proxy_config.get("host", "0.0.0.0")
+        # Probe all enabled servers concurrently
+        if self._probe_urls:
+            pool = ThreadPoolExecutor(max_workers=min(32, len(self._probe_urls)))
+            futures = {
+                pool.submit(self._probe_server, url): server_name
+                for server_name, url in self._probe_urls.items()
+            }
+            try:
+                for future in as_completed(futures, timeout=self.check_interval * 0.5):
+                    probe_results[futures[future]] = future.result()
+            except FuturesTimeoutError:
+                logger.warning("Health check deadline exceeded for some MCP servers")
+            finally:
+                # Don't wait for hung probes; they finish on their own socket timeout
+                pool.shutdown(wait=False, cancel_futures=True)
         
-        # Check each MCP server
+        # Assemble results in configuration order
+        results = {}
+        overall_healthy = True
         for server_name, server_config in mcp_servers.items():
             # Skip disabled servers
             if server_config.get("disabled", False):
@@ -176,39 +511,15 @@ class HealthCheckServer:
                 }
                 continue
                 
-            # Check if the server is responding
-            try:
-                # Try to access the server through the proxy
-                url = f"http://{proxy_host}:{proxy_port}/health?server={server_name}"
-                req = Request(url)
-                response = urlopen(req, timeout=5)
-                
-                if response.status == 200:
-                    results[server_name] = {
-                        "status": "healthy",
-                        "healthy": True,
-                        "message": "Server is responding"
-                    }
-                else:
-                    results[server_name] = {
-                        "status": "unhealthy",
-                        "healthy": False,
-                        "message": f"Server returned status code {response.status}"
-                    }
-                    overall_healthy = False
-            except (URLError, HTTPError) as e:
-                results[server_name] = {
-                    "status": "unhealthy",
-                    "healthy": False,
-                    "message": f"Failed to connect to server: {str(e)}"
-                }
-                overall_healthy = False
-            except Exception as e:
-                results[server_name] = {
+            result = probe_results.get(server_name)
+            if result is None:
+                result = {
                     "status": "unknown",
                     "healthy": False,
-                    "message": f"Error checking server health: {str(e)}"
+                    "message": "Probe deadline exceeded"
                 }
+            results[server_name] = result
+            if not result["healthy"]:
                 overall_healthy = False
                 
         self.mcp_servers_status = results
@@ -217,69 +528,108 @@ class HealthCheckServer:
         
         return results
         
+    def _probe_server(self, url: str) -> Dict[str, Any]:
+        """
+        Probe a single MCP server through the proxy.
+        
+        Args:
+            url: Proxy health URL for the server
+            
+        Returns:
+            Dictionary with the health status of the server
+        """
+        try:
+            # Try to access the server through the proxy
+            if self._http is not None:
+                response = self._http.request("GET", url, preload_content=False)
+                response.drain_conn()
+                response.release_conn()
+            else:
+                req = Request(url)
+                response = urlopen(req, timeout=5)
+            
+            if response.status == 200:
+                return {
+                    "status": "healthy",
+                    "healthy": True,
+                    "message": "Server is responding"
+                }
+            else:
+                return {
+                    "status": "unhealthy",
+                    "healthy": False,
+                    "message": f"Server returned status code {response.status}"
+                }
+        except PROBE_ERRORS as e:
+            return {
+                "status": "unhealthy",
+                "healthy": False,
+                "message": f"Failed to connect to server: {str(e)}"
+            }
+        except Exception as e:
+            return {
+                "status": "unknown",
+                "healthy": False,
+                "message": f"Error checking server health: {str(e)}"
+            }
+        
     def check_system_resources(self) -> Dict[str, Any]:
         """
         Check system resource usage.
         
+        Results are cached for RESOURCE_CACHE_TTL seconds so frequent /health
+        and /metrics requests don't re-run the underlying system queries. While
+        the background refresh thread is running the cached value is always used.
+        
+        Returns:
+            Dictionary with system resource metrics
+        """
+        now = time.monotonic()
+        cached_at, cached = self._resource_cache
+        if cached is not None and (self._refresh_thread is not None or now - cached_at < RESOURCE_CACHE_TTL):
+            return cached
+            
+        resources = self._collect_system_resources()
+        self._resource_cache = (now, resources)
+        return resources
+        
+    def _collect_system_resources(self) -> Dict[str, Any]:
+        """
+        Collect current system resource usage.
+        
         Returns:
             Dictionary with system resource metrics
         """
         try:
-            # Platform-specific commands
+            # Linux exposes everything we need under /proc, so avoid forking ps/df
+            if sys.platform.startswith('linux'):
+                return self._collect_proc_resources()
+                
+            # One ps snapshot gives CPU, memory and process count
             if sys.platform == 'darwin':  # macOS
-                cpu_cmd = ["ps", "-eo", "pcpu"]
-                mem_cmd = ["ps", "-eo", "pmem"]
-                proc_cmd = ["ps", "-e"]
-            else:  # Linux and others
-                cpu_cmd = ["ps", "-eo", "pcpu", "--no-headers"]
-                mem_cmd = ["ps", "-eo", "pmem", "--no-headers"]
-                proc_cmd = ["ps", "-e", "--no-headers"]
-            
-            # Get CPU usage
+                ps_cmd = ["ps", "-eo", "pcpu,pmem"]
+            else:  # Other Unix platforms
+                ps_cmd = ["ps", "-eo", "pcpu,pmem", "--no-headers"]
+            skip_header = 1 if sys.platform == 'darwin' else 0
+            
+            # Get CPU usage, memory usage and process count
             cpu_percent = 0
-            try:
-                cpu_output = subprocess.check_output(cpu_cmd, universal_newlines=True)
-                cpu_lines = cpu_output.strip().split('\n')
-                
-                # Skip header on macOS
-                if sys.platform == 'darwin' and len(cpu_lines) > 0:
-                    cpu_lines = cpu_lines[1:]
-                    
-                cpu_values = [float(x.strip()) for x in cpu_lines if x.strip()]
-                cpu_percent = sum(cpu_values)
-            except (subprocess.SubprocessError, ValueError) as e:
-                logger.warning(f"Failed to get CPU usage: {str(e)}")
-                cpu_percent = 0
-                
-            # Get memory usage
             memory_percent = 0
+            process_count = 0
             try:
-                mem_output = subprocess.check_output(mem_cmd, universal_newlines=True)
-                mem_lines = mem_output.strip().split('\n')
+                ps_output = subprocess.check_output(ps_cmd, universal_newlines=True)
                 
-                # Skip header on macOS
-                if sys.platform == 'darwin' and len(mem_lines) > 0:
-                    mem_lines = mem_lines[1:]
-                    
-                mem_values = [float(x.strip()) for x in mem_lines if x.strip()]
-                memory_percent = sum(mem_values)
+                # Sum both columns in one pass, skipping the header on macOS
+                for line in ps_output.splitlines()[skip_header:]:
+                    fields = line.split()
+                    if len(fields) >= 2:
+                        cpu_percent += float(fields[0])
+                        memory_percent += float(fields[1])
+                        process_count += 1
             except (subprocess.SubprocessError, ValueError) as e:
-                logger.warning(f"Failed to get memory usage: {str(e)}")
+                logger.warning(f"Failed to get process usage: {str(e)}")
+                cpu_percent = 0
                 memory_percent = 0
-                
-            # Get process count
-            process_count = 0
-            try:
-                ps_output = subprocess.check_output(proc_cmd, universal_newlines=True)
-                ps_lines = ps_output.strip().split('\n')
-                
-                # Skip header on macOS
-                if sys.platform == 'darwin' and len(ps_lines) > 0:
-                    ps_lines = ps_lines[1:]
-                    
-                process_count = len([x for x in ps_lines if x.strip()])
-            except subprocess.SubprocessError as e:
-                logger.warning(f"Failed to get process count: {str(e)}")
                 process_count = 0
                 
             # Get disk usage
@@ -291,12 +641,11 @@ class HealthCheckServer:
                     df_cmd = ["df", "-h", "/app"]
                     
                 df_output = subprocess.check_output(df_cmd, universal_newlines=True)
-                df_lines = df_output.strip().split('\n')
+                df_lines = df_output.splitlines()
                 
                 if len(df_lines) > 1:
                     # Parse the percentage from the output (format varies by platform)
-                    parts = df_lines[1].split()
-                    for part in parts:
+                    for part in df_lines[1].split():
                         if part.endswith('%'):
                             disk_percent = float(part.rstrip('%'))
                             break
@@ -320,6 +669,76 @@ class HealthCheckServer:
                 "error": str(e)
             }
             
+    def _collect_proc_resources(self) -> Dict[str, Any]:
+        """
+        Collect system resource usage from /proc and statvfs on Linux.
+        
+        Returns:
+            Dictionary with system resource metrics
+        """
+        # Get CPU usage from the change in /proc/stat since the previous sample
+        cpu_percent = 0
+        try:
+            with open('/proc/stat', 'rb') as f:
+                times = [int(x) for x in f.readline().split()[1:9]]
+            total = sum(times)
+            idle = times[3] + times[4]  # idle + iowait
+            last_idle, last_total = self._last_cpu_times
+            self._last_cpu_times = (idle, total)
+            total_delta = total - last_total
+            if total_delta > 0:
+                cpu_percent = round(100.0 * (1 - (idle - last_idle) / total_delta), 1)
+        except (OSError, ValueError, IndexError) as e:
+            logger.warning(f"Failed to get CPU usage: {str(e)}")
+            cpu_percent = 0
+            
+        # Get memory usage from /proc/meminfo
+        memory_percent = 0
+        try:
+            meminfo = {}
+            with open('/proc/meminfo', 'rb') as f:
+                for line in f:
+                    key, _, value = line.partition(b':')
+                    if key in (b'MemTotal', b'MemAvailable'):
+                        meminfo[key] = int(value.split()[0])
+                        if len(meminfo) == 2:
+                            break
+            mem_total = meminfo[b'MemTotal']
+            if mem_total:
+                memory_percent = round(100.0 * (mem_total - meminfo[b'MemAvailable']) / mem_total, 1)
+        except (OSError, ValueError, IndexError, KeyError) as e:
+            logger.warning(f"Failed to get memory usage: {str(e)}")
+            memory_percent = 0
+            
+        # Get process count from the numeric entries in /proc
+        process_count = 0
+        try:
+            process_count = sum(1 for name in os.listdir('/proc') if name.isdigit())
+        except OSError as e:
+            logger.warning(f"Failed to get process count: {str(e)}")
+            process_count = 0
+            
+        # Get disk usage the same way df computes Use%
+        disk_percent = 0
+        try:
+            try:
+                st = os.statvfs(DISK_USAGE_PATH)
+            except FileNotFoundError:
+                st = os.statvfs('/')
+            used = st.f_blocks - st.f_bfree
+            if used + st.f_bavail:
+                disk_percent = round(100.0 * used / (used + st.f_bavail), 1)
+        except OSError as e:
+            logger.warning(f"Failed to get disk usage: {str(e)}")
+            disk_percent = 0
+            
+        return {
+            "cpu_percent": cpu_percent,
+            "memory_percent": memory_percent,
+            "process_count": process_count,
+            "disk_percent": disk_percent
+        }
+        
     def get_health_status(self) -> Dict[str, Any]:
         """
         Get the overall health status of the container.
@@ -327,32 +746,66 @@ class HealthCheckServer:
         Returns:
             Dictionary with health status information
         """
-        # Check if we need to refresh the health status
+        # Refresh lazily only when the background refresh thread isn't running
         current_time = time.time()
-        if current_time - self.last_check_time > self.check_interval:
+        if self._refresh_thread is None and current_time - self.last_check_time > self.check_interval:
             self.check_mcp_servers()
             
         # Get system resources
         resources = self.check_system_resources()
         
+        # Reuse the previous status until one of the checks refreshes
+        signature = (self.last_check_time, self._resource_cache[0], self.is_healthy)
+        cached_signature, cached_status, _ = self._health_cache
+        if cached_status is not None and signature == cached_signature:
+            return cached_status
+            
         # Build health status response
-        return {
+        health_status = {
             "status": "healthy" if self.is_healthy else "unhealthy",
             "timestamp": int(current_time),
             "mcp_servers": self.mcp_servers_status,
             "resources": resources,
             "config_path": self.config_path
         }
+        self._health_cache = (signature, health_status, None)
+        return health_status
+        
+    def get_health_body(self) -> bytes:
+        """
+        Get the encoded /health response body.
+        
+        The body is serialized once per health status and reused until the
+        MCP server or resource checks refresh.
+        
+        Returns:
+            JSON-encoded health status
+        """
+        health_status = self.get_health_status()
+        signature, cached_status, body = self._health_cache
+        if cached_status is health_status and body is not None:
+            return body
+            
+        body = _json_dumps(health_status)
+        if cached_status is health_status:
+            self._health_cache = (signature, health_status, body)
+        return body
         
     def start(self):
         """
         Start the health check server.
         """
+        # Fork extra listener processes before any threads are started
+        reuse_port = self.workers > 1 and hasattr(os, 'fork') and hasattr(socket, 'SO_REUSEPORT')
+        if reuse_port:
+            self._fork_workers()
+        elif self.workers > 1:
+            logger.warning("SO_REUSEPORT is not supported on this platform, using a single worker")
+            
         handler = self._create_request_handler()
         
         # Create the server
-        self.httpd = socketserver.ThreadingTCPServer((self.host, self.port), handler)
-        self.httpd.daemon_threads = True  # Allow threads to exit when main thread exits
+        self.httpd = PooledTCPServer((self.host, self.port), handler, reuse_port=reuse_port)
         
         logger.info(f"Health check server started at http://{self.host}:{self.port}")
         
@@ -374,15 +827,153 @@ class HealthCheckServer:
             self.process_monitor.start_processes()
             self.process_monitor.start_monitoring()
             
-        # Keep the main thread alive
+        # Refresh health checks off the request path (forked workers receive them instead)
+        if self._refresh_thread is None:
+            self._start_refresh_thread()
+        
+        # Keep the main thread alive until shutdown is requested
         try:
-            while not self.shutdown_requested:
-                time.sleep(1)
+            self._shutdown_event.wait()
         except KeyboardInterrupt:
             pass
         finally:
             self.shutdown()
             
+    def _fork_workers(self):
+        """
+        Fork additional worker processes that serve HTTP on the same port.
+        
+        Workers neither probe the MCP servers nor run the process monitor. The
+        parent's refresh thread does both and sends the results to each worker
+        over a pipe, so every server is probed once per interval however many
+        workers there are.
+        """
+        for _ in range(self.workers - 1):
+            read_fd, write_fd = os.pipe()
+            pid = os.fork()
+            if pid == 0:
+                # Keep only this worker's read end; the write ends belong to the parent
+                os.close(write_fd)
+                for fd in self._status_pipes:
+                    os.close(fd)
+                self._status_pipes = []
+                self.process_monitor = None
+                self._worker_pids = []
+                
+                # The parent's status stands in for this worker's refresh thread
+                self._refresh_thread = threading.Thread(
+                    target=self._receive_status, args=(read_fd,), name="health-status", daemon=True
+                )
+                self._refresh_thread.start()
+                return
+            os.close(read_fd)
+            self._status_pipes.append(write_fd)
+            self._worker_pids.append(pid)
+        logger.info(f"Started {len(self._worker_pids)} additional health check workers")
+        
+    def _start_refresh_thread(self):
+        """
+        Start the background thread that refreshes server and resource checks.
+        """
+        self._refresh_thread = threading.Thread(target=self._refresh_loop, name="health-refresh")
+        self._refresh_thread.daemon = True
+        self._refresh_thread.start()
+        
+    def _refresh_loop(self):
+        """
+        Refresh system resources and MCP server checks until shutdown.
+        
+        Resources and process status are refreshed every RESOURCE_CACHE_TTL
+        seconds (or the check interval, if shorter). Every check interval the configuration is reloaded
+        if it changed and the servers are probed, so request handlers only ever
+        read cached results. The results are then sent to any forked workers.
+        """
+        interval = min(self.check_interval, RESOURCE_CACHE_TTL)
+        while not self._shutdown_event.is_set():
+            try:
+                self._resource_cache = (time.monotonic(), self._collect_system_resources())
+                if time.time() - self.last_check_time >= self.check_interval:
+                    self._load_config()
+                    self.check_mcp_servers()
+                if self._status_pipes:
+                    self._publish_status()
+            except Exception as e:
+                logger.error(f"Error refreshing health checks: {str(e)}")
+            self._shutdown_event.wait(interval)
+            
+    def _publish_status(self):
+        """
+        Send the latest server checks, resources and process status to the forked workers.
+        
+        Only the refresh thread calls this, so frames are never interleaved.
+        Workers whose pipe is closed are dropped.
+        """
+        body = _json_dumps({
+            "mcp_servers": self.mcp_servers_status,
+            "is_healthy": self.is_healthy,
+            "last_check_time": self.last_check_time,
+            "resources": self._resource_cache[1],
+            "processes": self.process_monitor.get_process_status() if self.process_monitor else {},
+        })
+        frame = _STATUS_FRAME.pack(len(body), time.monotonic()) + body
+        for fd in list(self._status_pipes):
+            try:
+                view = memoryview(frame)
+                while view:
+                    view = view[os.write(fd, view):]
+            except OSError:
+                self._status_pipes.remove(fd)
+                os.close(fd)
+                
+    def _receive_status(self, fd: int):
+        """
+        Apply the status sent by the parent until the pipe closes.
+        
+        Args:
+            fd: Read end of this worker's status pipe
+        """
+        with os.fdopen(fd, 'rb') as pipe:
+            while True:
+                header = pipe.read(_STATUS_FRAME.size)
+                if len(header) < _STATUS_FRAME.size:
+                    return
+                length, published = _STATUS_FRAME.unpack(header)
+                body = pipe.read(length)
+                if len(body) < length:
+                    return
+                status = _json_loads(body)
+                self.mcp_servers_status = status["mcp_servers"]
+                self.is_healthy = status["is_healthy"]
+                self._resource_cache = (published, status["resources"])
+                self.last_check_time = status["last_check_time"]
+                self._published_status = (published, body)
+                
+    def get_process_status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the status of the monitored processes.
+        
+        The process that runs the monitor reads it directly. Forked workers use
+        the status last sent by the parent, with uptimes advanced by the time
+        since it was sent.
+        
+        Returns:
+            Dictionary with process status information
+        """
+        if self.process_monitor is not None:
+            return self.process_monitor.get_process_status()
+            
+        published = self._published_status
+        if published is None:
+            return {}
+            
+        published_time, body = published
+        process_status = _json_loads(body)["processes"]
+        elapsed = time.monotonic() - published_time
+        for status in process_status.values():
+            if status["running"]:
+                status["uptime"] += elapsed
+        return process_status
+        
     def shutdown(self):
         """
         Shutdown the health check server and all monitored processes.
@@ -391,6 +982,7 @@ class HealthCheckServer:
             return
             
         self.shutdown_requested = True
+        self._shutdown_event.set()
         logger.info("Shutting down health check server...")
         
         # Stop the process monitor if available
@@ -405,6 +997,22 @@ class HealthCheckServer:
             self.httpd.shutdown()
             self.httpd.server_close()
             
+        # Stop forked worker processes
+        for fd in self._status_pipes:
+            os.close(fd)
+        self._status_pipes = []
+        for pid in self._worker_pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+        self._worker_pids = []
+        
+        # Close pooled probe connections
+        if self._http is not None:
+            self._http.clear()
+            
         logger.info("Health check server stopped")
                 
     def get_detailed_status(self) -> Dict[str, Any]:
@@ -418,9 +1026,7 @@ class HealthCheckServer:
         health_status = self.get_health_status()
         
         # Get process status if process monitor is available
-        process_status = {}
-        if self.process_monitor:
-            process_status = self.process_monitor.get_process_status()
+        process_status = self.get_process_status()
         
         # Calculate uptime
         uptime = time.time() - self.start_time
@@ -435,9 +1041,56 @@ class HealthCheckServer:
             "resources": health_status["resources"],
             "config_path": self.config_path,
             "config_loaded": self.config is not None,
-            "process_monitor_enabled": self.process_monitor is not None
+            "process_monitor_enabled": self.process_monitor_enabled
         }
     
+    def render_metrics(self, resources: Dict[str, Any]) -> bytes:
+        """
+        Render metrics in the Prometheus text exposition format.
+        
+        Args:
+            resources: System resource metrics from check_system_resources
+            
+        Returns:
+            Encoded metrics response body
+        """
+        parts = []
+        for key, prefix in _RESOURCE_METRICS:
+            parts += (prefix, str(resources[key]).encode(), b"\n")
+        parts += (_UPTIME_METRIC, str(time.time() - self.start_time).encode(), b"\n")
+        
+        # Add metrics for each MCP server
+        parts.append(_SERVER_METRIC_HEADERS)
+        for server_name, status in self.mcp_servers_status.items():
+            label = self._metric_labels.get(("server", server_name))
+            if label is None:
+                label = f'mcpo_server_status{{server="{server_name}"}} '.encode()
+                self._metric_labels[("server", server_name)] = label
+            parts += (label, b"1\n" if status.get("healthy", False) else b"0\n")
+            
+        # Add process metrics if process monitor is available
+        if self.process_monitor_enabled:
+            process_status = self.get_process_status()
+            parts.append(_PROCESS_METRIC_HEADERS)
+            
+            for server_name, status in process_status.items():
+                labels = self._metric_labels.get(("process", server_name))
+                if labels is None:
+                    label = f'{{process="{server_name}"}} '
+                    labels = (
+                        f"mcpo_process_running{label}".encode(),
+                        f"mcpo_process_restart_count{label}".encode(),
+                        f"mcpo_process_uptime_seconds{label}".encode()
+                    )
+                    self._metric_labels[("process", server_name)] = labels
+                parts += (
+                    labels[0], b"1\n" if status.get("running", False) else b"0\n",
+                    labels[1], str(status.get("restart_count", 0)).encode(), b"\n",
+                    labels[2], str(status.get("uptime", 0)).encode(), b"\n"
+                )
+                
+        return b"".join(parts)
+    
     def _create_request_handler(self):
         """
         Create a request handler for the health check server.
@@ -448,102 +1101,103 @@ class HealthCheckServer:
         health_check_server = self
         
         class HealthCheckHandler(http.server.SimpleHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            timeout = REQUEST_READ_TIMEOUT
+            
             def do_GET(self):
-                if self.path == '/health' or self.path == '/':
-                    # Get health status
-                    health_status = health_check_server.get_health_status()
-                    
-                    # Set response headers
-                    self.send_response(200 if health_check_server.is_healthy else 503)
-                    self.send_header('Content-Type', 'application/json')
-                    self.end_headers()
-                    
-                    # Send response
-                    self.wfile.write(json.dumps(health_status).encode('utf-8'))
-                elif self.path == '/status':
-                    # Get detailed status
-                    detailed_status = health_check_server.get_detailed_status()
-                    
-                    # Set response headers
-                    self.send_response(200)
-                    self.send_header('Content-Type', 'application/json')
-                    self.end_headers()
-                    
-                    # Send response
-                    self.wfile.write(json.dumps(detailed_status).encode('utf-8'))
-                elif self.path == '/readiness':
-                    # Check if configuration is loaded
-                    if health_check_server.config is not None:
-                        self.send_response(200)
-                        self.send_header('Content-Type', 'application/json')
-                        self.end_headers()
-                        self.wfile.write(json.dumps({"status": "ready"}).encode('utf-8'))
-                    else:
-                        self.send_response(503)
-                        self.send_header('Content-Type', 'application/json')
-                        self.end_headers()
-                        self.wfile.write(json.dumps({"status": "not ready"}).encode('utf-8'))
-                elif self.path == '/liveness':
-                    # Always return 200 if the server is running
-                    self.send_response(200)
-                    self.send_header('Content-Type', 'application/json')
-                    self.end_headers()
-                    self.wfile.write(json.dumps({"status": "alive"}).encode('utf-8'))
-                elif self.path == '/metrics':
-                    # Get system resources
-                    resources = health_check_server.check_system_resources()
-                    
-                    # Set response headers
-                    self.send_response(200)
-                    self.send_header('Content-Type', 'text/plain')
-                    self.end_headers()
-                    
-                    # Format metrics in Prometheus format
-                    metrics = [
-                        f"# HELP mcpo_cpu_percent CPU usage percentage",
-                        f"# TYPE mcpo_cpu_percent gauge",
-                        f"mcpo_cpu_percent {resources['cpu_percent']}",
-                        f"# HELP mcpo_memory_percent Memory usage percentage",
-                        f"# TYPE mcpo_memory_percent gauge",
-                        f"mcpo_memory_percent {resources['memory_percent']}",
-                        f"# HELP mcpo_process_count Number of processes",
-                        f"# TYPE mcpo_process_count gauge",
-                        f"mcpo_process_count {resources['process_count']}",
-                        f"# HELP mcpo_uptime_seconds Container uptime in seconds",
-                        f"# TYPE mcpo_uptime_seconds counter",
-                        f"mcpo_uptime_seconds {time.time() - health_check_server.start_time}"
-                    ]
-                    
-                    # Add metrics for each MCP server
-                    metrics.append(f"# HELP mcpo_server_status MCP server status (1=healthy, 0=unhealthy)")
-                    metrics.append(f"# TYPE mcpo_server_status gauge")
-                    
-                    for server_name, status in health_check_server.mcp_servers_status.items():
-                        value = 1 if status.get("healthy", False) else 0
-                        metrics.append(f'mcpo_server_status{{server="{server_name}"}} {value}')
+                # Responses carry Connection: close; the pool has few workers and
+                # an idle keep-alive client would hold one of them
+                self.close_connection = True
+                handler = self.routes.get(urlsplit(self.path).path)
+                if handler is None:
+                    self.send_error(404)
+                else:
+                    handler(self)
                     
-                    # Add process metrics if process monitor is available
-                    if health_check_server.process_monitor:
-                        process_status = health_check_server.process_monitor.get_process_status()
-                        metrics.append(f"# HELP mcpo_process_running Process running status (1=running, 0=stopped)")
-                        metrics.append(f"# TYPE mcpo_process_running gauge")
-                        metrics.append(f"# HELP mcpo_process_restart_count Process restart count")
-                        metrics.append(f"# TYPE mcpo_process_restart_count counter")
-                        metrics.append(f"# HELP mcpo_process_uptime_seconds Process uptime in seconds")
-                        metrics.append(f"# TYPE mcpo_process_uptime_seconds counter")
-                        
-                        for server_name, status in process_status.items():
-                            running = 1 if status.get("running", False) else 0
-                            metrics.append(f'mcpo_process_running{{process="{server_name}"}} {running}')
-                            metrics.append(f'mcpo_process_restart_count{{process="{server_name}"}} {status.get("restart_count", 0)}')
-                            metrics.append(f'mcpo_process_uptime_seconds{{process="{server_name}"}} {status.get("uptime", 0)}')
+            def _send_body(self, status: int, content_type: bytes, body: bytes):
+                # Write status line, headers and body with a single write
+                self.log_request(status)
+                self.wfile.write(_build_response(status, content_type, body))
+                
+            def _handle_health(self):
+                # Get health status
+                body = health_check_server.get_health_body()
+                
+                # Send response
+                self._send_body(200 if health_check_server.is_healthy else 503, _JSON_CONTENT_TYPE, body)
+                
+            def _handle_status(self):
+                # Get detailed status
+                detailed_status = health_check_server.get_detailed_status()
+                
+                # Send response; without orjson, stream the encoder output instead
+                # of building the whole document in memory
+                if HAS_ORJSON:
+                    self._send_body(200, _JSON_CONTENT_TYPE, orjson.dumps(detailed_status))
+                else:
+                    self._send_json_streamed(200, detailed_status)
                     
-                    # Send response
-                    self.wfile.write('\n'.join(metrics).encode('utf-8'))
+            def _send_json_streamed(self, status: int, obj: Any):
+                # Write the JSON document without length or chunk framing; closing
+                # the connection marks its end, which HTTP/1.0 clients understand too
+                self.log_request(status)
+                self.wfile.write(_STATUS_LINES[status] + _CONNECTION_CLOSE + _JSON_CONTENT_TYPE + b"\r\n")
+                
+                pending = []
+                pending_size = 0
+                for piece in _COMPACT_ENCODER.iterencode(obj):
+                    pending.append(piece)
+                    pending_size += len(piece)
+                    if pending_size >= STREAM_CHUNK_SIZE:
+                        self.wfile.write("".join(pending).encode('utf-8'))
+                        pending = []
+                        pending_size = 0
+                if pending:
+                    self.wfile.write("".join(pending).encode('utf-8'))
+                
+            def _handle_readiness(self):
+                # Check if configuration is loaded
+                if health_check_server.config is not None:
+                    self.log_request(200)
+                    self.wfile.write(_READY_RESPONSE)
                 else:
-                    self.send_error(404)
+                    self.log_request(503)
+                    self.wfile.write(_NOT_READY_RESPONSE)
+                    
+            def _handle_liveness(self):
+                # Always return 200 if the server is running
+                self.log_request(200)
+                self.wfile.write(_LIVENESS_RESPONSE)
+                
+            def _handle_metrics(self):
+                # Get system resources
+                resources = health_check_server.check_system_resources()
+                
+                # Send response
+                self._send_body(200, _TEXT_CONTENT_TYPE, health_check_server.render_metrics(resources))
+                
+            # Request path (without query string) -> handler method
+            routes = {
+                '/': _handle_health,
+                '/health': _handle_health,
+                '/status': _handle_status,
+                '/readiness': _handle_readiness,
+                '/liveness': _handle_liveness,
+                '/metrics': _handle_metrics
+            }
+                
+            def log_request(self, code='-', size='-'):
+                # Skip formatting the request line unless access logs are enabled
+                if logger.isEnabledFor(logging.DEBUG):
+                    super().log_request(code, size)
                     
             def log_message(self, format, *args):
+                # Access logs are only emitted at DEBUG level to keep probes cheap
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"{self.client_address[0]} - {format % args}")
+                    
+            def log_error(self, format, *args):
+                # Keep request errors (404s, timeouts) at the previous INFO level
                 logger.info(f"{self.client_address[0]} - {format % args}")
                 
         return HealthCheckHandler
@@ -556,6 +1210,7 @@ def main():
     parser.add_argument("--host", default=DEFAULT_HOST, help="Host to bind the server to")
     parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to listen on")
     parser.add_argument("--interval", type=int, default=DEFAULT_CHECK_INTERVAL, help="Interval between health checks in seconds")
+    parser.add_argument("--workers", type=int, default=1, help="Number of processes sharing the port via SO_REUSEPORT")
     parser.add_argument("--no-process-monitor", action="store_true", help="Disable process monitoring")
     args = parser.parse_args()
     
@@ -569,7 +1224,8 @@ def main():
         config_path=args.config,
         host=args.host,
         port=args.port,
-        check_interval=args.interval
+        check_interval=args.interval,
+        workers=args.workers
     )
     
     # Start the server
@@ -17,48 +17,116 @@ import sys
 import json
 import time
 import signal
+import re
 import logging
 import argparse
 import asyncio
 import subprocess
-from typing import Dict, Any, List, Optional, Union
+import itertools
+import selectors
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, List, Optional, Tuple, Union
 from pathlib import Path
 import threading
-from urllib.parse import urlparse
+import queue
+from urllib.parse import urlparse, parse_qs
 
 # HTTP server imports
+from http import HTTPStatus
 from http.server import HTTPServer, BaseHTTPRequestHandler
+import socket
 import socketserver
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
 
+# Reuse keep-alive connections to SSE/HTTP backends when urllib3 is available
+try:
+    import urllib3
+    HAS_URLLIB3 = True
+except ImportError:
+    HAS_URLLIB3 = False
+
+# Use orjson for MCP request/response serialization when available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _json_loads(data) -> Any:
+    """Parse a JSON document from str or bytes."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON bytes, optionally indented by two spaces."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+# Pre-encoded JSON-RPC request fragments; requests only carry id, method and params
+_REQUEST_PREFIX = b'{"jsonrpc":"2.0","id":'
+_METHOD_FRAGMENTS = {method: b',"method":' + _json_dumps(method) for method in ("tools/list", "tools/call")}
+
+def _encode_request(request: Dict[str, Any]) -> bytes:
+    """Serialize a JSON-RPC request, reusing the pre-encoded envelope and method fragments."""
+    method = request["method"]
+    fragment = _METHOD_FRAGMENTS.get(method)
+    if fragment is None:
+        fragment = _METHOD_FRAGMENTS[method] = b',"method":' + _json_dumps(method)
+    body = _REQUEST_PREFIX + _json_dumps(request["id"]) + fragment
+    params = request.get("params")
+    if params is None:
+        return body + b"}"
+    return body + b',"params":' + _json_dumps(params) + b"}"
+
+def _encode_payload(payload: Any) -> bytes:
+    """Serialize a JSON-RPC request or batch array of requests."""
+    if isinstance(payload, list):
+        return b"[" + b",".join(_encode_request(request) for request in payload) + b"]"
+    return _encode_request(payload)
+
 # Configure structured logging
 LOG_FORMAT = os.environ.get("LOG_FORMAT", "json").lower()
 
 if LOG_FORMAT == "json":
-    import json
-    
     class JsonFormatter(logging.Formatter):
         """JSON formatter for structured logging."""
         
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._fragments = {}  # (name, levelname) -> pre-encoded level and name members
+            
         def format(self, record):
-            log_record = {
-                "timestamp": self.formatTime(record, self.datefmt),
-                "level": record.levelname,
-                "name": record.name,
-                "message": record.getMessage(),
-            }
+            key = (record.name, record.levelname)
+            fragment = self._fragments.get(key)
+            if fragment is None:
+                fragment = self._fragments[key] = (
+                    b',"level":' + _json_dumps(record.levelname) + b',"name":' + _json_dumps(record.name)
+                )
+                
+            parts = [
+                b'{"timestamp":', _json_dumps(self.formatTime(record, self.datefmt)),
+                fragment,
+                b',"message":', _json_dumps(record.getMessage())
+            ]
             
-            if hasattr(record, "server_name"):
-                log_record["server_name"] = record.server_name
+            server_name = getattr(record, "server_name", None)
+            if server_name is not None:
+                parts += (b',"server_name":', _json_dumps(server_name))
                 
-            if hasattr(record, "request_id"):
-                log_record["request_id"] = record.request_id
+            request_id = getattr(record, "request_id", None)
+            if request_id is not None:
+                parts += (b',"request_id":', _json_dumps(request_id))
                 
             if record.exc_info:
-                log_record["exception"] = self.formatException(record.exc_info)
+                parts += (b',"exception":', _json_dumps(self.formatException(record.exc_info)))
                 
-            return json.dumps(log_record)
+            parts.append(b"}")
+            return b"".join(parts).decode('utf-8')
     
     formatter = JsonFormatter()
 else:
@@ -80,6 +148,543 @@ logger = logging.getLogger("mcp_proxy")
 DEFAULT_CONFIG_PATH = os.environ.get("CONFIG_PATH", "/app/config.json")
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = int(os.environ.get("PORT", 8000))
+TOOLS_CACHE_TTL = float(os.environ.get("MCP_TOOLS_CACHE_TTL", 300))  # seconds to reuse tools/list results
+PROXY_WORKER_THREADS = int(os.environ.get("MCPO_WORKERS", 32))  # threads serving proxy HTTP requests (tool calls block on the backend)
+PROXY_QUEUE_SIZE = int(os.environ.get("MCPO_QUEUE", 64))  # connections waiting for a worker before new ones get a 503
+BUSY_LINGER_TIMEOUT = 0.1  # seconds to drain a rejected request before closing it
+_ENV_REF_RE = re.compile(r"\$\{([^}]+)\}")  # a whole-value ${VAR} reference in server env
+PIPE_READ_SIZE = 65536  # bytes read from a command server's stdout per syscall
+BATCH_WINDOW = 0.002  # seconds to coalesce concurrent requests for servers with batchRequests enabled
+
+
+# Pre-encoded response framing; every response carries the same CORS headers
+_STATUS_LINES = {status.value: b"HTTP/1.0 %d %s\r\n" % (status.value, status.phrase.encode('ascii')) for status in HTTPStatus}
+_CORS_HEADERS = (
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+    b"Access-Control-Allow-Headers: Content-Type\r\n"
+)
+_JSON_HEADERS = b"Content-Type: application/json\r\n" + _CORS_HEADERS
+_OPTIONS_RESPONSE = _STATUS_LINES[200] + _CORS_HEADERS + b"Content-Length: 0\r\n\r\n"
+_BUSY_BODY = b'{"error":{"code":503,"message":"Server busy, try again later"}}'
+_BUSY_RESPONSE = _STATUS_LINES[503] + _JSON_HEADERS + b"Content-Length: %d\r\n\r\n" % len(_BUSY_BODY) + _BUSY_BODY
+
+
+class PooledTCPServer(socketserver.TCPServer):
+    """
+    TCP server that handles connections on a fixed pool of worker threads
+    fed from a bounded queue; connections arriving while the queue is full
+    are answered with a 503 instead of waiting without bound. Rejected
+    connections are drained and closed by a reaper thread so that shedding
+    load never blocks the accept loop.
+    """
+    
+    def __init__(self, server_address, handler_class, max_workers: int = PROXY_WORKER_THREADS,
+                 queue_size: int = PROXY_QUEUE_SIZE):
+        """
+        Initialize the pooled TCP server.
+        
+        Args:
+            server_address: (host, port) tuple to bind to
+            handler_class: Request handler class
+            max_workers: Number of worker threads
+            queue_size: Number of connections that may wait for a worker
+        """
+        self._requests = queue.Queue(maxsize=max(1, queue_size))
+        self._rejected = queue.SimpleQueue()  # (linger deadline, socket) of answered 503s
+        self._workers = [
+            threading.Thread(target=self._worker, name=f"proxy-http-{index}", daemon=True)
+            for index in range(max_workers)
+        ]
+        self._reaper = threading.Thread(target=self._reap_rejected, name="proxy-http-reaper", daemon=True)
+        super().__init__(server_address, handler_class)
+        for worker in self._workers:
+            worker.start()
+        self._reaper.start()
+            
+    def process_request(self, request, client_address):
+        try:
+            self._requests.put_nowait((request, client_address))
+        except queue.Full:
+            # Shed load rather than queue connections without bound
+            self._reject_request(request)
+            
+    def _reject_request(self, request):
+        """
+        Answer a connection with a 503 and hand it to the reaper.
+        
+        Runs on the accept thread, so it never blocks: the response fits in
+        the socket send buffer and the reaper drains the client's request until
+        it closes its side (bounded by BUSY_LINGER_TIMEOUT), so that closing
+        does not reset the connection before the client has read the response.
+        
+        Args:
+            request: Client socket
+        """
+        try:
+            request.setblocking(False)
+            request.send(_BUSY_RESPONSE)
+            request.shutdown(socket.SHUT_WR)
+        except OSError:
+            self.close_request(request)
+            return
+        self._rejected.put((time.monotonic() + BUSY_LINGER_TIMEOUT, request))
+        
+    def _reap_rejected(self):
+        """
+        Drain rejected connections and close them once the client closes or the linger timeout passes.
+        """
+        selector = selectors.DefaultSelector()
+        deadlines = {}
+        
+        def close(sock):
+            selector.unregister(sock)
+            del deadlines[sock]
+            self.close_request(sock)
+            
+        while True:
+            # Block for the next rejected connection when none is lingering
+            items = [] if deadlines else [self._rejected.get()]
+            while True:
+                try:
+                    items.append(self._rejected.get_nowait())
+                except queue.Empty:
+                    break
+            for item in items:
+                if item is None:
+                    for sock in list(deadlines):
+                        close(sock)
+                    return
+                deadline, sock = item
+                selector.register(sock, selectors.EVENT_READ)
+                deadlines[sock] = deadline
+                
+            # Wait for client data or the earliest deadline, checking for new connections regularly
+            timeout = min(min(deadlines.values()) - time.monotonic(), BUSY_LINGER_TIMEOUT / 4)
+            for key, _ in selector.select(max(0, timeout)):
+                sock = key.fileobj
+                try:
+                    if sock.recv(65536):
+                        continue
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    pass
+                close(sock)
+                
+            now = time.monotonic()
+            for sock, deadline in list(deadlines.items()):
+                if deadline <= now:
+                    close(sock)
+            
+    def _worker(self):
+        while True:
+            item = self._requests.get()
+            if item is None:
+                return
+            request, client_address = item
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+                
+    def server_close(self):
+        super().server_close()
+        
+        # Drop connections still waiting and stop the workers
+        while True:
+            try:
+                item = self._requests.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                self.shutdown_request(item[0])
+        for _ in self._workers:
+            try:
+                self._requests.put_nowait(None)
+            except queue.Full:
+                break
+        self._rejected.put(None)
+
+
+def _split_frames(buffer: bytearray) -> List[bytes]:
+    """
+    Remove the complete newline-delimited frames from the front of a buffer.
+    
+    Args:
+        buffer: Bytes read so far; any trailing partial frame is left in place
+        
+    Returns:
+        The complete frames, without their newlines
+    """
+    end = buffer.rfind(b"\n")
+    if end < 0:
+        return []
+    frames = bytes(buffer[:end]).split(b"\n")
+    del buffer[:end + 1]
+    return frames
+
+
+# Compact JSON-RPC success envelopes, as written by the Python ("jsonrpc" first)
+# and TypeScript ("result" first) MCP SDKs
+_ENVELOPE_PREFIX = b'{"jsonrpc":"2.0","id":'
+_RESULT_MEMBER = b',"result":'
+_ERROR_MEMBER = b',"error":'
+_RESULT_PREFIX = b'{"result":'
+_ENVELOPE_SUFFIX = b',"jsonrpc":"2.0","id":'
+
+
+def _peek_envelope(frame: bytes) -> Optional[Tuple[int, Optional[bytes]]]:
+    """
+    Read the id and raw result of a compact JSON-RPC response without parsing it.
+    
+    A response has exactly one of "result" and "error" besides "jsonrpc" and
+    "id", so once the envelope shape is recognised the result is everything
+    between its key and the closing brace. Requests from the server also
+    start with an id, but carry a "method" instead, and are left to the parser.
+    
+    Args:
+        frame: One JSON-RPC message
+        
+    Returns:
+        (id, result bytes) for a success response, (id, None) for an error
+        response, or None if the shape is not recognised and the message
+        must be parsed
+    """
+    frame = frame.rstrip()
+    if frame.startswith(_ENVELOPE_PREFIX):
+        start = len(_ENVELOPE_PREFIX)
+        end = frame.find(b",", start)
+        id_bytes = frame[start:end]
+        if end == -1 or not id_bytes.isdigit():
+            return None
+        if frame.startswith(_RESULT_MEMBER, end) and frame.endswith(b"}"):
+            return int(id_bytes), frame[end + len(_RESULT_MEMBER):-1]
+        if frame.startswith(_ERROR_MEMBER, end):
+            return int(id_bytes), None
+        return None
+        
+    if frame.startswith(_RESULT_PREFIX) and frame.endswith(b"}"):
+        end = frame.rfind(_ENVELOPE_SUFFIX)
+        id_bytes = frame[end + len(_ENVELOPE_SUFFIX):-1]
+        if end == -1 or not id_bytes.isdigit():
+            return None
+        return int(id_bytes), frame[len(_RESULT_PREFIX):end]
+        
+    return None
+
+
+def _jsonrpc_result(response: Union[bytes, Dict[str, Any]]) -> Any:
+    """
+    Extract the result from a JSON-RPC response.
+    
+    Args:
+        response: JSON-RPC response, parsed or as raw bytes
+        
+    Returns:
+        The response result
+        
+    Raises:
+        Exception: If the response contains an error
+    """
+    if isinstance(response, bytes):
+        response = _json_loads(response)
+    if "error" in response:
+        raise Exception(f"MCP server error: {response['error']}")
+    return response.get("result", {})
+
+
+def _jsonrpc_raw_result(response: Union[bytes, Dict[str, Any]]) -> bytes:
+    """
+    Extract the result from a JSON-RPC response as JSON bytes.
+    
+    The result of a compact success response is sliced out unparsed; other
+    responses are parsed and their result re-encoded.
+    
+    Args:
+        response: JSON-RPC response, parsed or as raw bytes
+        
+    Returns:
+        The response result as JSON bytes
+        
+    Raises:
+        Exception: If the response contains an error
+    """
+    if isinstance(response, bytes):
+        envelope = _peek_envelope(response)
+        if envelope is not None and envelope[1]:
+            return envelope[1]
+    return _json_dumps(_jsonrpc_result(response))
+
+
+class _RequestBatcher:
+    """
+    Coalesces concurrent JSON-RPC requests to one MCP server into batch arrays.
+    
+    The first caller to arrive waits BATCH_WINDOW seconds and then sends every
+    request queued in the meantime as a single batch; the other callers block
+    until their response has been matched back to them. Batches are sent one
+    at a time, so requests that arrive during a send are queued for the next.
+    """
+    
+    def __init__(self, send, window: float = BATCH_WINDOW):
+        """
+        Initialize the request batcher.
+        
+        Args:
+            send: Callable that sends a JSON-RPC payload and returns the parsed response
+            window: Seconds to wait for more requests before sending
+        """
+        self._send = send
+        self._window = window
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._pending = []  # (request, future) pairs waiting to be sent
+        self._collecting = False
+        
+    def submit(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a JSON-RPC request as part of the next batch.
+        
+        Args:
+            request: JSON-RPC request
+            
+        Returns:
+            The JSON-RPC response for this request
+        """
+        future = Future()
+        with self._lock:
+            self._pending.append((request, future))
+            is_leader = not self._collecting
+            self._collecting = True
+            
+        if is_leader:
+            time.sleep(self._window)
+            with self._send_lock:
+                with self._lock:
+                    batch, self._pending = self._pending, []
+                    self._collecting = False
+                self._flush(batch)
+                
+        return future.result()
+        
+    def _flush(self, batch: List[tuple]):
+        """
+        Send a batch of requests and resolve their futures.
+        
+        Args:
+            batch: (request, future) pairs to send
+        """
+        if len(batch) == 1:
+            request, future = batch[0]
+            try:
+                future.set_result(self._send(request))
+            except Exception as e:
+                future.set_exception(e)
+            return
+            
+        payload = [request for request, _ in batch]
+        try:
+            responses = self._send(payload)
+            if isinstance(responses, bytes):
+                responses = _json_loads(responses)
+            if not isinstance(responses, list):
+                raise Exception(f"Expected a batch response from MCP server, got: {responses}")
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+            
+        responses_by_id = {response.get("id"): response for response in responses if isinstance(response, dict)}
+        for request, future in batch:
+            response = responses_by_id.get(request["id"])
+            if response is None:
+                future.set_exception(Exception("No response from MCP server"))
+            else:
+                future.set_result(response)
+
+
+class _CommandChannel:
+    """
+    Multiplexes JSON-RPC requests over a command server's stdin/stdout.
+    
+    Each request is written with its unique id and its caller waits on a
+    future; output read from the process by the shared _PipeReader is fed to
+    the channel, which resolves the future with the matching id, so several
+    tool calls can be in flight on one process at the same time.
+    """
+    
+    def __init__(self, server_name: str, process: subprocess.Popen, timeout: float):
+        """
+        Initialize the channel.
+        
+        Args:
+            server_name: Name of the server
+            process: Server process with piped stdin and stdout
+            timeout: Seconds to wait for a response
+        """
+        self._server_name = server_name
+        self._process = process
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._pending = {}  # request id -> (Future, request ids sharing the future)
+        self._buffer = bytearray()  # output read so far that does not yet end in a newline
+        self._closed = False
+        
+    def fileno(self) -> int:
+        """Return the file descriptor of the process's stdout."""
+        return self._process.stdout.fileno()
+        
+    def exchange(self, payload: Any) -> Any:
+        """
+        Send a JSON-RPC request or batch and wait for its response.
+        
+        Args:
+            payload: JSON-RPC request object or batch array
+            
+        Returns:
+            The parsed response, or the raw response line for a common envelope
+            shape whose id was read without parsing
+            
+        Raises:
+            Exception: If the process exits or does not respond in time
+        """
+        requests = payload if isinstance(payload, list) else [payload]
+        request_ids = tuple(request["id"] for request in requests)
+        future = Future()
+        
+        with self._lock:
+            if self._closed:
+                raise Exception("No response from MCP server")
+            for request_id in request_ids:
+                self._pending[request_id] = (future, request_ids)
+                
+            # Write under the lock so concurrent requests are not interleaved
+            try:
+                self._process.stdin.write(_encode_payload(payload) + b"\n")
+                self._process.stdin.flush()
+            except Exception:
+                for request_id in request_ids:
+                    self._pending.pop(request_id, None)
+                raise
+                
+        try:
+            return future.result(timeout=self._timeout)
+        except FutureTimeoutError:
+            with self._lock:
+                for request_id in request_ids:
+                    self._pending.pop(request_id, None)
+            raise Exception(f"MCP server did not respond within {self._timeout} seconds")
+        
+    def feed(self, chunk: bytes):
+        """
+        Consume output read from the process and resolve completed responses.
+        
+        Args:
+            chunk: Bytes read from the process's stdout
+        """
+        self._buffer += chunk
+        for frame in _split_frames(self._buffer):
+            self._dispatch(frame)
+            
+    def close(self):
+        """
+        Mark the process's stdout as closed and fail every waiting request.
+        """
+        with self._lock:
+            self._closed = True
+            pending, self._pending = self._pending, {}
+        for future, _ in pending.values():
+            if not future.done():
+                future.set_exception(Exception("No response from MCP server"))
+                
+    def _dispatch(self, frame: bytes):
+        """
+        Resolve the future waiting on a response frame.
+        
+        Args:
+            frame: One newline-delimited JSON-RPC message
+        """
+        if not frame.strip():
+            return
+            
+        # Common response shapes only need their id read; the caller parses them
+        envelope = _peek_envelope(frame)
+        if envelope is not None:
+            message = frame
+            response_id = envelope[0]
+        else:
+            try:
+                message = _json_loads(frame)
+            except ValueError:
+                logger.debug(f"Ignoring non-JSON output from MCP server {self._server_name}: {frame.strip()!r}")
+                return
+                
+            first = message[0] if isinstance(message, list) and message else message
+            if not isinstance(first, dict) or "method" in first:
+                return
+            response_id = first.get("id")
+            
+        # Requests and notifications from the server, which carry a "method",
+        # and messages without a pending id are ignored
+        with self._lock:
+            entry = self._pending.get(response_id)
+            if entry is not None:
+                for request_id in entry[1]:
+                    self._pending.pop(request_id, None)
+        if entry is not None:
+            entry[0].set_result(message)
+
+
+class _PipeReader:
+    """
+    Reads the output of every command server from a single thread.
+    
+    Each server's stdout is registered with a selector; the thread waits until
+    any pipe is readable, reads what is available and feeds it to that
+    server's channel, so one thread serves all command servers.
+    """
+    
+    def __init__(self):
+        """
+        Initialize the pipe reader; its thread starts with the first registration.
+        """
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._thread = None
+        
+    def register(self, channel: _CommandChannel):
+        """
+        Start reading a command server's output.
+        
+        Args:
+            channel: Channel of the command server
+        """
+        self._selector.register(channel.fileno(), selectors.EVENT_READ, channel)
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="mcp-pipe-reader", daemon=True)
+                self._thread.start()
+                
+    def _run(self):
+        """
+        Feed readable pipes to their channels and close channels at EOF.
+        """
+        while True:
+            # Time out periodically so pipes registered meanwhile are picked up on every platform
+            for key, _ in self._selector.select(timeout=1.0):
+                try:
+                    chunk = os.read(key.fd, PIPE_READ_SIZE)
+                except OSError:
+                    chunk = b""
+                    
+                if chunk:
+                    key.data.feed(chunk)
+                else:
+                    self._selector.unregister(key.fd)
+                    key.data.close()
 
 
 class MCPServerManager:
@@ -95,8 +700,29 @@ class MCPServerManager:
             config: Configuration dictionary
         """
         self.config = config
-        self.servers = {}  # server_name -> server_info
-        self.processes = {}  # server_name -> process
+        # Per-server fields are kept in parallel dicts so each lookup touches only what it needs
+        self.server_types = {}  # server_name -> "command", "sse" or "streamable_http"
+        self.server_configs = {}  # server_name -> server configuration
+        self.start_times = {}  # server_name -> start timestamp
+        self.processes = {}  # server_name -> process (command servers)
+        self.channels = {}  # server_name -> _CommandChannel (command servers)
+        self.urls = {}  # server_name -> URL (SSE and HTTP servers)
+        self.headers = {}  # server_name -> request headers (SSE and HTTP servers)
+        self._tools_cache = {}  # server_name -> (monotonic timestamp, tools)
+        self._tools_lock = threading.Lock()
+        self._request_ids = itertools.count(1)  # unique JSON-RPC request ids
+        self._pipe_reader = _PipeReader()  # reads every command server's stdout
+        self._batchers = {}  # server_name -> _RequestBatcher for servers with batchRequests enabled
+        
+        # Pooled keep-alive client for SSE and streamable HTTP servers
+        self._http = None
+        if HAS_URLLIB3:
+            self._http = urllib3.PoolManager(
+                num_pools=max(4, len(config.get("mcpServers", {}))),
+                maxsize=PROXY_WORKER_THREADS,
+                retries=False,
+                timeout=urllib3.Timeout(total=30)
+            )
         
     def start_servers(self):
         """
@@ -104,42 +730,54 @@ class MCPServerManager:
         """
         mcp_servers = self.config.get("mcpServers", {})
         
+        # Snapshot the environment once; servers without env overrides share it
+        base_env = os.environ.copy()
+        
         for server_name, server_config in mcp_servers.items():
             if server_config.get("disabled", False):
                 logger.info(f"Skipping disabled server: {server_name}")
                 continue
                 
             try:
-                self._start_server(server_name, server_config)
+                self._start_server(server_name, server_config, base_env)
             except Exception as e:
                 logger.error(f"Failed to start server {server_name}: {str(e)}")
                 
-    def _start_server(self, server_name: str, server_config: Dict[str, Any]):
+    def _start_server(self, server_name: str, server_config: Dict[str, Any], base_env: Optional[Dict[str, str]] = None):
         """
         Start a single MCP server.
         
         Args:
             server_name: Name of the server
             server_config: Server configuration
+            base_env: Environment snapshot for command servers (defaults to a copy of os.environ)
         """
         server_type = server_config.get("type", "command")
         
         if server_type == "command":
-            self._start_command_server(server_name, server_config)
+            self._start_command_server(server_name, server_config, base_env)
         elif server_type == "sse":
             self._start_sse_server(server_name, server_config)
         elif server_type == "streamable_http":
             self._start_http_server(server_name, server_config)
         else:
             logger.error(f"Unknown server type '{server_type}' for server {server_name}")
+            return
             
-    def _start_command_server(self, server_name: str, server_config: Dict[str, Any]):
+        # Coalesce concurrent requests into JSON-RPC batches if the server supports them
+        if server_config.get("batchRequests", False):
+            self._batchers[server_name] = _RequestBatcher(
+                lambda payload: self._transport(server_name, payload)
+            )
+            
+    def _start_command_server(self, server_name: str, server_config: Dict[str, Any], base_env: Optional[Dict[str, str]] = None):
         """
         Start a command-based MCP server.
         
         Args:
             server_name: Name of the server
             server_config: Server configuration
+            base_env: Environment snapshot to start from (defaults to a copy of os.environ)
         """
         command = server_config.get("command")
         args = server_config.get("args", [])
@@ -149,18 +787,22 @@ class MCPServerManager:
             raise ValueError(f"No command specified for server: {server_name}")
             
         # Prepare environment variables
-        env = os.environ.copy()
+        if base_env is None:
+            base_env = os.environ.copy()
+        overrides = {}
         for key, value in env_vars.items():
             # Handle environment variable substitution
-            if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-                env_var_name = value[2:-1]
-                if env_var_name in os.environ:
-                    env[key] = os.environ[env_var_name]
+            match = _ENV_REF_RE.fullmatch(value) if isinstance(value, str) else None
+            if match:
+                env_var_name = match.group(1)
+                if env_var_name in base_env:
+                    overrides[key] = base_env[env_var_name]
                 else:
                     logger.warning(f"Environment variable not found: {env_var_name}")
-                    env[key] = value
+                    overrides[key] = value
             else:
-                env[key] = str(value)
+                overrides[key] = str(value)
+        env = {**base_env, **overrides} if overrides else base_env
         
         # Start the process
         cmd = [command] + args
@@ -171,20 +813,19 @@ class MCPServerManager:
             env=env,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True,
-            bufsize=0  # Unbuffered
+            stderr=subprocess.PIPE
         )
         
-        # Store server info
-        self.servers[server_name] = {
-            "type": "command",
-            "config": server_config,
-            "process": process,
-            "start_time": time.time()
-        }
+        channel = _CommandChannel(server_name, process, server_config.get("timeout", 60))
+        self._pipe_reader.register(channel)
         
+        # Store server info
+        self.server_types[server_name] = "command"
+        self.server_configs[server_name] = server_config
         self.processes[server_name] = process
+        self.channels[server_name] = channel
+        self.start_times[server_name] = time.time()
+        
         logger.info(f"Command server started: {server_name} (PID: {process.pid})")
         
     def _start_sse_server(self, server_name: str, server_config: Dict[str, Any]):
@@ -204,13 +845,11 @@ class MCPServerManager:
         logger.info(f"Registering SSE server: {server_name} - {url}")
         
         # Store server info
-        self.servers[server_name] = {
-            "type": "sse",
-            "config": server_config,
-            "url": url,
-            "headers": headers,
-            "start_time": time.time()
-        }
+        self.server_types[server_name] = "sse"
+        self.server_configs[server_name] = server_config
+        self.urls[server_name] = url
+        self.headers[server_name] = headers
+        self.start_times[server_name] = time.time()
         
         logger.info(f"SSE server registered: {server_name}")
         
@@ -231,17 +870,15 @@ class MCPServerManager:
         logger.info(f"Registering HTTP server: {server_name} - {url}")
         
         # Store server info
-        self.servers[server_name] = {
-            "type": "streamable_http",
-            "config": server_config,
-            "url": url,
-            "headers": headers,
-            "start_time": time.time()
-        }
+        self.server_types[server_name] = "streamable_http"
+        self.server_configs[server_name] = server_config
+        self.urls[server_name] = url
+        self.headers[server_name] = headers
+        self.start_times[server_name] = time.time()
         
         logger.info(f"HTTP server registered: {server_name}")
         
-    def call_tool(self, server_name: str, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    def call_tool(self, server_name: str, tool_name: str, arguments: Dict[str, Any], raw: bool = False) -> Union[bytes, Dict[str, Any]]:
         """
         Call a tool on the specified MCP server.
         
@@ -249,26 +886,25 @@ class MCPServerManager:
             server_name: Name of the server
             tool_name: Name of the tool to call
             arguments: Tool arguments
+            raw: Return the result as JSON bytes, without parsing it where possible
             
         Returns:
             Tool response
         """
-        if server_name not in self.servers:
+        server_type = self.server_types.get(server_name)
+        if server_type is None:
             raise ValueError(f"Server not found: {server_name}")
             
-        server_info = self.servers[server_name]
-        server_type = server_info["type"]
-        
         if server_type == "command":
-            return self._call_command_tool(server_name, tool_name, arguments)
+            return self._call_command_tool(server_name, tool_name, arguments, raw)
         elif server_type == "sse":
-            return self._call_sse_tool(server_name, tool_name, arguments)
+            return self._call_sse_tool(server_name, tool_name, arguments, raw)
         elif server_type == "streamable_http":
-            return self._call_http_tool(server_name, tool_name, arguments)
+            return self._call_http_tool(server_name, tool_name, arguments, raw)
         else:
             raise ValueError(f"Unknown server type: {server_type}")
             
-    def _call_command_tool(self, server_name: str, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    def _call_command_tool(self, server_name: str, tool_name: str, arguments: Dict[str, Any], raw: bool = False) -> Union[bytes, Dict[str, Any]]:
         """
         Call a tool on a command-based MCP server.
         
@@ -276,17 +912,14 @@ class MCPServerManager:
             server_name: Name of the server
             tool_name: Name of the tool to call
             arguments: Tool arguments
+            raw: Return the result as JSON bytes
             
         Returns:
             Tool response
         """
-        server_info = self.servers[server_name]
-        process = server_info["process"]
-        
         # Create MCP request
         request = {
-            "jsonrpc": "2.0",
-            "id": f"{server_name}_{tool_name}_{int(time.time() * 1000)}",
+            "id": next(self._request_ids),
             "method": "tools/call",
             "params": {
                 "name": tool_name,
@@ -296,28 +929,15 @@ class MCPServerManager:
         
         try:
             # Send request to process
-            request_json = json.dumps(request) + "\n"
-            process.stdin.write(request_json)
-            process.stdin.flush()
-            
-            # Read response from process
-            response_line = process.stdout.readline()
-            if not response_line:
-                raise Exception("No response from MCP server")
-                
-            response = json.loads(response_line.strip())
-            
-            # Check for errors
-            if "error" in response:
-                raise Exception(f"MCP server error: {response['error']}")
-                
-            return response.get("result", {})
+            response = self._send_request(server_name, request)
+            return _jsonrpc_raw_result(response) if raw else _jsonrpc_result(response)
             
         except Exception as e:
             logger.error(f"Error calling tool {tool_name} on server {server_name}: {str(e)}")
             raise
             
-    def _call_sse_tool(self, server_name: str, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+
+    def _call_sse_tool(self, server_name: str, tool_name: str, arguments: Dict[str, Any], raw: bool = False) -> Union[bytes, Dict[str, Any]]:
         """
         Call a tool on an SSE-based MCP server.
         
@@ -325,18 +945,14 @@ class MCPServerManager:
             server_name: Name of the server
             tool_name: Name of the tool to call
             arguments: Tool arguments
+            raw: Return the result as JSON bytes
             
         Returns:
             Tool response
         """
-        server_info = self.servers[server_name]
-        url = server_info["url"]
-        headers = server_info["headers"]
-        
         # Create MCP request
         request = {
-            "jsonrpc": "2.0",
-            "id": f"{server_name}_{tool_name}_{int(time.time() * 1000)}",
+            "id": next(self._request_ids),
             "method": "tools/call",
             "params": {
                 "name": tool_name,
@@ -346,31 +962,14 @@ class MCPServerManager:
         
         try:
             # Send request to SSE endpoint
-            req_headers = headers.copy()
-            req_headers["Content-Type"] = "application/json"
-            
-            req = Request(
-                url,
-                data=json.dumps(request).encode('utf-8'),
-                headers=req_headers,
-                method="POST"
-            )
-            
-            with urlopen(req, timeout=30) as response:
-                response_data = response.read().decode('utf-8')
-                response_json = json.loads(response_data)
-                
-                # Check for errors
-                if "error" in response_json:
-                    raise Exception(f"MCP server error: {response_json['error']}")
-                    
-                return response_json.get("result", {})
-                
+            response = self._send_request(server_name, request)
+            return _jsonrpc_raw_result(response) if raw else _jsonrpc_result(response)
         except Exception as e:
             logger.error(f"Error calling tool {tool_name} on SSE server {server_name}: {str(e)}")
             raise
             
-    def _call_http_tool(self, server_name: str, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+
+    def _call_http_tool(self, server_name: str, tool_name: str, arguments: Dict[str, Any], raw: bool = False) -> Union[bytes, Dict[str, Any]]:
         """
         Call a tool on a streamable HTTP MCP server.
         
@@ -378,18 +977,14 @@ class MCPServerManager:
             server_name: Name of the server
             tool_name: Name of the tool to call
             arguments: Tool arguments
+            raw: Return the result as JSON bytes
             
         Returns:
             Tool response
         """
-        server_info = self.servers[server_name]
-        url = server_info["url"]
-        headers = server_info["headers"]
-        
         # Create MCP request
         request = {
-            "jsonrpc": "2.0",
-            "id": f"{server_name}_{tool_name}_{int(time.time() * 1000)}",
+            "id": next(self._request_ids),
             "method": "tools/call",
             "params": {
                 "name": tool_name,
@@ -399,55 +994,132 @@ class MCPServerManager:
         
         try:
             # Send request to HTTP endpoint
-            req_headers = headers.copy()
-            req_headers["Content-Type"] = "application/json"
-            
-            req = Request(
-                url,
-                data=json.dumps(request).encode('utf-8'),
-                headers=req_headers,
-                method="POST"
-            )
-            
-            with urlopen(req, timeout=30) as response:
-                response_data = response.read().decode('utf-8')
-                response_json = json.loads(response_data)
-                
-                # Check for errors
-                if "error" in response_json:
-                    raise Exception(f"MCP server error: {response_json['error']}")
-                    
-                return response_json.get("result", {})
-                
+            response = self._send_request(server_name, request)
+            return _jsonrpc_raw_result(response) if raw else _jsonrpc_result(response)
         except Exception as e:
             logger.error(f"Error calling tool {tool_name} on HTTP server {server_name}: {str(e)}")
             raise
             
-    def list_tools(self, server_name: str) -> List[Dict[str, Any]]:
+
+    def _send_request(self, server_name: str, request: Dict[str, Any]) -> Union[bytes, Dict[str, Any]]:
+        """
+        Send a JSON-RPC request to an MCP server, batching it if enabled.
+        
+        Args:
+            server_name: Name of the server
+            request: JSON-RPC request
+            
+        Returns:
+            The JSON-RPC response, as raw bytes or parsed
+        """
+        batcher = self._batchers.get(server_name)
+        if batcher is not None:
+            return batcher.submit(request)
+        return self._transport(server_name, request)
+        
+    def _transport(self, server_name: str, payload: Any) -> Any:
+        """
+        Send a JSON-RPC request or batch to an MCP server over its transport.
+        
+        Args:
+            server_name: Name of the server
+            payload: JSON-RPC request object or batch array
+            
+        Returns:
+            The JSON-RPC response or batch of responses, as raw bytes or parsed
+        """
+        if self.server_types[server_name] == "command":
+            return self._exchange_command(server_name, payload)
+        return self._post_json(server_name, payload)
+        
+    def _exchange_command(self, server_name: str, payload: Any) -> Any:
+        """
+        Send a JSON-RPC payload to a command server and wait for its response.
+        
+        Args:
+            server_name: Name of the server
+            payload: JSON-RPC request object or batch array
+            
+        Returns:
+            The raw response line, or the parsed response if it had to be parsed to route it
+        """
+        return self.channels[server_name].exchange(payload)
+        
+    def _post_json(self, server_name: str, payload: Any) -> Any:
+        """
+        POST a JSON-RPC payload to an SSE or streamable HTTP MCP server.
+        
+        Args:
+            server_name: Name of the server
+            payload: JSON-RPC request object or batch array
+            
+        Returns:
+            The raw response body
+            
+        Raises:
+            HTTPError: If the server responded with an HTTP error status
+        """
+        url = self.urls[server_name]
+        req_headers = self.headers[server_name].copy()
+        req_headers["Content-Type"] = "application/json"
+        body = _encode_payload(payload)
+        
+        if self._http is not None:
+            response = self._http.request("POST", url, body=body, headers=req_headers)
+            if response.status >= 400:
+                raise HTTPError(url, response.status, response.reason, response.headers, None)
+            return response.data
+            
+        req = Request(url, data=body, headers=req_headers, method="POST")
+        with urlopen(req, timeout=30) as response:
+            return response.read()
+            
+
+    def list_tools(self, server_name: str, refresh: bool = False) -> List[Dict[str, Any]]:
         """
         List available tools for the specified MCP server.
         
+        Tool lists are cached for TOOLS_CACHE_TTL seconds. The cache entry is
+        dropped when a command server's process has exited.
+        
         Args:
             server_name: Name of the server
+            refresh: Bypass the cache and query the server
             
         Returns:
             List of available tools
         """
-        if server_name not in self.servers:
+        server_type = self.server_types.get(server_name)
+        if server_type is None:
             raise ValueError(f"Server not found: {server_name}")
             
-        server_info = self.servers[server_name]
-        server_type = server_info["type"]
-        
+        process = self.processes.get(server_name)
+        if process is not None and process.poll() is not None:
+            refresh = True
+            
+        if not refresh:
+            with self._tools_lock:
+                cached = self._tools_cache.get(server_name)
+            if cached is not None and time.monotonic() - cached[0] < TOOLS_CACHE_TTL:
+                return cached[1]
+                
         if server_type == "command":
-            return self._list_command_tools(server_name)
+            tools = self._list_command_tools(server_name)
         elif server_type == "sse":
-            return self._list_sse_tools(server_name)
+            tools = self._list_sse_tools(server_name)
         elif server_type == "streamable_http":
-            return self._list_http_tools(server_name)
+            tools = self._list_http_tools(server_name)
         else:
             raise ValueError(f"Unknown server type: {server_type}")
             
+        # Failed lookups return an empty list, so only cache non-empty results
+        with self._tools_lock:
+            if tools:
+                self._tools_cache[server_name] = (time.monotonic(), tools)
+            else:
+                self._tools_cache.pop(server_name, None)
+        return tools
+            
     def _list_command_tools(self, server_name: str) -> List[Dict[str, Any]]:
         """
         List tools for a command-based MCP server.
@@ -458,39 +1130,21 @@ class MCPServerManager:
         Returns:
             List of available tools
         """
-        server_info = self.servers[server_name]
-        process = server_info["process"]
-        
         # Create MCP request
         request = {
-            "jsonrpc": "2.0",
-            "id": f"{server_name}_list_tools_{int(time.time() * 1000)}",
+            "id": next(self._request_ids),
             "method": "tools/list"
         }
         
         try:
             # Send request to process
-            request_json = json.dumps(request) + "\n"
-            process.stdin.write(request_json)
-            process.stdin.flush()
-            
-            # Read response from process
-            response_line = process.stdout.readline()
-            if not response_line:
-                raise Exception("No response from MCP server")
-                
-            response = json.loads(response_line.strip())
-            
-            # Check for errors
-            if "error" in response:
-                raise Exception(f"MCP server error: {response['error']}")
-                
-            return response.get("result", {}).get("tools", [])
+            return _jsonrpc_result(self._send_request(server_name, request)).get("tools", [])
             
         except Exception as e:
             logger.error(f"Error listing tools for server {server_name}: {str(e)}")
             return []
             
+
     def _list_sse_tools(self, server_name: str) -> List[Dict[str, Any]]:
         """
         List tools for an SSE-based MCP server.
@@ -501,43 +1155,20 @@ class MCPServerManager:
         Returns:
             List of available tools
         """
-        server_info = self.servers[server_name]
-        url = server_info["url"]
-        headers = server_info["headers"]
-        
         # Create MCP request
         request = {
-            "jsonrpc": "2.0",
-            "id": f"{server_name}_list_tools_{int(time.time() * 1000)}",
+            "id": next(self._request_ids),
             "method": "tools/list"
         }
         
         try:
             # Send request to SSE endpoint
-            req_headers = headers.copy()
-            req_headers["Content-Type"] = "application/json"
-            
-            req = Request(
-                url,
-                data=json.dumps(request).encode('utf-8'),
-                headers=req_headers,
-                method="POST"
-            )
-            
-            with urlopen(req, timeout=30) as response:
-                response_data = response.read().decode('utf-8')
-                response_json = json.loads(response_data)
-                
-                # Check for errors
-                if "error" in response_json:
-                    raise Exception(f"MCP server error: {response_json['error']}")
-                    
-                return response_json.get("result", {}).get("tools", [])
-                
+            return _jsonrpc_result(self._send_request(server_name, request)).get("tools", [])
         except Exception as e:
             logger.error(f"Error listing tools for SSE server {server_name}: {str(e)}")
             return []
             
+
     def _list_http_tools(self, server_name: str) -> List[Dict[str, Any]]:
         """
         List tools for a streamable HTTP MCP server.
@@ -548,43 +1179,20 @@ class MCPServerManager:
         Returns:
             List of available tools
         """
-        server_info = self.servers[server_name]
-        url = server_info["url"]
-        headers = server_info["headers"]
-        
         # Create MCP request
         request = {
-            "jsonrpc": "2.0",
-            "id": f"{server_name}_list_tools_{int(time.time() * 1000)}",
+            "id": next(self._request_ids),
             "method": "tools/list"
         }
         
         try:
             # Send request to HTTP endpoint
-            req_headers = headers.copy()
-            req_headers["Content-Type"] = "application/json"
-            
-            req = Request(
-                url,
-                data=json.dumps(request).encode('utf-8'),
-                headers=req_headers,
-                method="POST"
-            )
-            
-            with urlopen(req, timeout=30) as response:
-                response_data = response.read().decode('utf-8')
-                response_json = json.loads(response_data)
-                
-                # Check for errors
-                if "error" in response_json:
-                    raise Exception(f"MCP server error: {response_json['error']}")
-                    
-                return response_json.get("result", {}).get("tools", [])
-                
+            return _jsonrpc_result(self._send_request(server_name, request)).get("tools", [])
         except Exception as e:
             logger.error(f"Error listing tools for HTTP server {server_name}: {str(e)}")
             return []
             
+
     def get_server_status(self) -> Dict[str, Dict[str, Any]]:
         """
         Get status of all servers.
@@ -593,26 +1201,25 @@ class MCPServerManager:
             Dictionary with server status information
         """
         status = {}
+        now = time.time()
         
-        for server_name, server_info in self.servers.items():
-            server_type = server_info["type"]
-            
-            if server_type == "command":
-                process = server_info.get("process")
-                is_running = process and process.poll() is None
-                pid = process.pid if process else None
+        for server_name, server_type, server_config, start_time in zip(
+            self.server_types, self.server_types.values(), self.server_configs.values(), self.start_times.values()
+        ):
+            process = self.processes.get(server_name)
+            if process is not None:
+                is_running = process.poll() is None
+                pid = process.pid
             else:
                 is_running = True  # SSE and HTTP servers are external
                 pid = None
                 
-            uptime = time.time() - server_info["start_time"]
-            
             status[server_name] = {
                 "type": server_type,
                 "running": is_running,
-                "uptime": uptime,
+                "uptime": now - start_time,
                 "pid": pid,
-                "config": server_info["config"]
+                "config": server_config
             }
             
         return status
@@ -621,6 +1228,14 @@ class MCPServerManager:
         """
         Stop all servers.
         """
+        with self._tools_lock:
+            self._tools_cache.clear()
+        self._batchers.clear()
+            
+        # Close pooled backend connections
+        if self._http is not None:
+            self._http.clear()
+            
         for server_name, process in self.processes.items():
             try:
                 logger.info(f"Stopping server: {server_name}")
@@ -667,9 +1282,9 @@ class MCPProxyServer:
         Load the configuration from the specified file.
         """
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = json.load(f)
-                logger.info(f"Configuration loaded from {self.config_path}")
+            with open(self.config_path, 'rb') as f:
+                self.config = _json_loads(f.read())
+            logger.info(f"Configuration loaded from {self.config_path}")
         except (json.JSONDecodeError, FileNotFoundError) as e:
             logger.error(f"Failed to load configuration: {str(e)}")
             sys.exit(1)
@@ -684,15 +1299,18 @@ class MCPProxyServer:
         
         # Create HTTP server
         handler = self._create_request_handler()
-        self.httpd = socketserver.ThreadingTCPServer((self.host, self.port), handler)
-        self.httpd.daemon_threads = True
+        self.httpd = PooledTCPServer((self.host, self.port), handler)
         
         logger.info(f"MCP proxy server started at http://{self.host}:{self.port}")
         
-        # Set up signal handlers for graceful shutdown
+        # Set up signal handlers for graceful shutdown. The handler runs on the
+        # thread inside serve_forever, which httpd.shutdown() would wait on
+        # forever, so unwind out of the loop and shut down in the finally below
         def signal_handler(sig, frame):
+            if self.shutdown_requested:
+                return
             logger.info(f"Received signal {sig}, shutting down...")
-            self.shutdown()
+            raise KeyboardInterrupt
             
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
@@ -735,85 +1353,110 @@ class MCPProxyServer:
         """
         proxy_server = self
         
+        # The server set is fixed once started, so endpoint paths map straight to server names
+        server_routes = {f"/{name}": name for name in self.server_manager.server_types}
+        
+        # The server information document cannot change either, so encode it once
+        root_body = _json_dumps({
+            "name": "MCP Proxy Server",
+            "version": "1.0.0",
+            "servers": list(self.server_manager.server_types.keys()),
+            "endpoints": list(server_routes)
+        }, indent=True)
+        
         class MCPProxyHandler(BaseHTTPRequestHandler):
             def do_GET(self):
-                if self.path == '/':
+                url = urlparse(self.path)
+                if url.path == '/':
                     # Return server information
-                    self._send_json_response({
-                        "name": "MCP Proxy Server",
-                        "version": "1.0.0",
-                        "servers": list(proxy_server.server_manager.servers.keys()),
-                        "endpoints": [f"/{name}" for name in proxy_server.server_manager.servers.keys()]
-                    })
-                elif self.path == '/status':
+                    self._send_body(root_body)
+                elif url.path == '/status':
                     # Return server status
                     status = proxy_server.server_manager.get_server_status()
                     self._send_json_response(status)
-                elif self.path.startswith('/') and len(self.path) > 1:
+                elif url.path.startswith('/') and len(url.path) > 1:
                     # Handle server-specific GET requests (list tools)
-                    server_name = self.path[1:].split('/')[0]
-                    
-                    if server_name in proxy_server.server_manager.servers:
-                        try:
-                            tools = proxy_server.server_manager.list_tools(server_name)
-                            self._send_json_response({
-                                "server": server_name,
-                                "tools": tools
-                            })
-                        except Exception as e:
-                            self._send_error_response(500, f"Error listing tools: {str(e)}")
-                    else:
-                        self._send_error_response(404, f"Server not found: {server_name}")
+                    server_name = self._route_server(url.path)
+                    if server_name is None:
+                        return
+                        
+                    try:
+                        refresh = parse_qs(url.query).get('refresh') == ['1']
+                        tools = proxy_server.server_manager.list_tools(server_name, refresh=refresh)
+                        self._send_json_response({
+                            "server": server_name,
+                            "tools": tools
+                        })
+                    except Exception as e:
+                        self._send_error_response(500, f"Error listing tools: {str(e)}")
                 else:
                     self._send_error_response(404, "Not found")
                     
             def do_POST(self):
                 if self.path.startswith('/') and len(self.path) > 1:
                     # Handle tool calls
-                    path_parts = self.path[1:].split('/')
-                    server_name = path_parts[0]
-                    
-                    if server_name in proxy_server.server_manager.servers:
-                        try:
-                            # Read request body
-                            content_length = int(self.headers.get('Content-Length', 0))
-                            request_body = self.rfile.read(content_length).decode('utf-8')
-                            request_data = json.loads(request_body)
-                            
-                            # Extract tool name and arguments
-                            tool_name = request_data.get('tool')
-                            arguments = request_data.get('arguments', {})
-                            
-                            if not tool_name:
-                                self._send_error_response(400, "Missing 'tool' parameter")
-                                return
-                                
-                            # Call the tool
-                            result = proxy_server.server_manager.call_tool(server_name, tool_name, arguments)
-                            self._send_json_response({
-                                "server": server_name,
-                                "tool": tool_name,
-                                "result": result
-                            })
+                    server_name = self._route_server(self.path)
+                    if server_name is None:
+                        return
+                        
+                    try:
+                        # Read request body
+                        content_length = int(self.headers.get('Content-Length', 0))
+                        request_data = _json_loads(self.rfile.read(content_length))
+                        
+                        # Extract tool name and arguments
+                        tool_name = request_data.get('tool')
+                        arguments = request_data.get('arguments', {})
+                        
+                        if not tool_name:
+                            self._send_error_response(400, "Missing 'tool' parameter")
+                            return
                             
-                        except json.JSONDecodeError:
-                            self._send_error_response(400, "Invalid JSON in request body")
-                        except Exception as e:
-                            self._send_error_response(500, f"Error calling tool: {str(e)}")
-                    else:
-                        self._send_error_response(404, f"Server not found: {server_name}")
+                        # Call the tool and wrap its result bytes without re-encoding them
+                        result = proxy_server.server_manager.call_tool(server_name, tool_name, arguments, raw=True)
+                        self._send_body(b"".join((
+                            b'{\n  "server": ', _json_dumps(server_name),
+                            b',\n  "tool": ', _json_dumps(tool_name),
+                            b',\n  "result": ', result,
+                            b"\n}"
+                        )))
+                        
+                    except json.JSONDecodeError:
+                        self._send_error_response(400, "Invalid JSON in request body")
+                    except Exception as e:
+                        self._send_error_response(500, f"Error calling tool: {str(e)}")
                 else:
                     self._send_error_response(404, "Not found")
                     
+            def _route_server(self, path: str) -> Optional[str]:
+                """Resolve the server addressed by a request path, sending a 404 if there is none."""
+                server_name = server_routes.get(path)
+                if server_name is not None:
+                    return server_name
+                    
+                # Paths below a server endpoint address the same server
+                end = path.find('/', 1)
+                server_name = path[1:end] if end != -1 else path[1:]
+                if server_name in proxy_server.server_manager.server_types:
+                    return server_name
+                    
+                self._send_error_response(404, f"Server not found: {server_name}")
+                return None
+                
             def _send_json_response(self, data: Dict[str, Any], status_code: int = 200):
                 """Send a JSON response."""
-                self.send_response(status_code)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-                self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-                self.end_headers()
-                self.wfile.write(json.dumps(data, indent=2).encode('utf-8'))
+                self._send_body(_json_dumps(data, indent=True), status_code)
+                
+            def _send_body(self, body: bytes, status_code: int = 200):
+                """Send an encoded JSON body."""
+                # Write status line, headers and body with a single write
+                self.log_request(status_code)
+                self.wfile.write(b"".join((
+                    _STATUS_LINES[status_code],
+                    _JSON_HEADERS,
+                    b"Content-Length: %d\r\n\r\n" % len(body),
+                    body
+                )))
                 
             def _send_error_response(self, status_code: int, message: str):
                 """Send an error response."""
@@ -826,11 +1469,8 @@ class MCPProxyServer:
                 
             def do_OPTIONS(self):
                 """Handle CORS preflight requests."""
-                self.send_response(200)
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-                self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-                self.end_headers()
+                self.log_request(200)
+                self.wfile.write(_OPTIONS_RESPONSE)
                 
             def log_message(self, format, *args):
                 logger.info(f"{self.client_address[0]} - {format % args}")
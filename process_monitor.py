@@ -16,22 +16,57 @@ import sys
 import json
 import time
 import signal
+import re
 import logging
-import argparse
+import shutil
+import copy
+import functools
 import subprocess
 import threading
+import selectors
+import collections
+import heapq
 from typing import Dict, Any, List, Tuple, Optional
 from pathlib import Path
 
+# Use orjson for log serialization when available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Configure structured logging
 LOG_FORMAT = os.environ.get("LOG_FORMAT", "json").lower()
 
 if LOG_FORMAT == "json":
-    import json
+    # Optional fields copied from records that carry them
+    _LOG_EXTRA_FIELDS = ("process_name", "process_id")
+    
+    # Pick the serializer once rather than per record
+    if HAS_ORJSON:
+        def _log_dumps(log_record):
+            return orjson.dumps(log_record).decode('utf-8')
+    else:
+        _log_dumps = json.dumps
     
     class JsonFormatter(logging.Formatter):
         """JSON formatter for structured logging."""
         
+        _time_cache = (None, "")  # (whole second, formatted time without msecs)
+        
+        def formatTime(self, record, datefmt=None):
+            if datefmt:
+                return super().formatTime(record, datefmt)
+                
+            # Reuse the formatted time for records logged within the same second
+            second = int(record.created)
+            cached = self._time_cache
+            if cached[0] != second:
+                cached = (second, time.strftime(self.default_time_format, self.converter(record.created)))
+                self._time_cache = cached
+            return self.default_msec_format % (cached[1], record.msecs)
+            
         def format(self, record):
             log_record = {
                 "timestamp": self.formatTime(record, self.datefmt),
@@ -40,16 +75,15 @@ if LOG_FORMAT == "json":
                 "message": record.getMessage(),
             }
             
-            if hasattr(record, "process_name"):
-                log_record["process_name"] = record.process_name
-                
-            if hasattr(record, "process_id"):
-                log_record["process_id"] = record.process_id
-                
+            attrs = record.__dict__
+            for field in _LOG_EXTRA_FIELDS:
+                if field in attrs:
+                    log_record[field] = attrs[field]
+                    
             if record.exc_info:
                 log_record["exception"] = self.formatException(record.exc_info)
                 
-            return json.dumps(log_record)
+            return _log_dumps(log_record)
     
     formatter = JsonFormatter()
 else:
@@ -73,6 +107,210 @@ DEFAULT_CHECK_INTERVAL = 10  # seconds
 DEFAULT_MAX_RESTARTS = 3  # maximum number of restarts per process
 DEFAULT_RESTART_DELAY = 5  # seconds to wait before restarting a process
 
+# Units used by /proc/<pid>/stat and /proc/<pid>/statm
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+PAGE_SIZE = os.sysconf("SC_PAGESIZE")
+PROC_READ_SIZE = 4096  # bytes; larger than any stat or statm record
+PIPE_READ_SIZE = 65536  # bytes read from a server output pipe at a time
+MAX_LINE_SIZE = 65536  # bytes of an unterminated output line buffered before it is logged as is
+
+# Matches env values that reference another variable, e.g. "${API_KEY}"
+_ENV_REF_RE = re.compile(r"\$\{([^}]+)\}")
+
+# Launch MCP servers with posix_spawn where available, avoiding fork of the monitor
+HAS_POSIX_SPAWN = hasattr(os, "posix_spawn")
+if HAS_POSIX_SPAWN:
+    # Signals Python ignores, restored to their defaults as Popen does
+    _SPAWN_SIGDEF = tuple(
+        getattr(signal, name) for name in ("SIGPIPE", "SIGXFSZ") if hasattr(signal, name)
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path: str, dev: int, ino: int, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Read and parse a configuration file.
+    
+    Results are cached per (path, device, inode, mtime, size), so an unchanged
+    file is parsed only once however often it is loaded, while a file swapped
+    in by rename is re-read even with the same mtime and size. The result is
+    shared by every caller; copy it before use.
+    
+    Args:
+        path: Path to the configuration file
+        dev: Device of the file
+        ino: Inode of the file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        
+    Returns:
+        The parsed configuration
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _parse_proc_stat(buf: bytes) -> Tuple[int, int]:
+    """
+    Parse CPU time and start time from the contents of /proc/<pid>/stat.
+    
+    Args:
+        buf: Contents of the stat file
+        
+    Returns:
+        Tuple of (utime + stime, starttime), both in clock ticks
+    """
+    # The command name may contain spaces and parentheses, so split after the last ')'
+    fields = buf[buf.rindex(b")") + 2:].split()
+    return int(fields[11]) + int(fields[12]), int(fields[19])
+
+
+def _parse_proc_statm(buf: bytes) -> int:
+    """
+    Parse the resident set size from the contents of /proc/<pid>/statm.
+    
+    Args:
+        buf: Contents of the statm file
+        
+    Returns:
+        Resident set size in bytes
+    """
+    return int(buf.split()[1]) * PAGE_SIZE
+
+
+@functools.lru_cache(maxsize=1)
+def _devnull_fd() -> int:
+    """
+    Open the /dev/null descriptor shared by the output of every MCP server process.
+    
+    It is opened on the first spawn rather than at import, so modules that only
+    import the process monitor hold no extra descriptor.
+    
+    Returns:
+        A close-on-exec descriptor for /dev/null
+    """
+    return os.open(os.devnull, os.O_RDWR | os.O_CLOEXEC)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_mem_total() -> int:
+    """
+    Read total system memory from /proc/meminfo.
+    
+    Returns:
+        Total memory in bytes
+    """
+    with open("/proc/meminfo", "rb") as f:
+        for line in f:
+            key, _, value = line.partition(b":")
+            if key == b"MemTotal":
+                return int(value.split()[0]) * 1024
+    return 0
+
+
+class SpawnedProcess:
+    """
+    Popen-compatible handle for a process started with os.posix_spawn.
+    """
+    
+    def __init__(self, pid: int, args: List[str]):
+        """
+        Initialize the process handle.
+        
+        Args:
+            pid: Process ID
+            args: Command line the process was started with
+        """
+        self.pid = pid
+        self.args = args
+        self.returncode = None
+        self._wait_lock = threading.Lock()
+        
+    def poll(self) -> Optional[int]:
+        """
+        Check whether the process has exited without blocking.
+        
+        Returns:
+            The exit code, or None if the process is still running
+        """
+        return self._reap(os.WNOHANG)
+        
+    def wait(self, timeout: Optional[float] = None) -> int:
+        """
+        Wait for the process to exit.
+        
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait forever
+            
+        Returns:
+            The exit code
+            
+        Raises:
+            subprocess.TimeoutExpired: If the process is still running after timeout
+        """
+        if timeout is None:
+            while self._reap(0) is None:
+                pass
+            return self.returncode
+            
+        # Poll with a growing delay, as Popen.wait does
+        deadline = time.monotonic() + timeout
+        delay = 0.0005
+        while self.poll() is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(self.args, timeout)
+            delay = min(delay * 2, remaining, 0.05)
+            time.sleep(delay)
+        return self.returncode
+        
+    def send_signal(self, sig: int):
+        """
+        Send a signal to the process unless it has already been reaped.
+        
+        Args:
+            sig: Signal number
+        """
+        if self.poll() is None:
+            os.kill(self.pid, sig)
+            
+    def terminate(self):
+        """Send SIGTERM to the process."""
+        self.send_signal(signal.SIGTERM)
+        
+    def kill(self):
+        """Send SIGKILL to the process."""
+        self.send_signal(signal.SIGKILL)
+        
+    def _reap(self, options: int) -> Optional[int]:
+        """
+        Collect the exit status of the process.
+        
+        Args:
+            options: Flags for os.waitpid
+            
+        Returns:
+            The exit code, or None if the process is still running
+        """
+        if self.returncode is not None:
+            return self.returncode
+        if not self._wait_lock.acquire(blocking=not options & os.WNOHANG):
+            return None  # Another thread is reaping the process
+        try:
+            if self.returncode is None:
+                pid, status = os.waitpid(self.pid, options)
+                if pid == self.pid:
+                    self.returncode = os.waitstatus_to_exitcode(status)
+        except ChildProcessError:
+            # Reaped elsewhere; the exit status is lost, as with Popen
+            self.returncode = 0
+        finally:
+            self._wait_lock.release()
+        return self.returncode
+
 
 class ProcessMonitor:
     """
@@ -97,8 +335,17 @@ class ProcessMonitor:
         self.config = None
         self.processes = {}  # Dictionary of process name -> process object
         self.restart_counts = {}  # Dictionary of process name -> restart count
+        self._server_envs = {}  # Dictionary of process name -> resolved environment
+        self._server_configs = {}  # Dictionary of process name -> server configuration
         self.running = False
         self.monitor_thread = None
+        self._exit_selector = selectors.DefaultSelector()  # pidfds of monitored processes
+        self._exited_queue = collections.deque()  # Names of processes that may have exited
+        self._unwatched = set()  # Names of processes without a pidfd, polled each interval
+        self._restart_heap = []  # (monotonic restart time, process name) of pending restarts
+        self._restart_event = threading.Event()  # Set each time a process is restarted
+        self._output_selector = selectors.DefaultSelector()  # stdout/stderr pipes of logged processes
+        self._output_thread = None
         
         # Load initial configuration
         self._load_config()
@@ -111,14 +358,26 @@ class ProcessMonitor:
             The loaded configuration as a dictionary
         """
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = json.load(f)
-                logger.info(f"Configuration loaded from {self.config_path}")
-                return self.config
+            st = os.stat(self.config_path)
+            # Copy the shared parse so changes to this monitor's config stay local
+            self.config = copy.deepcopy(
+                _load_config_cached(self.config_path, st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+            )
+            self._server_envs.clear()
+            self._server_configs = self.config.get("mcpServers", {})
+            logger.info(f"Configuration loaded from {self.config_path}")
+            return self.config
         except (json.JSONDecodeError, FileNotFoundError) as e:
             logger.error(f"Failed to load configuration: {str(e)}")
             return {}
             
+    @classmethod
+    def invalidate_config_cache(cls):
+        """
+        Drop cached configurations so the next load re-reads the file.
+        """
+        _load_config_cached.cache_clear()
+        
     def start_processes(self):
         """
         Start all MCP server processes defined in the configuration.
@@ -127,9 +386,7 @@ class ProcessMonitor:
             logger.error("No MCP servers configured")
             return
             
-        mcp_servers = self.config.get("mcpServers", {})
-        
-        for server_name, server_config in mcp_servers.items():
+        for server_name, server_config in self._server_configs.items():
             # Skip disabled servers
             if server_config.get("disabled", False):
                 logger.info(f"Skipping disabled server: {server_name}")
@@ -152,51 +409,45 @@ class ProcessMonitor:
         try:
             command = server_config.get("command")
             args = server_config.get("args", [])
-            env_vars = server_config.get("env", {})
             
             if not command:
                 logger.error(f"No command specified for server: {server_name}")
                 return False
                 
-            # Prepare environment variables
-            env = os.environ.copy()
-            for key, value in env_vars.items():
-                # Handle environment variable substitution
-                if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-                    env_var_name = value[2:-1]
-                    if env_var_name in os.environ:
-                        env[key] = os.environ[env_var_name]
-                    else:
-                        logger.warning(f"Environment variable not found: {env_var_name}")
-                        env[key] = value
-                else:
-                    env[key] = value
+            # Prepare environment variables once and reuse them across restarts
+            env = self._server_envs.get(server_name)
+            if env is None:
+                env = self._server_envs[server_name] = self._resolve_env(server_config)
             
             # Start the process
             cmd = [command] + args
             logger.info(f"Starting process: {server_name} - {' '.join(cmd)}")
             
-            # Use temp files for stdout and stderr to avoid resource leaks
-            stdout_file = open(os.devnull, 'w')
-            stderr_file = open(os.devnull, 'w')
-            
-            process = subprocess.Popen(
-                cmd,
-                env=env,
-                stdout=stdout_file,
-                stderr=stderr_file,
-                universal_newlines=True,
-                bufsize=1  # Line buffered
-            )
+            # Relay output to the log when requested, otherwise discard it
+            if server_config.get("logOutput", False):
+                stdout_read, stdout_write = os.pipe()
+                stderr_read, stderr_write = os.pipe()
+                try:
+                    process = self._spawn(cmd, env, stdout_write, stderr_write)
+                except Exception:
+                    os.close(stdout_read)
+                    os.close(stderr_read)
+                    raise
+                finally:
+                    os.close(stdout_write)
+                    os.close(stderr_write)
+                self._watch_output(server_name, stdout_read, "stdout")
+                self._watch_output(server_name, stderr_read, "stderr")
+            else:
+                process = self._spawn(cmd, env, _devnull_fd(), _devnull_fd())
             
-            # Store the process and file handles
+            # Store the process
             self.processes[server_name] = {
                 "process": process,
                 "command": cmd,
                 "env": env,
                 "start_time": time.time(),
-                "stdout_file": stdout_file,
-                "stderr_file": stderr_file
+                "pidfd": self._watch_exit(server_name, process)
             }
             
             # Initialize restart count
@@ -209,71 +460,258 @@ class ProcessMonitor:
             logger.error(f"Failed to start process {server_name}: {str(e)}")
             return False
             
-    def _monitor_output(self, server_name: str, pipe, pipe_name: str):
+    def _spawn(self, cmd: List[str], env: Dict[str, str], stdout_fd: int, stderr_fd: int):
         """
-        Monitor process output and log it.
+        Launch a server process.
+        
+        Uses posix_spawn where available, falling back to subprocess.Popen when
+        it is not or the command cannot be found on the process PATH.
+        
+        Args:
+            cmd: Command line to run
+            env: Process environment
+            stdout_fd: Descriptor for the process's stdout
+            stderr_fd: Descriptor for the process's stderr
+            
+        Returns:
+            A SpawnedProcess or subprocess.Popen handle
+        """
+        if HAS_POSIX_SPAWN:
+            # Search the child's PATH, as Popen does
+            executable = shutil.which(cmd[0], path=env.get("PATH", os.defpath))
+            if executable:
+                file_actions = [
+                    (os.POSIX_SPAWN_DUP2, stdout_fd, 1),
+                    (os.POSIX_SPAWN_DUP2, stderr_fd, 2)
+                ]
+                pid = os.posix_spawn(executable, cmd, env,
+                                     file_actions=file_actions,
+                                     setsigdef=_SPAWN_SIGDEF)
+                return SpawnedProcess(pid, cmd)
+                
+        return subprocess.Popen(
+            cmd,
+            env=env,
+            stdout=stdout_fd,
+            stderr=stderr_fd
+        )
+        
+    def _resolve_env(self, server_config: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Build the environment for a server process.
+        
+        Args:
+            server_config: Server configuration
+            
+        Returns:
+            The process environment with the server's variables substituted
+        """
+        env = os.environ.copy()
+        for key, value in server_config.get("env", {}).items():
+            # Handle environment variable substitution
+            match = _ENV_REF_RE.fullmatch(value) if type(value) is str else None
+            if match is None:
+                env[key] = value
+                continue
+            env_var_name = match.group(1)
+            env[key] = os.environ.get(env_var_name, value)
+            if env_var_name not in os.environ:
+                logger.warning(f"Environment variable not found: {env_var_name}")
+        return env
+        
+    def _watch_exit(self, server_name: str, process) -> Optional[int]:
+        """
+        Register a process for exit notification through a pidfd.
         
         Args:
             server_name: Name of the server
-            pipe: Process output pipe (stdout or stderr)
-            pipe_name: Name of the pipe ("stdout" or "stderr")
+            process: Process to watch
+            
+        Returns:
+            The pidfd, or None if pidfds are unavailable and the process must be polled
         """
         try:
-            for line in pipe:
-                line = line.rstrip()
+            pidfd = os.pidfd_open(process.pid)
+        except (AttributeError, OSError):
+            self._unwatched.add(server_name)
+            return None
+            
+        self._unwatched.discard(server_name)
+        self._exit_selector.register(pidfd, selectors.EVENT_READ, server_name)
+        return pidfd
+        
+    def _release_process(self, process_info: Dict[str, Any]):
+        """
+        Close the pidfd held for a process.
+        
+        Args:
+            process_info: Process information
+        """
+        pidfd = process_info.get("pidfd")
+        if pidfd is not None:
+            self._exit_selector.unregister(pidfd)
+            os.close(pidfd)
+            process_info["pidfd"] = None
+            
+    def _wait_for_exits(self, timeout: float):
+        """
+        Wait up to timeout seconds for monitored processes to exit.
+        
+        Processes with a pidfd wake the monitor as soon as they exit; processes
+        without one are polled once per wait. Names of the servers whose
+        processes may have exited are appended to the exited queue.
+        
+        Args:
+            timeout: Maximum number of seconds to wait
+        """
+        if self._exit_selector.get_map():
+            events = self._exit_selector.select(timeout=timeout)
+        else:
+            time.sleep(timeout)
+            events = []
+            
+        self._exited_queue.extend(key.data for key, _ in events)
+        self._exited_queue.extend(self._unwatched)
+        
+    def _watch_output(self, server_name: str, fd: int, pipe_name: str):
+        """
+        Register a process output pipe with the output relay thread.
+        
+        Args:
+            server_name: Name of the server
+            fd: Read end of the pipe
+            pipe_name: Name of the pipe ("stdout" or "stderr")
+        """
+        os.set_blocking(fd, False)
+        self._output_selector.register(fd, selectors.EVENT_READ, (server_name, pipe_name, bytearray()))
+        
+        # Start the relay thread with the first logged process
+        if self._output_thread is None:
+            self._output_thread = threading.Thread(target=self._relay_output, name="process-output")
+            self._output_thread.daemon = True
+            self._output_thread.start()
+            
+    def _relay_output(self):
+        """
+        Copy process output to the log, one line per record.
+        
+        A single thread drains every registered pipe as data arrives, closing
+        each pipe once its process has exited and the pipe reaches EOF. Output
+        without newlines is logged in pieces of MAX_LINE_SIZE bytes, so a chatty
+        or binary server cannot grow the buffer without bound.
+        """
+        selector = self._output_selector
+        info, error = logger.info, logger.error
+        while True:
+            for key, _ in selector.select(timeout=1.0):
+                server_name, pipe_name, pending = key.data
                 if pipe_name == "stdout":
-                    logger.info(f"[{server_name}] {line}")
+                    log, level = info, logging.INFO
                 else:
-                    logger.error(f"[{server_name}] {line}")
-        except Exception as e:
-            logger.error(f"Error monitoring {pipe_name} for {server_name}: {str(e)}")
-            
+                    log, level = error, logging.ERROR
+                try:
+                    chunk = os.read(key.fd, PIPE_READ_SIZE)
+                except BlockingIOError:
+                    continue
+                except OSError as e:
+                    error(f"Error monitoring {pipe_name} for {server_name}: {str(e)}")
+                    chunk = b""
+                    
+                if not chunk:
+                    # Flush a final unterminated line and release the pipe
+                    if pending and logger.isEnabledFor(level):
+                        log(f"[{server_name}] {pending.decode('utf-8', 'replace').rstrip()}")
+                    selector.unregister(key.fd)
+                    os.close(key.fd)
+                    continue
+                    
+                pending += chunk
+                end = pending.rfind(b"\n")
+                if end >= 0:
+                    # Only decode and format lines that will actually be logged
+                    if logger.isEnabledFor(level):
+                        for line in pending[:end].split(b"\n"):
+                            log(f"[{server_name}] {line.decode('utf-8', 'replace').rstrip()}")
+                    del pending[:end + 1]
+                    
+                # Flush an overlong partial line rather than keep buffering it
+                while len(pending) >= MAX_LINE_SIZE:
+                    if logger.isEnabledFor(level):
+                        log(f"[{server_name}] {pending[:MAX_LINE_SIZE].decode('utf-8', 'replace')}")
+                    del pending[:MAX_LINE_SIZE]
+                
     def monitor_processes(self):
         """
         Monitor all processes and restart them if they fail.
         """
         while self.running:
-            for server_name, process_info in list(self.processes.items()):
-                process = process_info["process"]
+            self._start_due_restarts()
+            
+            # Block until a process exits, a restart is due or the check interval passes
+            if not self._exited_queue:
+                timeout = self.check_interval
+                if self._restart_heap:
+                    timeout = max(0, min(timeout, self._restart_heap[0][0] - time.monotonic()))
+                self._wait_for_exits(timeout)
+                continue
+            self._handle_exit(self._exited_queue.popleft())
+            
+    def _handle_exit(self, server_name: str):
+        """
+        Restart a monitored process if it has exited.
+        
+        Args:
+            server_name: Name of the server
+        """
+        process_info = self.processes.get(server_name)
+        if process_info is None:
+            self._unwatched.discard(server_name)
+            return
+            
+        process = process_info["process"]
+        
+        # Check if the process is still running
+        if process.poll() is not None:
+            exit_code = process.returncode
+            logger.warning(f"Process {server_name} exited with code {exit_code}")
+            
+            # Close the pidfd
+            self._release_process(process_info)
+            
+            # Remove the process from the list
+            del self.processes[server_name]
+            
+            # Check if we should restart the process
+            if self.restart_counts[server_name] < self.max_restarts:
+                logger.info(f"Restarting process {server_name} (attempt {self.restart_counts[server_name] + 1}/{self.max_restarts})")
                 
-                # Check if the process is still running
-                if process.poll() is not None:
-                    exit_code = process.returncode
-                    logger.warning(f"Process {server_name} exited with code {exit_code}")
-                    
-                    # Close file handles
-                    if "stdout_file" in process_info and process_info["stdout_file"]:
-                        process_info["stdout_file"].close()
-                    
-                    if "stderr_file" in process_info and process_info["stderr_file"]:
-                        process_info["stderr_file"].close()
-                    
-                    # Remove the process from the list
-                    del self.processes[server_name]
-                    
-                    # Check if we should restart the process
-                    if self.restart_counts[server_name] < self.max_restarts:
-                        logger.info(f"Restarting process {server_name} (attempt {self.restart_counts[server_name] + 1}/{self.max_restarts})")
-                        
-                        # Increment restart count
-                        self.restart_counts[server_name] += 1
-                        
-                        # Wait before restarting
-                        time.sleep(self.restart_delay)
-                        
-                        # Get server configuration
-                        server_config = self.config.get("mcpServers", {}).get(server_name)
-                        if server_config:
-                            # Start the process
-                            self._start_process(server_name, server_config)
-                        else:
-                            logger.error(f"Server configuration not found for {server_name}")
-                    else:
-                        logger.error(f"Process {server_name} has been restarted {self.restart_counts[server_name]} times, giving up")
-            
-            # Wait before checking again
-            time.sleep(self.check_interval)
+                # Increment restart count
+                self.restart_counts[server_name] += 1
+                
+                # Schedule the restart so other exits are still handled during the delay
+                heapq.heappush(self._restart_heap, (time.monotonic() + self.restart_delay, server_name))
+            else:
+                logger.error(f"Process {server_name} has been restarted {self.restart_counts[server_name]} times, giving up")
+                
+    def _start_due_restarts(self):
+        """
+        Restart the processes whose restart delay has elapsed.
+        """
+        now = time.monotonic()
+        while self._restart_heap and self._restart_heap[0][0] <= now:
+            _, server_name = heapq.heappop(self._restart_heap)
             
+            # Get server configuration
+            try:
+                server_config = self._server_configs[server_name]
+            except KeyError:
+                logger.error(f"Server configuration not found for {server_name}")
+                continue
+                
+            # Start the process and wake anyone waiting on a restart
+            if self._start_process(server_name, server_config):
+                self._restart_event.set()
+                
     def start_monitoring(self):
         """
         Start the process monitoring thread.
@@ -322,12 +760,8 @@ class ProcessMonitor:
                     logger.info(f"Forcefully stopping process {server_name} (PID: {process.pid})")
                     process.kill()  # Send SIGKILL
                 
-                # Close file handles
-                if "stdout_file" in process_info and process_info["stdout_file"]:
-                    process_info["stdout_file"].close()
-                
-                if "stderr_file" in process_info and process_info["stderr_file"]:
-                    process_info["stderr_file"].close()
+                # Close the pidfd
+                self._release_process(process_info)
                 
                 # Remove the process from the list
                 del self.processes[server_name]
@@ -335,17 +769,22 @@ class ProcessMonitor:
             except Exception as e:
                 logger.error(f"Error stopping process {server_name}: {str(e)}")
                 
-    def get_process_resource_usage(self, pid: int) -> Dict[str, float]:
+    def get_process_resource_usage(self, pid: int, process_info: Optional[Dict[str, Any]] = None) -> Dict[str, float]:
         """
         Get resource usage for a specific process.
         
         Args:
             pid: Process ID
+            process_info: Tracked process entry used to remember the previous CPU sample
             
         Returns:
             Dictionary with resource usage information
         """
         try:
+            # Linux exposes per-process usage under /proc, so avoid forking ps
+            if sys.platform.startswith('linux'):
+                return self._proc_resource_usage(pid, process_info)
+                
             # Get CPU and memory usage using ps (platform-specific)
             if sys.platform == 'darwin':  # macOS
                 cmd = ["ps", "-p", str(pid), "-o", "%cpu,%mem"]
@@ -376,13 +815,74 @@ class ProcessMonitor:
                 "cpu_percent": 0.0,
                 "memory_percent": 0.0
             }
-        except (subprocess.SubprocessError, ValueError, IndexError) as e:
+        except (subprocess.SubprocessError, OSError, ValueError, IndexError) as e:
             logger.warning(f"Failed to get resource usage for PID {pid}: {str(e)}")
             return {
                 "cpu_percent": 0.0,
                 "memory_percent": 0.0
             }
     
+    def _read_proc_file(self, pid: int, name: str) -> bytes:
+        """
+        Read /proc/<pid>/<name>.
+        
+        The file is opened for each read rather than kept open, so samples taken
+        from different threads share no descriptors and a restarted process is
+        never read through a stale handle.
+        
+        Args:
+            pid: Process ID
+            name: Name of the file under /proc/<pid>
+            
+        Returns:
+            Contents of the file
+        """
+        fd = os.open(f"/proc/{pid}/{name}", os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            return os.read(fd, PROC_READ_SIZE)
+        finally:
+            os.close(fd)
+        
+    def _proc_resource_usage(self, pid: int, process_info: Optional[Dict[str, Any]]) -> Dict[str, float]:
+        """
+        Get resource usage for a specific process from /proc on Linux.
+        
+        Args:
+            pid: Process ID
+            process_info: Tracked process entry used to remember the previous CPU sample
+            
+        Returns:
+            Dictionary with resource usage information
+        """
+        cpu_ticks, start_ticks = _parse_proc_stat(self._read_proc_file(pid, "stat"))
+        now = time.clock_gettime(time.CLOCK_BOOTTIME)
+        
+        # Average over the time since the previous sample of the same process, or over
+        # the process lifetime like ps
+        last_sample = process_info.get("cpu_sample") if process_info is not None else None
+        if last_sample and last_sample[0] == start_ticks:
+            _, last_ticks, last_time = last_sample
+        else:
+            last_ticks, last_time = 0, start_ticks / CLOCK_TICKS
+        if process_info is not None:
+            process_info["cpu_sample"] = (start_ticks, cpu_ticks, now)
+            
+        cpu_percent = 0.0
+        elapsed = now - last_time
+        if elapsed > 0:
+            cpu_percent = round(100.0 * (cpu_ticks - last_ticks) / CLOCK_TICKS / elapsed, 1)
+            
+        memory_percent = 0.0
+        mem_total = _read_mem_total()
+        if mem_total:
+            rss = _parse_proc_statm(self._read_proc_file(pid, "statm"))
+            memory_percent = round(100.0 * rss / mem_total, 1)
+            
+        return {
+            "cpu_percent": cpu_percent,
+            "memory_percent": memory_percent
+        }
+    
     def get_process_status(self) -> Dict[str, Dict[str, Any]]:
         """
         Get the status of all processes.
@@ -404,7 +904,7 @@ class ProcessMonitor:
             # Get resource usage if the process is running
             resource_usage = {}
             if is_running:
-                resource_usage = self.get_process_resource_usage(process.pid)
+                resource_usage = self.get_process_resource_usage(process.pid, process_info)
             
             status[server_name] = {
                 "pid": process.pid,
@@ -421,6 +921,8 @@ class ProcessMonitor:
 
 def main():
     """Main entry point for the process monitor."""
+    import argparse
+    
     parser = argparse.ArgumentParser(description="Process monitor for MCP Docker container")
     parser.add_argument("--config", default=DEFAULT_CONFIG_PATH, help="Path to configuration file")
     parser.add_argument("--interval", type=int, default=DEFAULT_CHECK_INTERVAL, help="Interval between process checks in seconds")
@@ -441,15 +943,14 @@ def main():
         restart_delay=args.restart_delay
     )
     
-    # Set up signal handlers for graceful shutdown
-    def signal_handler(sig, frame):
-        logger.info(f"Received signal {sig}, shutting down...")
-        monitor.stop_monitoring()
-        monitor.stop_processes(graceful=True)
-        sys.exit(0)
-        
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # Route SIGINT/SIGTERM through a wakeup pipe so shutdown runs in normal thread
+    # context rather than inside a signal handler. The signals stay unblocked, as a
+    # blocked mask would be inherited by the MCP server processes.
+    wakeup_read, wakeup_write = os.pipe()
+    os.set_blocking(wakeup_write, False)
+    signal.set_wakeup_fd(wakeup_write, warn_on_full_buffer=False)
+    signal.signal(signal.SIGINT, lambda sig, frame: None)
+    signal.signal(signal.SIGTERM, lambda sig, frame: None)
     
     # Start processes and monitoring
     try:
@@ -459,11 +960,9 @@ def main():
         logger.info("Starting process monitoring...")
         monitor.start_monitoring()
         
-        # Keep the main thread alive
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        logger.info("Interrupted by user, shutting down...")
+        # Keep the main thread alive until a shutdown signal arrives
+        sig = os.read(wakeup_read, 1)[0]
+        logger.info(f"Received signal {sig}, shutting down...")
     except Exception as e:
         logger.error(f"Error running process monitor: {str(e)}")
         sys.exit(1)
@@ -4,25 +4,39 @@ Test script for the health check and process monitoring functionality.
 """
 
 import os
+import sys
+import signal
 import json
+import logging
 import time
 import tempfile
 import unittest
 import threading
+import socket
+import socketserver
 import http.client
 import subprocess
 from unittest import mock
-from health_check import HealthCheckServer
-from process_monitor import ProcessMonitor
+import health_check
+from health_check import HealthCheckServer, PooledTCPServer
+from process_monitor import ProcessMonitor, SpawnedProcess, MAX_LINE_SIZE, _load_config_cached
 
 
 class TestHealthCheck(unittest.TestCase):
     """Test cases for the health check functionality."""
     
-    def setUp(self):
-        """Set up test environment."""
-        # Create a temporary config file
-        self.temp_config = {
+    # Attributes of the shared server that tests change
+    SERVER_STATE = (
+        "_http", "process_monitor", "mcp_servers_status", "is_healthy", "last_check_time",
+        "_resource_cache", "_health_cache", "_last_cpu_times", "_status_pipes"
+    )
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up the shared test configuration."""
+        # Create a temporary config file shared by every test; tests that
+        # change the configuration write their own copy with _write_config
+        cls.temp_config = {
             "mcpServers": {
                 "test-server": {
                     "command": "echo",
@@ -37,13 +51,36 @@ class TestHealthCheck(unittest.TestCase):
         }
         
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(self.temp_config, f)
-            self.config_path = f.name
+            json.dump(cls.temp_config, f)
+            cls.config_path = f.name
+            
+        # Create the health check server shared by tests using the default settings
+        cls.server = HealthCheckServer(config_path=cls.config_path, port=0)  # Use port 0 to avoid conflicts
     
-    def tearDown(self):
-        """Clean up test environment."""
-        if hasattr(self, 'config_path') and os.path.exists(self.config_path):
-            os.unlink(self.config_path)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared test configuration."""
+        if os.path.exists(cls.config_path):
+            os.unlink(cls.config_path)
+    
+    def setUp(self):
+        """Restore the shared server's state after each test."""
+        # Patching an attribute with its own value puts it back when the test ends
+        for attribute in self.SERVER_STATE:
+            self._patch_object(self.server, attribute, getattr(self.server, attribute))
+    
+    def _write_config(self, config):
+        """Write a config file for a single test and remove it afterwards."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(config, f)
+        self.addCleanup(os.unlink, f.name)
+        return f.name
+    
+    def _patch_object(self, target, attribute, *args, **kwargs):
+        """Patch an attribute for the duration of a single test."""
+        patcher = mock.patch.object(target, attribute, *args, **kwargs)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
     
     @mock.patch('health_check.urlopen')
     def test_check_mcp_servers(self, mock_urlopen):
@@ -53,8 +90,9 @@ class TestHealthCheck(unittest.TestCase):
         mock_response.status = 200
         mock_urlopen.return_value = mock_response
         
-        # Create health check server
-        server = HealthCheckServer(config_path=self.config_path, port=0)  # Use port 0 to avoid conflicts
+        # Use the shared server without a connection pool so probes go through urlopen
+        server = self.server
+        self._patch_object(server, '_http', None)
         
         # Check MCP servers
         results = server.check_mcp_servers()
@@ -65,14 +103,72 @@ class TestHealthCheck(unittest.TestCase):
         self.assertTrue(results['test-server']['healthy'])
         self.assertEqual(results['test-server']['message'], 'Server is responding')
     
+    def test_check_mcp_servers_pooled(self):
+        """Test checking MCP server health through the pooled HTTP client."""
+        # Use the shared server with a mocked connection pool
+        server = self.server
+        mock_response = mock.MagicMock()
+        mock_response.status = 200
+        http = self._patch_object(server, '_http', mock.MagicMock())
+        http.request.return_value = mock_response
+        
+        # Check MCP servers
+        results = server.check_mcp_servers()
+        
+        # Verify results and that the connection was returned to the pool
+        self.assertEqual(results['test-server']['status'], 'healthy')
+        http.request.assert_called_once_with(
+            "GET", "http://127.0.0.1:8000/health?server=test-server", preload_content=False
+        )
+        mock_response.release_conn.assert_called_once()
+    
+    def test_probe_urls(self):
+        """Test that probe URLs are built once per config load and URL-encoded."""
+        # Add a disabled server and one whose name needs encoding
+        config_path = self._write_config({**self.temp_config, "mcpServers": {
+            **self.temp_config["mcpServers"],
+            "off": {"command": "echo", "disabled": True},
+            "a b&c": {"command": "echo"}
+        }})
+            
+        # Create health check server
+        server = HealthCheckServer(config_path=config_path, port=0)
+        
+        # Verify only enabled servers are probed
+        self.assertEqual(server._probe_urls, {
+            'test-server': 'http://127.0.0.1:8000/health?server=test-server',
+            'a b&c': 'http://127.0.0.1:8000/health?server=a%20b%26c'
+        })
+    
+    def test_config_reloaded_on_change(self):
+        """Test that the configuration is only re-parsed when the file changes."""
+        # Create health check server
+        config_path = self._write_config(self.temp_config)
+        server = HealthCheckServer(config_path=config_path, port=0)
+        config = server.config
+        
+        # Verify an unchanged file is not re-parsed
+        with mock.patch('health_check._read_json_file') as mock_read:
+            self.assertIs(server._load_config(), config)
+            mock_read.assert_not_called()
+            
+        # Verify a modified file is reloaded
+        with open(config_path, 'w') as f:
+            json.dump({**self.temp_config, "mcpServers": {
+                **self.temp_config["mcpServers"], "new-server": {"command": "echo"}
+            }}, f)
+        self.assertIn('new-server', server._load_config()["mcpServers"])
+        self.assertIn('new-server', server._probe_urls)
+    
     @mock.patch('health_check.urlopen')
     def test_unhealthy_server(self, mock_urlopen):
         """Test handling of unhealthy MCP server."""
         # Mock the response from urlopen to simulate an error
         mock_urlopen.side_effect = Exception("Connection refused")
         
-        # Create health check server
-        server = HealthCheckServer(config_path=self.config_path, port=0)
+        # Use the shared server without a connection pool so probes go through urlopen
+        server = self.server
+        self._patch_object(server, '_http', None)
         
         # Check MCP servers
         results = server.check_mcp_servers()
@@ -83,10 +179,30 @@ class TestHealthCheck(unittest.TestCase):
         self.assertFalse(results['test-server']['healthy'])
         self.assertIn('Error checking server health', results['test-server']['message'])
     
+    @mock.patch('health_check.HAS_URLLIB3', False)
+    @mock.patch('health_check.urlopen')
+    def test_probe_deadline(self, mock_urlopen):
+        """Test that a hung MCP server probe does not stall the health check."""
+        # Mock urlopen to block longer than the probe deadline
+        mock_urlopen.side_effect = lambda *args, **kwargs: time.sleep(1)
+        
+        # Create health check server with a short check interval (deadline is half of it)
+        server = HealthCheckServer(config_path=self.config_path, port=0, check_interval=0.2)
+        
+        # Check MCP servers
+        start = time.time()
+        results = server.check_mcp_servers()
+        
+        # Verify the hung server was reported without waiting for it
+        self.assertLess(time.time() - start, 0.9)
+        self.assertEqual(results['test-server']['status'], 'unknown')
+        self.assertFalse(results['test-server']['healthy'])
+        self.assertFalse(server.is_healthy)
+    
     def test_check_system_resources(self):
         """Test checking system resources."""
-        # Create health check server
-        server = HealthCheckServer(config_path=self.config_path, port=0)
+        # Use the shared health check server
+        server = self.server
         
         # Check system resources
         resources = server.check_system_resources()
@@ -96,11 +212,177 @@ class TestHealthCheck(unittest.TestCase):
         self.assertIn('memory_percent', resources)
         self.assertIn('process_count', resources)
     
+    @unittest.skipUnless(os.path.isdir('/proc'), "requires /proc")
+    @mock.patch('health_check.sys.platform', 'linux')
+    @mock.patch('health_check.subprocess.check_output')
+    def test_system_resources_from_proc(self, mock_check_output):
+        """Test that Linux resource checks read /proc instead of spawning ps/df."""
+        # Use the shared health check server
+        server = self.server
+        
+        # Check system resources
+        resources = server.check_system_resources()
+        
+        # Verify results were read without any subprocess
+        mock_check_output.assert_not_called()
+        self.assertGreater(resources['process_count'], 0)
+        self.assertGreaterEqual(resources['cpu_percent'], 0)
+        self.assertLessEqual(resources['memory_percent'], 100)
+        self.assertLessEqual(resources['disk_percent'], 100)
+        self.assertNotIn('error', resources)
+    
+    @mock.patch('health_check.sys.platform', 'linux')
+    def test_cpu_percent_from_proc_stat_delta(self):
+        """Test that CPU usage is computed from the change between /proc/stat samples."""
+        # Use the shared health check server
+        server = self.server
+        samples = iter([
+            b"cpu  100 0 100 700 100 0 0 0 0 0\n",
+            b"cpu  130 0 120 740 110 0 0 0 0 0\n"
+        ])
+        real_open = open
+        
+        def fake_open(path, *args, **kwargs):
+            if path == '/proc/stat':
+                return mock.mock_open(read_data=next(samples))()
+            return real_open(path, *args, **kwargs)
+            
+        with mock.patch('builtins.open', side_effect=fake_open):
+            first = server._collect_proc_resources()
+            second = server._collect_proc_resources()
+            
+        # Verify the first sample covers time since boot and the second only the delta
+        self.assertEqual(first['cpu_percent'], 20.0)
+        self.assertEqual(second['cpu_percent'], 50.0)
+    
+    @mock.patch('health_check.sys.platform', 'darwin')
+    @mock.patch('health_check.subprocess.check_output')
+    def test_system_resources_from_ps(self, mock_check_output):
+        """Test parsing ps and df output on platforms without /proc."""
+        # Mock ps and df output with macOS-style headers
+        outputs = {
+            'ps': "%CPU %MEM\n 1.5 10.0\n 2.5  5.0\n\n",
+            'df': "Filesystem Size Used Avail Capacity Mounted\n/dev/disk1 100G 42G 58G 42% /\n"
+        }
+        mock_check_output.side_effect = lambda cmd, **kwargs: outputs[cmd[0]]
+        
+        # Use the shared health check server
+        server = self.server
+        
+        # Check system resources
+        resources = server.check_system_resources()
+        
+        # Verify results
+        self.assertEqual(resources['cpu_percent'], 4.0)
+        self.assertEqual(resources['memory_percent'], 15.0)
+        self.assertEqual(resources['process_count'], 2)
+        self.assertEqual(resources['disk_percent'], 42.0)
+        self.assertEqual(mock_check_output.call_count, 2)
+    
+    def test_system_resources_cached(self):
+        """Test that system resource checks are cached between calls."""
+        # Use the shared health check server
+        server = self.server
+        
+        with mock.patch.object(server, '_collect_system_resources', return_value={'cpu_percent': 1}) as collect:
+            first = server.check_system_resources()
+            second = server.check_system_resources()
+        
+        # Verify resources were only collected once
+        self.assertIs(first, second)
+        collect.assert_called_once()
+    
+    def test_render_metrics(self):
+        """Test rendering metrics in Prometheus format."""
+        # Use the shared health check server with a known server status
+        server = self.server
+        server.process_monitor = None
+        server.mcp_servers_status = {'test-server': {'healthy': True}}
+        
+        # Render metrics
+        body = server.render_metrics({'cpu_percent': 1.5, 'memory_percent': 20, 'process_count': 7})
+        
+        # Verify results
+        lines = body.decode('utf-8').splitlines()
+        self.assertIn('# TYPE mcpo_cpu_percent gauge', lines)
+        self.assertIn('mcpo_cpu_percent 1.5', lines)
+        self.assertIn('mcpo_process_count 7', lines)
+        self.assertIn('mcpo_server_status{server="test-server"} 1', lines)
+        self.assertTrue(body.endswith(b'\n'))
+    
+    def test_status_published(self):
+        """Test that server checks and process status are sent to forked workers over a pipe."""
+        # Use the shared health check server with a mocked process monitor
+        server = self.server
+        server.process_monitor = mock.MagicMock()
+        server.process_monitor.get_process_status.return_value = {
+            'test-server': {'pid': 1, 'running': True, 'uptime': 10.0, 'restart_count': 0}
+        }
+        server.mcp_servers_status = {'test-server': {'status': 'healthy', 'healthy': True}}
+        server.last_check_time = time.time()
+        server._resource_cache = (time.monotonic(), {'cpu_percent': 1.5})
+        
+        # Connect a worker as _fork_workers would, without forking
+        worker = HealthCheckServer(config_path=self.config_path, port=0)
+        worker.process_monitor = None
+        check = self._patch_object(worker, 'check_mcp_servers')
+        read_fd, write_fd = os.pipe()
+        server._status_pipes = [write_fd]
+        worker._refresh_thread = threading.Thread(target=worker._receive_status, args=(read_fd,))
+        worker._refresh_thread.start()
+        
+        # Nothing is reported before the first status is sent
+        self.assertEqual(worker.get_process_status(), {})
+        server._publish_status()
+        
+        # Closing the pipe ends the receiver after it has read the status
+        os.close(write_fd)
+        server._status_pipes = []
+        worker._refresh_thread.join(timeout=5)
+        self.assertFalse(worker._refresh_thread.is_alive())
+        
+        # Verify the worker serves the received status and advances the uptime
+        status = worker.get_detailed_status()
+        self.assertTrue(status['process_monitor_enabled'])
+        self.assertEqual(status['mcp_servers'], server.mcp_servers_status)
+        self.assertEqual(status['resources'], {'cpu_percent': 1.5})
+        self.assertGreaterEqual(status['processes']['test-server']['uptime'], 10.0)
+        self.assertEqual(status['processes']['test-server']['pid'], 1)
+        
+        # The worker never probes the MCP servers itself
+        check.assert_not_called()
+        
+        # The process running the monitor reads it directly
+        self.assertEqual(server.get_process_status()['test-server']['uptime'], 10.0)
+    
+    def test_background_refresh(self):
+        """Test that the refresh thread keeps health checks off the request path."""
+        # Create health check server with a short check interval
+        server = HealthCheckServer(config_path=self.config_path, port=0, check_interval=0.1)
+        check = self._patch_object(server, 'check_mcp_servers', side_effect=lambda: setattr(server, 'last_check_time', time.time()))
+        collect = self._patch_object(server, '_collect_system_resources', return_value={'cpu_percent': 0})
+        
+        # Run the refresh thread for a few intervals
+        server._start_refresh_thread()
+        time.sleep(0.35)
+        server._shutdown_event.set()
+        server._refresh_thread.join(timeout=1)
+        
+        # Verify checks were refreshed in the background
+        self.assertGreaterEqual(check.call_count, 2)
+        self.assertGreaterEqual(collect.call_count, 2)
+        
+        # Verify request-path reads don't trigger checks
+        checks = check.call_count
+        server.last_check_time = 0
+        server.get_health_status()
+        self.assertEqual(check.call_count, checks)
+    
     def test_get_health_status(self):
         """Test getting overall health status."""
-        # Create health check server with mocked check_mcp_servers
-        server = HealthCheckServer(config_path=self.config_path, port=0)
-        server.check_mcp_servers = mock.MagicMock(return_value={
+        # Use the shared health check server with mocked check_mcp_servers
+        server = self.server
+        self._patch_object(server, 'check_mcp_servers', return_value={
             'test-server': {
                 'status': 'healthy',
                 'healthy': True,
@@ -117,6 +399,200 @@ class TestHealthCheck(unittest.TestCase):
         self.assertIn('mcp_servers', status)
         self.assertIn('resources', status)
         self.assertEqual(status['config_path'], self.config_path)
+    
+    def test_health_body_cached(self):
+        """Test that the encoded health response is reused until a check refreshes."""
+        # Use the shared health check server with fresh server and resource checks
+        server = self.server
+        server.last_check_time = time.time()
+        server._resource_cache = (time.monotonic(), {'cpu_percent': 0})
+        
+        # Get the health body twice
+        first = server.get_health_body()
+        second = server.get_health_body()
+        
+        # Verify the body was encoded once
+        self.assertIs(first, second)
+        self.assertEqual(json.loads(first)['status'], 'healthy')
+        
+        # Verify a refreshed check produces a new body
+        server.last_check_time += 1
+        self.assertIsNot(server.get_health_body(), first)
+    
+    @unittest.skipUnless(health_check.LOG_FORMAT == "json", "requires JSON logging")
+    def test_json_log_extra_fields(self):
+        """Test that process fields are logged whenever a record carries them, even as None."""
+        record = logging.LogRecord('health_check', logging.INFO, __file__, 1, 'started', None, None)
+        self.assertNotIn('process_name', json.loads(health_check.formatter.format(record)))
+        
+        record.process_name = None
+        record.process_id = 42
+        log_record = json.loads(health_check.formatter.format(record))
+        self.assertIsNone(log_record['process_name'])
+        self.assertEqual(log_record['process_id'], 42)
+    
+    def test_request_routing(self):
+        """Test that endpoints are routed by path and ignore query strings."""
+        # Serve the health check handler on an ephemeral port
+        server = self.server
+        httpd = PooledTCPServer(('127.0.0.1', 0), server._create_request_handler())
+        thread = threading.Thread(target=httpd.serve_forever)
+        thread.daemon = True
+        thread.start()
+        
+        # The server closes each connection after responding; the client reconnects
+        conn = http.client.HTTPConnection('127.0.0.1', httpd.server_address[1], timeout=5)
+        try:
+            def get(path):
+                conn.request('GET', path)
+                response = conn.getresponse()
+                return response.status, response.read()
+                
+            # Verify known paths with and without query strings
+            conn.request('GET', '/liveness')
+            response = conn.getresponse()
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.getheader('Connection'), 'close')
+            self.assertEqual(json.loads(response.read()), {"status": "alive"})
+            self.assertEqual(get('/readiness?probe=1')[0], 200)
+            
+            # Verify the detailed status is complete with and without orjson
+            self.assertEqual(json.loads(get('/status')[1])['config_path'], self.config_path)
+            with mock.patch('health_check.HAS_ORJSON', False):
+                self.assertEqual(json.loads(get('/status')[1])['config_path'], self.config_path)
+                
+                # The streamed body is unframed, so HTTP/1.0 clients can read it too
+                with socket.create_connection(httpd.server_address, timeout=5) as client:
+                    client.sendall(b"GET /status HTTP/1.0\r\n\r\n")
+                    response = b""
+                    while True:
+                        data = client.recv(65536)
+                        if not data:
+                            break
+                        response += data
+                headers, _, body = response.partition(b"\r\n\r\n")
+                self.assertNotIn(b"Transfer-Encoding", headers)
+                self.assertEqual(json.loads(body)['config_path'], self.config_path)
+                
+            # Verify unknown paths return 404
+            self.assertEqual(get('/unknown')[0], 404)
+        finally:
+            conn.close()
+            httpd.shutdown()
+            httpd.server_close()
+    
+    def test_idle_clients_do_not_hold_workers(self):
+        """Test that clients keeping their connection open cannot starve the worker pool."""
+        # Serve the health check handler on a pool with two workers
+        server = self.server
+        httpd = PooledTCPServer(('127.0.0.1', 0), server._create_request_handler(), max_workers=2)
+        thread = threading.Thread(target=httpd.serve_forever)
+        thread.daemon = True
+        thread.start()
+        
+        # Leave more connections open after their request than there are workers
+        conns = []
+        try:
+            for _ in range(4):
+                conn = http.client.HTTPConnection('127.0.0.1', httpd.server_address[1], timeout=5)
+                conn.request('GET', '/liveness')
+                conn.getresponse().read()
+                conns.append(conn)
+                
+            # Verify a new probe is still answered promptly
+            start = time.monotonic()
+            conn = http.client.HTTPConnection('127.0.0.1', httpd.server_address[1], timeout=1)
+            conns.append(conn)
+            conn.request('GET', '/liveness')
+            self.assertEqual(conn.getresponse().status, 200)
+            self.assertLess(time.monotonic() - start, 1)
+        finally:
+            for conn in conns:
+                conn.close()
+            httpd.shutdown()
+            httpd.server_close()
+    
+    def test_busy_server_sheds_load(self):
+        """Test that connections beyond the queue get a 503 without stalling the accept loop."""
+        started = threading.Event()
+        release = threading.Event()
+        
+        class BlockingHandler(socketserver.BaseRequestHandler):
+            def handle(self):
+                started.set()
+                release.wait(5)
+        
+        # Serve on one worker with room for one waiting connection
+        httpd = PooledTCPServer(('127.0.0.1', 0), BlockingHandler, max_workers=1, queue_size=1)
+        thread = threading.Thread(target=httpd.serve_forever)
+        thread.daemon = True
+        thread.start()
+        address = httpd.server_address
+        
+        clients = []
+        try:
+            # Occupy the worker, then fill the queue
+            clients.append(socket.create_connection(address, timeout=5))
+            self.assertTrue(started.wait(5))
+            clients.append(socket.create_connection(address, timeout=5))
+            
+            # Each further client is answered with a 503 even though earlier
+            # rejected clients keep their connections open
+            start = time.monotonic()
+            for _ in range(10):
+                client = socket.create_connection(address, timeout=5)
+                clients.append(client)
+                client.sendall(b"GET /liveness HTTP/1.0\r\n\r\n")
+                response = b""
+                while True:
+                    data = client.recv(65536)
+                    if not data:
+                        break
+                    response += data
+                self.assertTrue(response.startswith(b"HTTP/1.1 503 "))
+                
+            # Verify rejections did not wait out the linger timeout one by one
+            self.assertLess(time.monotonic() - start, 0.5)
+        finally:
+            release.set()
+            for client in clients:
+                client.close()
+            httpd.shutdown()
+            httpd.server_close()
+
+
+class FakeProcess:
+    """In-memory stand-in for a spawned server process."""
+    
+    # Above any pid_max, so pidfd_open and /proc lookups fail and the monitor polls it
+    pid = 1 << 30
+    
+    def __init__(self, returncode=None):
+        """Create a process that is running, or has exited if returncode is given."""
+        self.returncode = returncode
+        
+    def poll(self):
+        """Return the exit code, or None while running."""
+        return self.returncode
+        
+    def wait(self, timeout=None):
+        """Return the exit code, timing out immediately while running."""
+        if self.returncode is None:
+            raise subprocess.TimeoutExpired("fake", timeout)
+        return self.returncode
+        
+    def send_signal(self, sig):
+        """Exit as if killed by the signal."""
+        if self.returncode is None:
+            self.returncode = -sig
+            
+    def terminate(self):
+        """Exit as if killed by SIGTERM."""
+        self.send_signal(signal.SIGTERM)
+        
+    def kill(self):
+        """Exit as if killed by SIGKILL."""
+        self.send_signal(signal.SIGKILL)
 
 
 class TestProcessMonitor(unittest.TestCase):
@@ -144,9 +620,97 @@ class TestProcessMonitor(unittest.TestCase):
         if hasattr(self, 'config_path') and os.path.exists(self.config_path):
             os.unlink(self.config_path)
     
+    def _fake_spawn(self, returncode=None):
+        """Make the monitor start FakeProcesses instead of real children for one test."""
+        patcher = mock.patch.object(
+            ProcessMonitor, '_spawn', side_effect=lambda *args: FakeProcess(returncode)
+        )
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+    
+    @unittest.skipUnless(os.path.isdir('/proc/self/fd'), "requires /proc")
+    def test_import_opens_no_files(self):
+        """Test that importing the process monitor leaves /dev/null closed until a spawn."""
+        code = "\n".join([
+            "import os",
+            "def devnull_fds():",
+            "    fds = []",
+            "    for fd in os.listdir('/proc/self/fd'):",
+            "        try:",
+            "            if os.readlink('/proc/self/fd/' + fd) == os.devnull:",
+            "                fds.append(fd)",
+            "        except OSError:",
+            "            pass",
+            "    return fds",
+            "before = devnull_fds()",
+            "import process_monitor",
+            "print(len(devnull_fds()) - len(before))",
+        ])
+        result = subprocess.run(
+            [sys.executable, '-c', code], input=b"", capture_output=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), timeout=30
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), b"0")
+    
+    def test_config_cached(self):
+        """Test that an unchanged configuration file is parsed once and never shared."""
+        first = ProcessMonitor(config_path=self.config_path)
+        hits = _load_config_cached.cache_info().hits
+        second = ProcessMonitor(config_path=self.config_path)
+        self.assertEqual(_load_config_cached.cache_info().hits, hits + 1)
+        self.assertEqual(first.config, second.config)
+        
+        # Each monitor gets its own copy of the cached configuration
+        first.config["mcpServers"]["test-server"]["args"].append("changed")
+        self.assertNotIn("changed", ProcessMonitor(config_path=self.config_path).config["mcpServers"]["test-server"]["args"])
+        
+        # Changing the file invalidates the cached configuration
+        self.temp_config["mcpServers"]["test-server"]["args"] = ["10"]
+        with open(self.config_path, 'w') as f:
+            json.dump(self.temp_config, f)
+        self.assertEqual(first._load_config()["mcpServers"]["test-server"]["args"], ["10"])
+        
+        # A file swapped in by rename is re-read even with the same mtime and size
+        stat = os.stat(self.config_path)
+        self.temp_config["mcpServers"]["test-server"]["args"] = ["20"]
+        replacement_path = self.config_path + ".new"
+        with open(replacement_path, 'w') as f:
+            json.dump(self.temp_config, f)
+        os.utime(replacement_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement_path, self.config_path)
+        self.assertEqual(first._load_config()["mcpServers"]["test-server"]["args"], ["20"])
+        
+        # An explicit invalidation forces a re-read
+        ProcessMonitor.invalidate_config_cache()
+        self.assertEqual(_load_config_cached.cache_info().currsize, 0)
+    
+    @mock.patch.dict(os.environ, {"MCPO_TEST_SECRET": "secret"})
+    def test_env_resolved_once(self):
+        """Test that a server's environment is substituted once and reused on restart."""
+        # Create process monitor
+        monitor = ProcessMonitor(config_path=self.config_path)
+        server_config = {"command": "sleep", "args": ["0.1"], "env": {"API_KEY": "${MCPO_TEST_SECRET}", "MODE": "test"}}
+        
+        try:
+            with mock.patch.object(monitor, '_resolve_env', wraps=monitor._resolve_env) as resolve_env:
+                self.assertTrue(monitor._start_process("env-server", server_config))
+                first_env = monitor.processes["env-server"]["env"]
+                monitor.stop_processes(graceful=False)
+                self.assertTrue(monitor._start_process("env-server", server_config))
+                
+            # Verify the substituted environment was built once and reused
+            self.assertEqual(resolve_env.call_count, 1)
+            self.assertIs(monitor.processes["env-server"]["env"], first_env)
+            self.assertEqual(first_env["API_KEY"], "secret")
+            self.assertEqual(first_env["MODE"], "test")
+        finally:
+            monitor.stop_processes(graceful=False)
+    
     def test_start_processes(self):
         """Test starting processes."""
         # Create process monitor
+        spawn = self._fake_spawn()
         monitor = ProcessMonitor(config_path=self.config_path)
         
         # Start processes
@@ -154,14 +718,96 @@ class TestProcessMonitor(unittest.TestCase):
         
         # Verify processes were started
         self.assertIn('test-server', monitor.processes)
-        self.assertIsNotNone(monitor.processes['test-server']['process'])
+        self.assertIsInstance(monitor.processes['test-server']['process'], FakeProcess)
+        self.assertEqual(spawn.call_args[0][0], ['sleep', '0.1'])
         
         # Clean up
         monitor.stop_processes()
     
+    @unittest.skipUnless(hasattr(os, "posix_spawn"), "posix_spawn not available")
+    def test_processes_spawned(self):
+        """Test that processes are launched with posix_spawn and can be stopped."""
+        # Create process monitor with a long-running process
+        self.temp_config["mcpServers"]["test-server"]["args"] = ["10"]
+        with open(self.config_path, 'w') as f:
+            json.dump(self.temp_config, f)
+        monitor = ProcessMonitor(config_path=self.config_path)
+        monitor.start_processes()
+        process = monitor.processes['test-server']['process']
+        
+        # Verify the process was spawned and is running
+        self.assertIsInstance(process, SpawnedProcess)
+        self.assertIsNone(process.poll())
+        with self.assertRaises(subprocess.TimeoutExpired):
+            process.wait(timeout=0.05)
+        
+        # Verify termination is reported like Popen
+        process.terminate()
+        self.assertEqual(process.wait(timeout=5), -signal.SIGTERM)
+        self.assertEqual(process.poll(), -signal.SIGTERM)
+        monitor.stop_processes()
+        self.assertNotIn('test-server', monitor.processes)
+    
+    def test_output_relayed_to_log(self):
+        """Test that output of servers with logOutput is copied to the log."""
+        # Create process monitor with a process that writes to stdout and stderr
+        self.temp_config["mcpServers"]["test-server"] = {
+            "command": "sh",
+            "args": ["-c", "echo hello; echo oops >&2; printf tail"],
+            "logOutput": True
+        }
+        with open(self.config_path, 'w') as f:
+            json.dump(self.temp_config, f)
+        monitor = ProcessMonitor(config_path=self.config_path)
+        
+        with self.assertLogs('process_monitor', level='INFO') as logs:
+            monitor.start_processes()
+            monitor.processes['test-server']['process'].wait(timeout=5)
+            
+            # Wait for the relay thread to drain and close both pipes
+            deadline = time.monotonic() + 2
+            while monitor._output_selector.get_map() and time.monotonic() < deadline:
+                time.sleep(0.05)
+        monitor.stop_processes()
+        
+        # Verify each line was logged at the level of its stream
+        self.assertIn('INFO:process_monitor:[test-server] hello', logs.output)
+        self.assertIn('ERROR:process_monitor:[test-server] oops', logs.output)
+        self.assertIn('INFO:process_monitor:[test-server] tail', logs.output)
+        self.assertFalse(monitor._output_selector.get_map())
+    
+    def test_output_without_newlines_is_bounded(self):
+        """Test that output without newlines is logged in pieces instead of buffered whole."""
+        # Create process monitor with a process that writes one long unterminated line
+        self.temp_config["mcpServers"]["test-server"] = {
+            "command": "sh",
+            "args": ["-c", "head -c 200000 /dev/zero | tr '\\0' a; sleep 0.5"],
+            "logOutput": True
+        }
+        with open(self.config_path, 'w') as f:
+            json.dump(self.temp_config, f)
+        monitor = ProcessMonitor(config_path=self.config_path)
+        
+        with self.assertLogs('process_monitor', level='INFO') as logs:
+            monitor.start_processes()
+            
+            # Pieces are logged while the process is still running
+            deadline = time.monotonic() + 5
+            while len([line for line in logs.output if '[test-server] aaa' in line]) < 3 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            pieces = [record.getMessage() for record in logs.records if record.getMessage().startswith('[test-server] a')]
+            self.assertEqual(len(pieces), 3)
+            self.assertTrue(monitor.processes['test-server']['process'].poll() is None)
+        monitor.stop_processes()
+        
+        # Verify each piece is bounded
+        for piece in pieces:
+            self.assertEqual(len(piece), len('[test-server] ') + MAX_LINE_SIZE)
+    
     def test_monitor_processes(self):
         """Test monitoring processes."""
-        # Create process monitor with short-lived process
+        # Create process monitor with processes that exit immediately
+        self._fake_spawn(returncode=0)
         monitor = ProcessMonitor(
             config_path=self.config_path,
             check_interval=0.1,
@@ -179,7 +825,7 @@ class TestProcessMonitor(unittest.TestCase):
         thread.start()
         
         # Wait for the process to exit and be restarted
-        time.sleep(0.5)
+        self.assertTrue(monitor._restart_event.wait(timeout=1.0))
         
         # Stop monitoring
         monitor.running = False
@@ -191,9 +837,78 @@ class TestProcessMonitor(unittest.TestCase):
         # Clean up
         monitor.stop_processes()
     
+    @unittest.skipUnless(hasattr(os, "pidfd_open"), "pidfd_open not available")
+    def test_monitor_wakes_on_exit(self):
+        """Test that a process exit wakes the monitor before the check interval."""
+        monitor = ProcessMonitor(
+            config_path=self.config_path,
+            check_interval=30,
+            max_restarts=1,
+            restart_delay=0
+        )
+        monitor.start_processes()
+        if monitor.processes['test-server']['pidfd'] is None:
+            monitor.stop_processes()
+            self.skipTest("pidfd_open not supported by the kernel")
+            
+        monitor.running = True
+        thread = threading.Thread(target=monitor.monitor_processes)
+        thread.daemon = True
+        thread.start()
+        
+        # The process exits after 0.1s; the restart must not wait for the 30s interval
+        deadline = time.monotonic() + 2
+        while monitor.restart_counts.get('test-server', 0) < 1 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertEqual(monitor.restart_counts.get('test-server', 0), 1)
+        
+        # Clean up
+        monitor.running = False
+        monitor.stop_processes()
+    
+    def test_restarts_do_not_block_monitor(self):
+        """Test that a pending restart delay does not hold up other restarts."""
+        # Create process monitor with two short-lived processes
+        self.temp_config["mcpServers"]["other-server"] = dict(self.temp_config["mcpServers"]["test-server"])
+        with open(self.config_path, 'w') as f:
+            json.dump(self.temp_config, f)
+        monitor = ProcessMonitor(
+            config_path=self.config_path,
+            check_interval=0.1,
+            max_restarts=1,
+            restart_delay=0.5
+        )
+        monitor.start_processes()
+        
+        restart_times = {}
+        start_process = monitor._start_process
+        def record_restart(server_name, server_config):
+            restart_times[server_name] = time.monotonic()
+            return start_process(server_name, server_config)
+        monitor._start_process = record_restart
+        
+        # Start monitoring in a separate thread
+        monitor.running = True
+        thread = threading.Thread(target=monitor.monitor_processes)
+        thread.daemon = True
+        thread.start()
+        
+        # Wait for both processes to exit and be restarted
+        deadline = time.monotonic() + 3
+        while len(restart_times) < 2 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        monitor.running = False
+        thread.join(timeout=1)
+        monitor.stop_processes()
+        
+        # Verify the restarts were delayed concurrently rather than one after another
+        self.assertEqual(set(restart_times), {'test-server', 'other-server'})
+        self.assertLess(abs(restart_times['test-server'] - restart_times['other-server']), 0.3)
+    
     def test_get_process_status(self):
         """Test getting process status."""
         # Create process monitor
+        self._fake_spawn()
         monitor = ProcessMonitor(config_path=self.config_path)
         
         # Start processes
@@ -212,6 +927,26 @@ class TestProcessMonitor(unittest.TestCase):
         # Clean up
         monitor.stop_processes()
     
+    @unittest.skipUnless(sys.platform.startswith('linux'), "requires /proc")
+    def test_resource_usage_from_proc(self):
+        """Test that per-process usage is read from /proc and sampled incrementally."""
+        # Create process monitor
+        monitor = ProcessMonitor(config_path=self.config_path)
+        process_info = {}
+        
+        with mock.patch('process_monitor.subprocess.check_output') as mock_check_output:
+            first = monitor.get_process_resource_usage(os.getpid(), process_info)
+            second = monitor.get_process_resource_usage(os.getpid(), process_info)
+            
+        # Verify usage was read without forking ps and the CPU sample was remembered
+        mock_check_output.assert_not_called()
+        self.assertIn('cpu_sample', process_info)
+        self.assertEqual(set(process_info), {'cpu_sample'})
+        for usage in (first, second):
+            self.assertGreaterEqual(usage['cpu_percent'], 0)
+            self.assertGreaterEqual(usage['memory_percent'], 0)
+            self.assertLessEqual(usage['memory_percent'], 100)
+    
     def test_graceful_shutdown(self):
         """Test graceful shutdown of processes."""
         # Create process monitor with longer-lived process
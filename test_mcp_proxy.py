@@ -6,11 +6,17 @@ Demonstrates how to interact with different types of MCP servers through HTTP en
 
 import json
 import time
-import requests
-import subprocess
-import threading
 from typing import Dict, Any
 
+# requests, subprocess and socket are imported where they are used, so the
+# --demo path does not pay for importing them
+
+# Number of endpoint requests issued concurrently
+ENDPOINT_TEST_WORKERS = 8
+PROXY_STARTUP_TIMEOUT = 60  # seconds to wait for the proxy to accept connections (MCP servers start first)
+PROXY_POLL_INTERVAL = 0.05  # seconds between readiness probes
+PROXY_STOP_TIMEOUT = 10  # seconds to wait for the proxy to exit before killing it
+
 # Test configuration with different server types
 TEST_CONFIG = {
     "mcpServers": {
@@ -54,20 +60,81 @@ TEST_CONFIG = {
     }
 }
 
+# The test configuration is constant, so encode it once
+_TEST_CONFIG_BYTES = json.dumps(TEST_CONFIG, indent=2).encode("utf-8")
+
 
 def test_proxy_endpoints():
     """
     Test the MCP proxy server endpoints.
     """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from concurrent.futures import ThreadPoolExecutor
+    
     base_url = "http://localhost:8000"
     
     print("🧪 Testing MCP Proxy Server Endpoints")
     print("=" * 50)
     
+    # Reuse keep-alive connections to the proxy, one per concurrent request
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=ENDPOINT_TEST_WORKERS) as executor:
+        session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=ENDPOINT_TEST_WORKERS))
+        _run_endpoint_tests(session, executor, base_url)
+
+
+def _run_endpoint_tests(session: "requests.Session", executor: "ThreadPoolExecutor", base_url: str):
+    """
+    Run the endpoint checks against the proxy.
+    
+    The requests are independent, so they are all issued concurrently up
+    front and their results are reported in the original order.
+    
+    Args:
+        session: HTTP session used for every request
+        executor: Executor the requests are issued on
+        base_url: Base URL of the proxy server
+    """
+    headers = {"Content-Type": "application/json"}
+    
+    # Example: Store a memory
+    memory_payload = {
+        "tool": "store_memory",
+        "arguments": {
+            "content": "This is a test memory stored via HTTP API",
+            "metadata": {
+                "source": "test_script",
+                "timestamp": time.time()
+            }
+        }
+    }
+    
+    # Example: Get current time
+    time_payload = {
+        "tool": "get_current_time",
+        "arguments": {}
+    }
+    
+    invalid_payload = {
+        "tool": "nonexistent_tool",
+        "arguments": {}
+    }
+    
+    responses = {
+        "info": executor.submit(session.get, f"{base_url}/"),
+        "status": executor.submit(session.get, f"{base_url}/status"),
+        "memory_tools": executor.submit(session.get, f"{base_url}/memory"),
+        "time_tools": executor.submit(session.get, f"{base_url}/time"),
+        "memory_call": executor.submit(session.post, f"{base_url}/memory", json=memory_payload, headers=headers),
+        "time_call": executor.submit(session.post, f"{base_url}/time", json=time_payload, headers=headers),
+        "nonexistent": executor.submit(session.get, f"{base_url}/nonexistent"),
+        "invalid_call": executor.submit(session.post, f"{base_url}/memory", json=invalid_payload, headers=headers)
+    }
+    
     # Test 1: Get server information
     print("\n1. Testing server information endpoint (GET /)")
     try:
-        response = requests.get(f"{base_url}/")
+        response = responses["info"].result()
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Server info: {json.dumps(data, indent=2)}")
@@ -79,7 +146,7 @@ def test_proxy_endpoints():
     # Test 2: Get server status
     print("\n2. Testing server status endpoint (GET /status)")
     try:
-        response = requests.get(f"{base_url}/status")
+        response = responses["status"].result()
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Server status: {json.dumps(data, indent=2)}")
@@ -91,7 +158,7 @@ def test_proxy_endpoints():
     # Test 3: List tools for memory server
     print("\n3. Testing tools listing for memory server (GET /memory)")
     try:
-        response = requests.get(f"{base_url}/memory")
+        response = responses["memory_tools"].result()
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Memory server tools: {json.dumps(data, indent=2)}")
@@ -103,7 +170,7 @@ def test_proxy_endpoints():
     # Test 4: List tools for time server
     print("\n4. Testing tools listing for time server (GET /time)")
     try:
-        response = requests.get(f"{base_url}/time")
+        response = responses["time_tools"].result()
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Time server tools: {json.dumps(data, indent=2)}")
@@ -115,24 +182,7 @@ def test_proxy_endpoints():
     # Test 5: Call a tool on the memory server
     print("\n5. Testing tool call on memory server (POST /memory)")
     try:
-        # Example: Store a memory
-        payload = {
-            "tool": "store_memory",
-            "arguments": {
-                "content": "This is a test memory stored via HTTP API",
-                "metadata": {
-                    "source": "test_script",
-                    "timestamp": time.time()
-                }
-            }
-        }
-        
-        response = requests.post(
-            f"{base_url}/memory",
-            json=payload,
-            headers={"Content-Type": "application/json"}
-        )
-        
+        response = responses["memory_call"].result()
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Memory tool call result: {json.dumps(data, indent=2)}")
@@ -144,18 +194,7 @@ def test_proxy_endpoints():
     # Test 6: Call a tool on the time server
     print("\n6. Testing tool call on time server (POST /time)")
     try:
-        # Example: Get current time
-        payload = {
-            "tool": "get_current_time",
-            "arguments": {}
-        }
-        
-        response = requests.post(
-            f"{base_url}/time",
-            json=payload,
-            headers={"Content-Type": "application/json"}
-        )
-        
+        response = responses["time_call"].result()
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Time tool call result: {json.dumps(data, indent=2)}")
@@ -167,7 +206,7 @@ def test_proxy_endpoints():
     # Test 7: Test error handling - non-existent server
     print("\n7. Testing error handling - non-existent server (GET /nonexistent)")
     try:
-        response = requests.get(f"{base_url}/nonexistent")
+        response = responses["nonexistent"].result()
         if response.status_code == 404:
             data = response.json()
             print(f"✅ Proper error handling: {json.dumps(data, indent=2)}")
@@ -179,16 +218,7 @@ def test_proxy_endpoints():
     # Test 8: Test error handling - invalid tool call
     print("\n8. Testing error handling - invalid tool call (POST /memory)")
     try:
-        payload = {
-            "tool": "nonexistent_tool",
-            "arguments": {}
-        }
-        
-        response = requests.post(
-            f"{base_url}/memory",
-            json=payload,
-            headers={"Content-Type": "application/json"}
-        )
+        response = responses["invalid_call"].result()
         
         if response.status_code >= 400:
             data = response.json()
@@ -203,8 +233,8 @@ def create_test_config():
     """
     Create a test configuration file.
     """
-    with open("test_config.json", "w") as f:
-        json.dump(TEST_CONFIG, f, indent=2)
+    with open("test_config.json", "wb") as f:
+        f.write(_TEST_CONFIG_BYTES)
     print("📝 Created test_config.json")
 
 
@@ -212,6 +242,8 @@ def run_proxy_server():
     """
     Run the MCP proxy server for testing.
     """
+    import subprocess
+    
     print("🚀 Starting MCP proxy server for testing...")
     
     # Create test config
@@ -225,17 +257,52 @@ def run_proxy_server():
         "--port", "8000"
     ])
     
-    # Wait a bit for the server to start
-    time.sleep(5)
-    
     try:
+        # Wait for the server to start accepting connections
+        if not wait_for_proxy(process, "localhost", 8000):
+            return
+            
         # Run tests
         test_proxy_endpoints()
     finally:
         # Stop the server
         print("\n🛑 Stopping MCP proxy server...")
         process.terminate()
-        process.wait()
+        try:
+            process.wait(timeout=PROXY_STOP_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def wait_for_proxy(process: "subprocess.Popen", host: str, port: int) -> bool:
+    """
+    Wait until the proxy server accepts connections.
+    
+    Args:
+        process: The proxy server process
+        host: Host the proxy listens on
+        port: Port the proxy listens on
+        
+    Returns:
+        True once the proxy is reachable, False if it exited or did not start in time
+    """
+    import socket
+    
+    deadline = time.monotonic() + PROXY_STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        # Fail fast if the server died during startup
+        if process.poll() is not None:
+            print(f"❌ MCP proxy server exited during startup with code {process.returncode}")
+            return False
+            
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            if sock.connect_ex((host, port)) == 0:
+                return True
+        time.sleep(PROXY_POLL_INTERVAL)
+        
+    print(f"❌ MCP proxy server did not start within {PROXY_STARTUP_TIMEOUT} seconds")
+    return False
 
 
 def demonstrate_usage():
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the MCP proxy server internals that do not need live MCP servers.
+"""
+
+import io
+import os
+import time
+import socket
+import unittest
+import threading
+import socketserver
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+from mcp_proxy import MCPServerManager, PooledTCPServer, _peek_envelope, _CommandChannel, _PipeReader, _RequestBatcher
+
+
+class TestPooledTCPServer(unittest.TestCase):
+    """Test cases for the pooled HTTP server."""
+    
+    def test_rejected_connections_do_not_block_accept(self):
+        """Test that shedding load answers each client without stalling the accept loop."""
+        started = threading.Event()
+        release = threading.Event()
+        
+        class BlockingHandler(socketserver.BaseRequestHandler):
+            def handle(self):
+                started.set()
+                release.wait(5)
+        
+        # Serve on one worker with room for one waiting connection
+        httpd = PooledTCPServer(('127.0.0.1', 0), BlockingHandler, max_workers=1, queue_size=1)
+        thread = threading.Thread(target=httpd.serve_forever)
+        thread.daemon = True
+        thread.start()
+        address = httpd.server_address
+        
+        clients = []
+        try:
+            # Occupy the worker, then fill the queue
+            clients.append(socket.create_connection(address, timeout=5))
+            self.assertTrue(started.wait(5))
+            clients.append(socket.create_connection(address, timeout=5))
+            
+            # Each further client is answered with a 503 even though earlier
+            # rejected clients keep their connections open
+            start = time.monotonic()
+            for _ in range(10):
+                client = socket.create_connection(address, timeout=5)
+                clients.append(client)
+                client.sendall(b"GET / HTTP/1.0\r\n\r\n")
+                response = b""
+                while True:
+                    data = client.recv(65536)
+                    if not data:
+                        break
+                    response += data
+                self.assertTrue(response.startswith(b"HTTP/1.0 503 "))
+            
+            # Verify rejections did not wait out the linger timeout one by one
+            self.assertLess(time.monotonic() - start, 0.5)
+        finally:
+            release.set()
+            for client in clients:
+                client.close()
+            httpd.shutdown()
+            httpd.server_close()
+
+
+class TestPeekEnvelope(unittest.TestCase):
+    """Test cases for reading JSON-RPC envelopes without parsing them."""
+    
+    CASES = [
+        # (description, frame, expected)
+        ("python sdk success", b'{"jsonrpc":"2.0","id":3,"result":{"tools":[]}}', (3, b'{"tools":[]}')),
+        ("typescript sdk success", b'{"result":{"tools":[]},"jsonrpc":"2.0","id":3}', (3, b'{"tools":[]}')),
+        ("trailing newline", b'{"jsonrpc":"2.0","id":3,"result":{}}\r\n', (3, b'{}')),
+        ("error response", b'{"jsonrpc":"2.0","id":4,"error":{"code":-32601,"message":"Method not found"}}', (4, None)),
+        ("server request", b'{"jsonrpc":"2.0","id":5,"method":"sampling/createMessage","params":{}}', None),
+        ("server ping", b'{"jsonrpc":"2.0","id":6,"method":"ping"}', None),
+        ("notification", b'{"jsonrpc":"2.0","method":"notifications/progress","params":{"progress":1}}', None),
+        ("reordered keys", b'{"id":3,"jsonrpc":"2.0","result":{}}', None),
+        ("reordered error", b'{"jsonrpc":"2.0","error":{"code":-1,"message":"x"},"id":3}', None),
+        ("string id", b'{"jsonrpc":"2.0","id":"abc","result":{}}', None),
+        ("nested id in result", b'{"jsonrpc":"2.0","id":3,"result":{"id":9}}', (3, b'{"id":9}')),
+        ("nested envelope in typescript result",
+         b'{"result":{"a":1,"jsonrpc":"2.0","id":7},"jsonrpc":"2.0","id":3}',
+         (3, b'{"a":1,"jsonrpc":"2.0","id":7}')),
+        ("nested id without envelope id", b'{"result":{"jsonrpc":"2.0","id":7}}', None),
+        ("batch response", b'[{"jsonrpc":"2.0","id":1,"result":{}}]', None),
+        ("not json", b'Server started on stdio', None),
+    ]
+    
+    def test_peek_envelope(self):
+        """Test envelope peeking across response, request and malformed frames."""
+        for description, frame, expected in self.CASES:
+            with self.subTest(description):
+                self.assertEqual(_peek_envelope(frame), expected)
+
+
+class TestCommandChannel(unittest.TestCase):
+    """Test cases for routing command server output to waiting requests."""
+    
+    def setUp(self):
+        """Set up a channel on a fake process that records what is written to it."""
+        self.process = mock.Mock()
+        self.process.stdin = io.BytesIO()
+        self.channel = _CommandChannel("test-server", self.process, timeout=5)
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        
+    def tearDown(self):
+        """Fail any request still waiting and stop the callers."""
+        self.channel.close()
+        self.executor.shutdown(wait=True)
+        
+    def _exchange(self, *payloads):
+        """Start exchanges on other threads and wait until each has been written."""
+        futures = []
+        for payload in payloads:
+            futures.append(self.executor.submit(self.channel.exchange, payload))
+            requests = payload if isinstance(payload, list) else [payload]
+            deadline = time.monotonic() + 5
+            while not all(request["id"] in self.channel._pending for request in requests):
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.001)
+        return futures
+        
+    def test_routing(self):
+        """Test that each frame resolves only the request whose id it answers."""
+        cases = [
+            # (description, frames fed, expected response)
+            ("compact success", [b'{"jsonrpc":"2.0","id":1,"result":{"ok":true}}\n'],
+             b'{"jsonrpc":"2.0","id":1,"result":{"ok":true}}'),
+            ("compact error", [b'{"jsonrpc":"2.0","id":1,"error":{"code":-1,"message":"x"}}\n'],
+             b'{"jsonrpc":"2.0","id":1,"error":{"code":-1,"message":"x"}}'),
+            ("reordered keys", [b'{"id":1,"result":{"ok":true},"jsonrpc":"2.0"}\n'],
+             {"id": 1, "result": {"ok": True}, "jsonrpc": "2.0"}),
+            ("server request with the same id",
+             [b'{"jsonrpc":"2.0","id":1,"method":"ping"}\n', b'{"jsonrpc":"2.0","id":1,"result":{}}\n'],
+             b'{"jsonrpc":"2.0","id":1,"result":{}}'),
+            ("reordered server request",
+             [b'{"method":"roots/list","id":1,"jsonrpc":"2.0"}\n', b'{"jsonrpc":"2.0","id":1,"result":{}}\n'],
+             b'{"jsonrpc":"2.0","id":1,"result":{}}'),
+            ("notification and log output first",
+             [b'starting up\n{"jsonrpc":"2.0","method":"notifications/message","params":{}}\n',
+              b'{"jsonrpc":"2.0","id":1,"result":{}}\n'],
+             b'{"jsonrpc":"2.0","id":1,"result":{}}'),
+            ("split across reads", [b'{"jsonrpc":"2.0",', b'"id":1,"result":{}}', b'\n'],
+             b'{"jsonrpc":"2.0","id":1,"result":{}}'),
+        ]
+        for description, frames, expected in cases:
+            with self.subTest(description):
+                future, = self._exchange({"jsonrpc": "2.0", "id": 1, "method": "tools/list"})
+                for frame in frames:
+                    self.channel.feed(frame)
+                self.assertEqual(future.result(timeout=5), expected)
+                self.assertEqual(self.channel._pending, {})
+                
+    def test_out_of_order_responses(self):
+        """Test that concurrent requests each receive their own response."""
+        first, second = self._exchange(
+            {"jsonrpc": "2.0", "id": 1, "method": "tools/call"},
+            {"jsonrpc": "2.0", "id": 2, "method": "tools/call"},
+        )
+        self.channel.feed(b'{"jsonrpc":"2.0","id":2,"result":"two"}\n{"jsonrpc":"2.0","id":1,"result":"one"}\n')
+        self.assertEqual(first.result(timeout=5), b'{"jsonrpc":"2.0","id":1,"result":"one"}')
+        self.assertEqual(second.result(timeout=5), b'{"jsonrpc":"2.0","id":2,"result":"two"}')
+        
+    def test_batch_response(self):
+        """Test that a batch response resolves every request in the batch at once."""
+        future, = self._exchange([
+            {"jsonrpc": "2.0", "id": 1, "method": "tools/call"},
+            {"jsonrpc": "2.0", "id": 2, "method": "tools/call"},
+        ])
+        self.channel.feed(b'[{"jsonrpc":"2.0","id":2,"result":{}},{"jsonrpc":"2.0","id":1,"result":{}}]\n')
+        self.assertEqual(len(future.result(timeout=5)), 2)
+        self.assertEqual(self.channel._pending, {})
+        
+    def test_close_fails_pending_requests(self):
+        """Test that requests waiting when the process exits fail instead of hanging."""
+        future, = self._exchange({"jsonrpc": "2.0", "id": 1, "method": "tools/list"})
+        self.channel.close()
+        with self.assertRaises(Exception):
+            future.result(timeout=5)
+        with self.assertRaises(Exception):
+            self.channel.exchange({"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+
+
+class TestPipeReader(unittest.TestCase):
+    """Test cases for the shared command server output reader."""
+    
+    def test_feeds_and_closes_channels(self):
+        """Test that output reaches the right channel and EOF closes it."""
+        class RecordingChannel:
+            def __init__(self):
+                self.fd, self.write_fd = os.pipe()
+                self.data = b""
+                self.closed = threading.Event()
+                
+            def fileno(self):
+                return self.fd
+                
+            def feed(self, chunk):
+                self.data += chunk
+                
+            def close(self):
+                os.close(self.fd)
+                self.closed.set()
+                
+        reader = _PipeReader()
+        channels = [RecordingChannel(), RecordingChannel()]
+        for channel in channels:
+            reader.register(channel)
+            
+        os.write(channels[0].write_fd, b"first\n")
+        os.write(channels[1].write_fd, b"second\n")
+        for channel in channels:
+            os.close(channel.write_fd)
+            self.assertTrue(channel.closed.wait(5))
+            
+        self.assertEqual(channels[0].data, b"first\n")
+        self.assertEqual(channels[1].data, b"second\n")
+
+
+class TestRequestBatcher(unittest.TestCase):
+    """Test cases for coalescing concurrent requests into batches."""
+    
+    def test_concurrent_requests_share_a_batch(self):
+        """Test that requests arriving within the window are sent together."""
+        sent = []
+        
+        def send(payload):
+            sent.append(payload)
+            return [{"jsonrpc": "2.0", "id": request["id"], "result": request["id"]} for request in reversed(payload)]
+            
+        batcher = _RequestBatcher(send, window=0.2)
+        requests = [{"jsonrpc": "2.0", "id": request_id, "method": "tools/call"} for request_id in range(3)]
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            responses = list(executor.map(batcher.submit, requests))
+            
+        self.assertEqual(len(sent), 1)
+        self.assertEqual([response["result"] for response in responses], [0, 1, 2])
+        
+    def test_single_request_is_sent_alone(self):
+        """Test that a request without company is not wrapped in a batch array."""
+        send = mock.Mock(return_value={"jsonrpc": "2.0", "id": 1, "result": {}})
+        batcher = _RequestBatcher(send, window=0)
+        request = {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+        
+        self.assertEqual(batcher.submit(request), {"jsonrpc": "2.0", "id": 1, "result": {}})
+        send.assert_called_once_with(request)
+        
+    def test_batch_failures(self):
+        """Test that missing responses and send errors fail the affected requests."""
+        cases = [
+            # (description, send side effect, expected errors for ids 0 and 1)
+            ("missing response", lambda payload: [{"jsonrpc": "2.0", "id": 0, "result": {}}], [None, "No response"]),
+            ("not a batch", lambda payload: {"jsonrpc": "2.0", "id": 0, "result": {}}, ["Expected a batch", "Expected a batch"]),
+            ("send error", mock.Mock(side_effect=Exception("broken pipe")), ["broken pipe", "broken pipe"]),
+        ]
+        for description, send, expected in cases:
+            with self.subTest(description):
+                batcher = _RequestBatcher(send, window=0.2)
+                requests = [{"jsonrpc": "2.0", "id": request_id, "method": "tools/call"} for request_id in range(2)]
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    futures = [executor.submit(batcher.submit, request) for request in requests]
+                    for future, error in zip(futures, expected):
+                        if error is None:
+                            self.assertEqual(future.result(timeout=5)["id"], 0)
+                        else:
+                            with self.assertRaisesRegex(Exception, error):
+                                future.result(timeout=5)
+
+
+class TestCommandServerEnv(unittest.TestCase):
+    """Test cases for building a command server's environment."""
+    
+    def test_env_references(self):
+        """Test that only values consisting of a single ${VAR} reference are substituted."""
+        cases = [
+            # (description, configured value, expected value)
+            ("whole reference", "${API_KEY}", "secret"),
+            ("trailing newline", "${API_KEY}\n", "${API_KEY}\n"),
+            ("embedded reference", "Bearer ${API_KEY}", "Bearer ${API_KEY}"),
+            ("two references", "${API_KEY}${API_KEY}", "${API_KEY}${API_KEY}"),
+            ("missing variable", "${MISSING}", "${MISSING}"),
+            ("non-string value", 8080, "8080"),
+        ]
+        for description, value, expected in cases:
+            with self.subTest(description):
+                manager = MCPServerManager({"mcpServers": {}})
+                with mock.patch('mcp_proxy.subprocess.Popen') as mock_popen, \
+                        mock.patch.object(manager, '_pipe_reader'):
+                    manager._start_command_server(
+                        "test-server",
+                        {"command": "test", "env": {"VALUE": value}},
+                        base_env={"API_KEY": "secret"},
+                    )
+                self.assertEqual(mock_popen.call_args.kwargs["env"]["VALUE"], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()